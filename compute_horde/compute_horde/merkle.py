@@ -0,0 +1,61 @@
+"""
+Merkle trees over byte strings, so that many messages can be covered by a single signature
+of the root, with an inclusion proof for each message.
+"""
+
+import hashlib
+
+# leaves and inner nodes are hashed with different prefixes, so that an inner node
+# can't be passed off as a leaf
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+def _hash_leaf(leaf: bytes) -> bytes:
+    return hashlib.sha256(_LEAF_PREFIX + leaf).digest()
+
+
+def _hash_node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE_PREFIX + left + right).digest()
+
+
+def build_merkle_tree(leaves: list[bytes]) -> tuple[bytes, list[list[bytes]]]:
+    """
+    Root of the tree over `leaves`, and the inclusion proof of each leaf: the hashes of
+    its siblings, from the bottom of the tree up. The last node of a level with an odd number
+    of nodes is paired with itself.
+    """
+    if not leaves:
+        raise ValueError("Merkle tree needs at least one leaf")
+
+    level = [_hash_leaf(leaf) for leaf in leaves]
+    proofs: list[list[bytes]] = [[] for _ in leaves]
+    # position of the ancestor of each leaf in the current level
+    positions = list(range(len(leaves)))
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        for leaf_index, position in enumerate(positions):
+            proofs[leaf_index].append(level[position ^ 1])
+            positions[leaf_index] = position // 2
+        level = [_hash_node(level[i], level[i + 1]) for i in range(0, len(level), 2)]
+
+    return level[0], proofs
+
+
+def get_merkle_root(leaf: bytes, index: int, proof: list[bytes]) -> bytes:
+    """
+    Root of the tree in which `leaf` is at `index`, according to the inclusion `proof` of the
+    leaf. Compare it to the expected root to verify the proof.
+    """
+    if not 0 <= index < 2 ** len(proof):
+        raise ValueError(f"Leaf index {index} out of a tree of height {len(proof)}")
+
+    node = _hash_leaf(leaf)
+    for sibling in proof:
+        if index % 2:
+            node = _hash_node(sibling, node)
+        else:
+            node = _hash_node(node, sibling)
+        index //= 2
+    return node
@@ -2,17 +2,25 @@ import contextlib
 import csv
 import datetime
 import enum
+import functools
 import io
 import logging
 import shutil
 import tempfile
+from collections.abc import Iterable, Iterator
+from typing import Any
 
 import bittensor
 import pydantic
 import requests
 
 from .executor_class import ExecutorClass
-from .mv_protocol.validator_requests import JobFinishedReceiptPayload, JobStartedReceiptPayload
+from .merkle import build_merkle_tree, get_merkle_root
+from .mv_protocol.validator_requests import (
+    JobFinishedReceiptPayload,
+    JobStartedReceiptPayload,
+    ReceiptPayload,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,20 +36,201 @@ class Receipt(pydantic.BaseModel):
     miner_signature: str
 
     def verify_miner_signature(self):
-        miner_keypair = bittensor.Keypair(ss58_address=self.payload.miner_hotkey)
+        miner_keypair = _get_keypair(self.payload.miner_hotkey)
         return miner_keypair.verify(self.payload.blob_for_signing(), self.miner_signature)
 
     def verify_validator_signature(self):
-        validator_keypair = bittensor.Keypair(ss58_address=self.payload.validator_hotkey)
-        return validator_keypair.verify(self.payload.blob_for_signing(), self.validator_signature)
+        return verify_validator_signature(self.payload, self.validator_signature)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_keypair(ss58_address: str) -> bittensor.Keypair:
+    return bittensor.Keypair(ss58_address=ss58_address)
+
+
+# validator signature of a receipt signed in a batch:
+# "merkle:<signature of the root>:<index of the receipt>:<comma separated hashes of the proof>"
+BATCH_SIGNATURE_PREFIX = "merkle:"
+
+
+def _get_merkle_root_blob(root: bytes) -> str:
+    return f"receipts-merkle-root:{root.hex()}"
+
+
+def sign_receipts_batch(keypair: bittensor.Keypair, payloads: list[ReceiptPayload]) -> list[str]:
+    """
+    Validator signatures of `payloads`, all sharing a single signature of the Merkle root of
+    the payloads. Each signature carries the inclusion proof of its payload, so that it can be
+    verified without the other payloads.
+    """
+    root, proofs = build_merkle_tree([payload.blob_for_signing().encode() for payload in payloads])
+    root_signature = f"0x{keypair.sign(_get_merkle_root_blob(root)).hex()}"
+    return [
+        f"{BATCH_SIGNATURE_PREFIX}{root_signature}:{index}:{','.join(h.hex() for h in proof)}"
+        for index, proof in enumerate(proofs)
+    ]
+
+
+@functools.lru_cache(maxsize=1024)
+def _verify_merkle_root_signature(ss58_address: str, root: bytes, signature: str) -> bool:
+    return _get_keypair(ss58_address).verify(_get_merkle_root_blob(root), signature)
+
+
+def verify_validator_signature(payload: ReceiptPayload, signature: str) -> bool:
+    """
+    Verify the validator signature of a receipt, signed on its own or in a batch.
+    The signature of the root of a batch is verified only once for all its receipts.
+    """
+    if not signature.startswith(BATCH_SIGNATURE_PREFIX):
+        validator_keypair = _get_keypair(payload.validator_hotkey)
+        return validator_keypair.verify(payload.blob_for_signing(), signature)
+
+    try:
+        root_signature, index, proof = signature.removeprefix(BATCH_SIGNATURE_PREFIX).split(":")
+        root = get_merkle_root(
+            payload.blob_for_signing().encode(),
+            int(index),
+            [bytes.fromhex(node) for node in proof.split(",") if node],
+        )
+    except ValueError:
+        return False
+    return _verify_merkle_root_signature(payload.validator_hotkey, root, root_signature)
 
 
 class ReceiptFetchError(Exception):
     pass
 
 
-def get_miner_receipts(hotkey: str, ip: str, port: int) -> list[Receipt]:
-    """Get receipts from a given miner"""
+RECEIPTS_API_PATH = "/api/v1/receipts"
+RECEIPTS_API_PAGE_SIZE = 1000
+
+# miners publish receipts in append-only files, one per this period
+RECEIPTS_PARTITION_PERIOD = datetime.timedelta(hours=1)
+
+
+def get_receipts_partition_start(timestamp: datetime.datetime) -> datetime.datetime:
+    """Start of the partition in which receipts published at `timestamp` are."""
+    return timestamp.astimezone(datetime.UTC).replace(minute=0, second=0, microsecond=0)
+
+
+def get_receipts_partition_name(timestamp: datetime.datetime) -> str:
+    """Name of the file with the receipts published at `timestamp`."""
+    return f"receipts-{get_receipts_partition_start(timestamp):%Y-%m-%d-%H}.csv"
+
+
+def parse_receipt(raw_receipt: dict[str, Any]) -> Receipt:
+    """
+    Parse a row of the receipts CSV served by miners.
+    Raises KeyError, ValueError or pydantic.ValidationError for an invalid row.
+    """
+    receipt_type = ReceiptType(raw_receipt["type"])
+    match receipt_type:
+        case ReceiptType.JobStartedReceipt:
+            payload = JobStartedReceiptPayload(
+                job_uuid=raw_receipt["job_uuid"],
+                miner_hotkey=raw_receipt["miner_hotkey"],
+                validator_hotkey=raw_receipt["validator_hotkey"],
+                executor_class=ExecutorClass(raw_receipt["executor_class"]),
+                time_accepted=datetime.datetime.fromisoformat(raw_receipt["time_accepted"]),
+                max_timeout=int(raw_receipt["max_timeout"]),
+            )
+
+        case ReceiptType.JobFinishedReceipt:
+            payload = JobFinishedReceiptPayload(
+                job_uuid=raw_receipt["job_uuid"],
+                miner_hotkey=raw_receipt["miner_hotkey"],
+                validator_hotkey=raw_receipt["validator_hotkey"],
+                time_started=datetime.datetime.fromisoformat(raw_receipt["time_started"]),
+                time_took_us=int(raw_receipt["time_took_us"]),
+                score_str=raw_receipt["score_str"],
+            )
+
+    return Receipt(
+        payload=payload,
+        validator_signature=raw_receipt["validator_signature"],
+        miner_signature=raw_receipt["miner_signature"],
+    )
+
+
+def verify_receipts(receipts: list[Receipt]) -> list[Receipt]:
+    """
+    Return the receipts with valid miner and validator signatures.
+    """
+    valid_receipts = []
+    for receipt in receipts:
+        if not receipt.verify_miner_signature():
+            logger.warning(f"Invalid miner signature of receipt {receipt=}")
+            continue
+
+        if not receipt.verify_validator_signature():
+            logger.warning(f"Invalid validator signature of receipt {receipt=}")
+            continue
+
+        valid_receipts.append(receipt)
+
+    return valid_receipts
+
+
+def receipt_to_dict(receipt: Receipt) -> dict[str, Any]:
+    """
+    Flat representation of a receipt, as served by miners. `parse_receipt` parses it back.
+    """
+    match receipt.payload:
+        case JobStartedReceiptPayload():
+            receipt_type = ReceiptType.JobStartedReceipt
+        case JobFinishedReceiptPayload():
+            receipt_type = ReceiptType.JobFinishedReceipt
+    return {
+        "type": receipt_type.value,
+        "validator_signature": receipt.validator_signature,
+        "miner_signature": receipt.miner_signature,
+        **receipt.payload.model_dump(mode="json"),
+    }
+
+
+def _get_receipt_timestamp(receipt: Receipt) -> datetime.datetime:
+    match receipt.payload:
+        case JobStartedReceiptPayload():
+            return receipt.payload.time_accepted
+        case JobFinishedReceiptPayload():
+            return receipt.payload.time_started
+
+
+def _get_miner_receipts_from_api(
+    ip: str,
+    port: int,
+    validator_hotkey: str | None,
+    since: datetime.datetime | None,
+) -> list[dict[str, Any]] | None:
+    """
+    Get raw receipts from the paginated receipts API of a miner, None if the miner doesn't have it.
+    """
+    url = f"http://{ip}:{port}{RECEIPTS_API_PATH}"
+    params: dict[str, Any] = {"limit": RECEIPTS_API_PAGE_SIZE}
+    if validator_hotkey is not None:
+        params["validator_hotkey"] = validator_hotkey
+    if since is not None:
+        params["since"] = since.isoformat()
+
+    raw_receipts = []
+    with requests.Session() as session:
+        while True:
+            try:
+                response = session.get(url, params=params, timeout=5)
+                if response.status_code == 404:
+                    return None
+                response.raise_for_status()
+                page = response.json()
+            except (requests.RequestException, ValueError) as e:
+                raise ReceiptFetchError("failed to get receipts from miner") from e
+
+            raw_receipts += page["receipts"]
+            if not page.get("next_cursor"):
+                return raw_receipts
+            params["cursor"] = page["next_cursor"]
+
+
+def _get_miner_receipts_from_csv(ip: str, port: int) -> Iterator[dict[str, str]]:
     with contextlib.ExitStack() as exit_stack:
         try:
             receipts_url = f"http://{ip}:{port}/receipts/receipts.csv"
@@ -54,59 +243,49 @@ def get_miner_receipts(hotkey: str, ip: str, port: int) -> list[Receipt]:
         shutil.copyfileobj(response.raw, temp_file)
         temp_file.seek(0)
 
-        receipts = []
         wrapper = io.TextIOWrapper(temp_file)
-        csv_reader = csv.DictReader(wrapper)
-        for raw_receipt in csv_reader:
-            try:
-                receipt_type = ReceiptType(raw_receipt["type"])
-                match receipt_type:
-                    case ReceiptType.JobStartedReceipt:
-                        payload = JobStartedReceiptPayload(
-                            job_uuid=raw_receipt["job_uuid"],
-                            miner_hotkey=raw_receipt["miner_hotkey"],
-                            validator_hotkey=raw_receipt["validator_hotkey"],
-                            executor_class=ExecutorClass(raw_receipt["executor_class"]),
-                            time_accepted=datetime.datetime.fromisoformat(
-                                raw_receipt["time_accepted"]
-                            ),
-                            max_timeout=int(raw_receipt["max_timeout"]),
-                        )
-
-                    case ReceiptType.JobFinishedReceipt:
-                        payload = JobFinishedReceiptPayload(
-                            job_uuid=raw_receipt["job_uuid"],
-                            miner_hotkey=raw_receipt["miner_hotkey"],
-                            validator_hotkey=raw_receipt["validator_hotkey"],
-                            time_started=datetime.datetime.fromisoformat(
-                                raw_receipt["time_started"]
-                            ),
-                            time_took_us=int(raw_receipt["time_took_us"]),
-                            score_str=raw_receipt["score_str"],
-                        )
-
-                receipt = Receipt(
-                    payload=payload,
-                    validator_signature=raw_receipt["validator_signature"],
-                    miner_signature=raw_receipt["miner_signature"],
-                )
-
-            except (KeyError, ValueError, pydantic.ValidationError):
-                logger.warning(f"Miner sent invalid receipt {raw_receipt=}")
-                continue
-
-            if receipt.payload.miner_hotkey != hotkey:
-                logger.warning(f"Miner sent receipt of a different miner {receipt=}")
-                continue
-
-            if not receipt.verify_miner_signature():
-                logger.warning(f"Invalid miner signature of receipt {receipt=}")
-                continue
-
-            if not receipt.verify_validator_signature():
-                logger.warning(f"Invalid validator signature of receipt {receipt=}")
-                continue
-
-            receipts.append(receipt)
-
-        return receipts
+        yield from csv.DictReader(wrapper)
+
+
+def get_miner_receipts(
+    hotkey: str,
+    ip: str,
+    port: int,
+    *,
+    validator_hotkey: str | None = None,
+    since: datetime.datetime | None = None,
+) -> list[Receipt]:
+    """
+    Get receipts from a given miner.
+
+    With `validator_hotkey` or `since`, only the receipts of that validator, or given at or after
+    that time, are requested from the miner's receipts API. Miners without it serve the full CSV,
+    which is then filtered here.
+    """
+    raw_receipts: Iterable[dict[str, Any]] | None = None
+    if validator_hotkey is not None or since is not None:
+        raw_receipts = _get_miner_receipts_from_api(ip, port, validator_hotkey, since)
+    if raw_receipts is None:
+        raw_receipts = _get_miner_receipts_from_csv(ip, port)
+
+    receipts = []
+    for raw_receipt in raw_receipts:
+        try:
+            receipt = parse_receipt(raw_receipt)
+        except (KeyError, ValueError, pydantic.ValidationError):
+            logger.warning(f"Miner sent invalid receipt {raw_receipt=}")
+            continue
+
+        if receipt.payload.miner_hotkey != hotkey:
+            logger.warning(f"Miner sent receipt of a different miner {receipt=}")
+            continue
+
+        if validator_hotkey is not None and receipt.payload.validator_hotkey != validator_hotkey:
+            continue
+
+        if since is not None and _get_receipt_timestamp(receipt) < since:
+            continue
+
+        receipts.append(receipt)
+
+    return verify_receipts(receipts)
@@ -0,0 +1,34 @@
+import pytest
+
+from compute_horde.merkle import build_merkle_tree, get_merkle_root
+
+
+@pytest.mark.parametrize("leaf_count", [1, 2, 3, 5, 8, 13])
+def test__build_merkle_tree__proofs(leaf_count):
+    leaves = [f"leaf {i}".encode() for i in range(leaf_count)]
+    root, proofs = build_merkle_tree(leaves)
+
+    assert len(proofs) == leaf_count
+    for index, (leaf, proof) in enumerate(zip(leaves, proofs)):
+        assert get_merkle_root(leaf, index, proof) == root
+        assert get_merkle_root(b"other leaf", index, proof) != root
+        # an unpaired last leaf is its own sibling, so its side doesn't matter
+        if leaf_count % 2 == 0:
+            assert get_merkle_root(leaf, index ^ 1, proof) != root
+
+
+def test__build_merkle_tree__root_depends_on_all_leaves():
+    root, _ = build_merkle_tree([b"a", b"b", b"c"])
+    assert build_merkle_tree([b"a", b"b", b"x"])[0] != root
+    assert build_merkle_tree([b"b", b"a", b"c"])[0] != root
+
+
+def test__build_merkle_tree__no_leaves():
+    with pytest.raises(ValueError):
+        build_merkle_tree([])
+
+
+def test__get_merkle_root__index_out_of_tree():
+    _, proofs = build_merkle_tree([b"a", b"b"])
+    with pytest.raises(ValueError):
+        get_merkle_root(b"a", 2, proofs[0])
@@ -1,16 +1,29 @@
 import csv
+import datetime
 import io
 
 import pytest
+from responses import matchers
 
 from compute_horde.mv_protocol.validator_requests import (
     JobFinishedReceiptPayload,
     JobStartedReceiptPayload,
 )
-from compute_horde.receipts import Receipt, ReceiptFetchError, ReceiptType, get_miner_receipts
+from compute_horde.receipts import (
+    Receipt,
+    ReceiptFetchError,
+    ReceiptType,
+    get_miner_receipts,
+    get_receipts_partition_name,
+    receipt_to_dict,
+    sign_receipts_batch,
+    verify_validator_signature,
+)
 
+SINCE = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
 
-def receipts_helper(mocked_responses, receipts: list[Receipt], miner_keypair):
+
+def receipts_csv(receipts: list[Receipt]) -> str:
     payload_fields = set()
     for payload_cls in [JobStartedReceiptPayload, JobFinishedReceiptPayload]:
         payload_fields |= set(payload_cls.model_fields.keys())
@@ -41,8 +54,11 @@ def receipts_helper(mocked_responses, receipts: list[Receipt], miner_keypair):
             | receipt.payload.model_dump()
         )
         csv_writer.writerow(row)
+    return buf.getvalue()
+
 
-    mocked_responses.get("http://127.0.0.1:8000/receipts/receipts.csv", body=buf.getvalue())
+def receipts_helper(mocked_responses, receipts: list[Receipt], miner_keypair):
+    mocked_responses.get("http://127.0.0.1:8000/receipts/receipts.csv", body=receipts_csv(receipts))
     return get_miner_receipts(miner_keypair.ss58_address, "127.0.0.1", 8000)
 
 
@@ -105,3 +121,75 @@ def test__get_miner_receipts__no_receipts(mocked_responses, miner_keypair):
 
     with pytest.raises(ReceiptFetchError):
         get_miner_receipts(miner_keypair.ss58_address, "127.0.0.1", 8001)
+
+
+def test__get_receipts_partition_name():
+    timestamp = datetime.datetime(2024, 1, 2, 1, 55, 12, tzinfo=datetime.UTC)
+    assert get_receipts_partition_name(timestamp) == "receipts-2024-01-02-01.csv"
+
+    other_timezone = datetime.timezone(datetime.timedelta(hours=2))
+    assert get_receipts_partition_name(timestamp.astimezone(other_timezone)) == (
+        "receipts-2024-01-02-01.csv"
+    )
+
+
+def test__get_miner_receipts__api_pagination(mocked_responses, receipts, miner_keypair):
+    url = "http://127.0.0.1:8000/api/v1/receipts"
+    mocked_responses.get(
+        url,
+        json={"receipts": [receipt_to_dict(receipts[0])], "next_cursor": "abc"},
+        match=[matchers.query_param_matcher({"limit": "1000", "since": SINCE.isoformat()})],
+    )
+    mocked_responses.get(
+        url,
+        json={"receipts": [receipt_to_dict(receipts[1])], "next_cursor": None},
+        match=[
+            matchers.query_param_matcher(
+                {"limit": "1000", "since": SINCE.isoformat(), "cursor": "abc"}
+            )
+        ],
+    )
+
+    got_receipts = get_miner_receipts(miner_keypair.ss58_address, "127.0.0.1", 8000, since=SINCE)
+    assert got_receipts == receipts
+
+
+def test__get_miner_receipts__api_missing(mocked_responses, receipts, miner_keypair):
+    mocked_responses.get("http://127.0.0.1:8000/api/v1/receipts", status=404)
+    # falls back to the full CSV, filtered locally
+    since = receipts[1].payload.time_started
+    mocked_responses.get("http://127.0.0.1:8000/receipts/receipts.csv", body=receipts_csv(receipts))
+
+    got_receipts = get_miner_receipts(miner_keypair.ss58_address, "127.0.0.1", 8000, since=since)
+    assert got_receipts == [receipts[1]]
+
+
+def test__sign_receipts_batch(receipts, validator_keypair, miner_keypair):
+    payloads = [receipt.payload for receipt in receipts]
+    signatures = sign_receipts_batch(validator_keypair, payloads)
+
+    assert len(signatures) == 2
+    for payload, signature in zip(payloads, signatures):
+        assert verify_validator_signature(payload, signature)
+    # a proof is only valid for its own payload
+    assert not verify_validator_signature(payloads[0], signatures[1])
+    assert not verify_validator_signature(payloads[0], "merkle:0x00:nonsense:")
+
+    # the root has to be signed by the validator of the receipt
+    forged_signatures = sign_receipts_batch(miner_keypair, payloads)
+    assert not verify_validator_signature(payloads[0], forged_signatures[0])
+
+
+def test__get_miner_receipts__batch_signatures(
+    mocked_responses, receipts, validator_keypair, miner_keypair
+):
+    signatures = sign_receipts_batch(validator_keypair, [receipt.payload for receipt in receipts])
+    for receipt, signature in zip(receipts, signatures):
+        receipt.validator_signature = signature
+    receipts[1].payload.score_str = "3.00"
+    receipts[
+        1
+    ].miner_signature = f"0x{miner_keypair.sign(receipts[1].payload.blob_for_signing()).hex()}"
+
+    # the second receipt was changed after the batch was signed
+    receipts_one_skipped_helper(mocked_responses, receipts, miner_keypair)
@@ -1,8 +1,9 @@
 from django.core.management import BaseCommand
 
-from compute_horde_miner.miner.tasks import prepare_receipts
+from compute_horde_miner.miner.tasks import prepare_receipts, prepare_receipts_csv
 
 
 class Command(BaseCommand):
     def handle(self, *args, **options):
         prepare_receipts()
+        prepare_receipts_csv()
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.15 on 2026-10-17 08:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("miner", "0008_jobstartedreceipt_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobfinishedreceipt",
+            name="published",
+            field=models.BooleanField(
+                default=False, help_text="Whether the receipt was appended to a receipts partition"
+            ),
+        ),
+        migrations.AddField(
+            model_name="jobstartedreceipt",
+            name="published",
+            field=models.BooleanField(
+                default=False, help_text="Whether the receipt was appended to a receipts partition"
+            ),
+        ),
+    ]
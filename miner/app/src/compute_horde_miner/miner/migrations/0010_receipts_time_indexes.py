@@ -0,0 +1,24 @@
+# Generated by Django 4.2.15 on 2026-10-17 08:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("miner", "0009_receipts_published"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="jobfinishedreceipt",
+            index=models.Index(
+                fields=["time_started", "id"], name="miner_jobfi_time_st_19551f_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobstartedreceipt",
+            index=models.Index(
+                fields=["time_accepted", "id"], name="miner_jobst_time_ac_bdcfc6_idx"
+            ),
+        ),
+    ]
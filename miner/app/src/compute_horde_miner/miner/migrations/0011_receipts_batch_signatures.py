@@ -0,0 +1,22 @@
+# Generated by Django 4.2.15 on 2026-10-17 08:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("miner", "0010_receipts_time_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="jobfinishedreceipt",
+            name="validator_signature",
+            field=models.TextField(),
+        ),
+        migrations.AlterField(
+            model_name="jobstartedreceipt",
+            name="validator_signature",
+            field=models.TextField(),
+        ),
+    ]
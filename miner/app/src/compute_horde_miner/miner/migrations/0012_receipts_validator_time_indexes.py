@@ -0,0 +1,26 @@
+# Generated by Django 4.2.15 on 2026-10-17 09:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("miner", "0011_receipts_batch_signatures"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="jobfinishedreceipt",
+            index=models.Index(
+                fields=["validator_hotkey", "time_started", "id"],
+                name="miner_jobfi_validat_b23151_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobstartedreceipt",
+            index=models.Index(
+                fields=["validator_hotkey", "time_accepted", "id"],
+                name="miner_jobst_validat_e793a0_idx",
+            ),
+        ),
+    ]
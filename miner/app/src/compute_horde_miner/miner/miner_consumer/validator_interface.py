@@ -6,6 +6,7 @@ import uuid
 import bittensor
 from compute_horde.mv_protocol import miner_requests, validator_requests
 from compute_horde.mv_protocol.validator_requests import BaseValidatorRequest
+from compute_horde.receipts import verify_validator_signature
 from django.conf import settings
 from django.utils import timezone
 
@@ -29,7 +30,7 @@ from compute_horde_miner.miner.models import (
     Validator,
     ValidatorBlacklist,
 )
-from compute_horde_miner.miner.tasks import prepare_receipts
+from compute_horde_miner.miner.tasks import RECEIPTS_PUBLICATION_DELAY, prepare_receipts
 
 logger = logging.getLogger(__name__)
 
@@ -158,8 +159,8 @@ class MinerValidatorConsumer(BaseConsumer, ValidatorInterfaceMixin):
             )
             return False
 
-        keypair = bittensor.Keypair(ss58_address=self.validator_key)
-        if keypair.verify(msg.blob_for_signing(), msg.signature):
+        # receipts of a batch may share a signature of the Merkle root of the batch
+        if verify_validator_signature(msg.payload, msg.signature):
             return True
 
         logger.warning(
@@ -383,7 +384,7 @@ class MinerValidatorConsumer(BaseConsumer, ValidatorInterfaceMixin):
                 time_took_us=msg.payload.time_took_us,
                 score_str=msg.payload.score_str,
             )
-            prepare_receipts.delay()
+            prepare_receipts.apply_async(countdown=RECEIPTS_PUBLICATION_DELAY)
 
     async def _executor_ready(self, msg: ExecutorReady):
         job = await AcceptedJob.objects.aget(executor_token=msg.executor_token)
@@ -95,7 +95,8 @@ class AcceptedJob(models.Model):
 
 
 class AbstractReceipt(models.Model):
-    validator_signature = models.CharField(max_length=256)
+    # longer for receipts signed in a batch, which carry a Merkle proof
+    validator_signature = models.TextField()
     miner_signature = models.CharField(max_length=256)
 
     # payload fields
@@ -103,6 +104,10 @@ class AbstractReceipt(models.Model):
     miner_hotkey = models.CharField(max_length=256)
     validator_hotkey = models.CharField(max_length=256)
 
+    published = models.BooleanField(
+        default=False, help_text="Whether the receipt was appended to a receipts partition"
+    )
+
     def __str__(self):
         return f"uuid: {self.job_uuid}"
 
@@ -115,6 +120,12 @@ class JobFinishedReceipt(AbstractReceipt):
     time_took_us = models.BigIntegerField()
     score_str = models.CharField(max_length=256)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["time_started", "id"]),
+            models.Index(fields=["validator_hotkey", "time_started", "id"]),
+        ]
+
     def time_took(self):
         return timedelta(microseconds=self.time_took_us)
 
@@ -141,6 +152,12 @@ class JobStartedReceipt(AbstractReceipt):
     time_accepted = models.DateTimeField()
     max_timeout = models.IntegerField()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["time_accepted", "id"]),
+            models.Index(fields=["validator_hotkey", "time_accepted", "id"]),
+        ]
+
     def to_receipt(self):
         return Receipt(
             payload=JobStartedReceiptPayload(
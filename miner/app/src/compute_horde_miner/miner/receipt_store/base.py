@@ -1,8 +1,18 @@
 import abc
+import datetime
 
 from compute_horde.receipts import Receipt
 
 
 class BaseReceiptStore(metaclass=abc.ABCMeta):
     @abc.abstractmethod
-    def store(self, receipts: list[Receipt]) -> None: ...
+    def store(self, receipts: list[Receipt]) -> None:
+        """Replace the full receipts file with `receipts`."""
+
+    @abc.abstractmethod
+    def append(self, receipts: list[Receipt], published_at: datetime.datetime) -> None:
+        """Append `receipts` to the partition of `published_at`."""
+
+    @abc.abstractmethod
+    def prune(self, older_than: datetime.datetime) -> None:
+        """Remove the partitions which ended before `older_than`."""
@@ -1,5 +1,7 @@
 import csv
+import datetime
 import io
+import os
 import pathlib
 import shutil
 import tempfile
@@ -8,56 +10,111 @@ from compute_horde.mv_protocol.validator_requests import (
     JobFinishedReceiptPayload,
     JobStartedReceiptPayload,
 )
-from compute_horde.receipts import Receipt, ReceiptType
+from compute_horde.receipts import (
+    Receipt,
+    ReceiptType,
+    get_receipts_partition_name,
+    get_receipts_partition_start,
+)
 from django.conf import settings
 
 from compute_horde_miner.miner.receipt_store.base import BaseReceiptStore
 
 FILENAME = "receipts.csv"
+PARTITION_GLOB = "receipts-*.csv"
+
+
+def _get_csv_fields() -> list[str]:
+    payload_fields = set()
+    for payload_cls in [JobStartedReceiptPayload, JobFinishedReceiptPayload]:
+        payload_fields |= set(payload_cls.model_fields.keys())
+    # sorted, so that all processes appending to a partition agree on the order of columns
+    return ["type", "validator_signature", "miner_signature", *sorted(payload_fields)]
+
+
+def _receipt_to_row(receipt: Receipt) -> dict:
+    match receipt.payload:
+        case JobStartedReceiptPayload():
+            receipt_type = ReceiptType.JobStartedReceipt
+        case JobFinishedReceiptPayload():
+            receipt_type = ReceiptType.JobFinishedReceipt
+    return (
+        dict(
+            type=receipt_type.value,
+            validator_signature=receipt.validator_signature,
+            miner_signature=receipt.miner_signature,
+        )
+        | receipt.payload.model_dump()
+    )
 
 
 class LocalReceiptStore(BaseReceiptStore):
+    @property
+    def root(self) -> pathlib.Path:
+        return pathlib.Path(settings.LOCAL_RECEIPTS_ROOT)
+
     def store(self, receipts: list[Receipt]) -> None:
         if not receipts:
             return
 
-        payload_fields = set()
-        for payload_cls in [JobStartedReceiptPayload, JobFinishedReceiptPayload]:
-            payload_fields |= set(payload_cls.model_fields.keys())
-
         buf = io.StringIO()
-        csv_writer = csv.DictWriter(
-            buf,
-            [
-                "type",
-                "validator_signature",
-                "miner_signature",
-                *payload_fields,
-            ],
-        )
+        csv_writer = csv.DictWriter(buf, _get_csv_fields())
         csv_writer.writeheader()
         for receipt in receipts:
-            match receipt.payload:
-                case JobStartedReceiptPayload():
-                    receipt_type = ReceiptType.JobStartedReceipt
-                case JobFinishedReceiptPayload():
-                    receipt_type = ReceiptType.JobFinishedReceipt
-            row = (
-                dict(
-                    type=receipt_type.value,
-                    validator_signature=receipt.validator_signature,
-                    miner_signature=receipt.miner_signature,
-                )
-                | receipt.payload.model_dump()
-            )
-            csv_writer.writerow(row)
-
-        root = pathlib.Path(settings.LOCAL_RECEIPTS_ROOT)
-        root.mkdir(parents=True, exist_ok=True)
-        filepath = root / FILENAME
+            csv_writer.writerow(_receipt_to_row(receipt))
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        filepath = self.root / FILENAME
 
         with tempfile.NamedTemporaryFile(mode="wt", delete=False, encoding="utf8") as temp_file:
             temp_file.write(buf.getvalue())
 
         shutil.move(temp_file.name, filepath)
         filepath.chmod(0o644)
+
+    def append(self, receipts: list[Receipt], published_at: datetime.datetime) -> None:
+        if not receipts:
+            return
+
+        filepath = self.root / get_receipts_partition_name(published_at)
+        if not filepath.exists():
+            self._create_partition(filepath)
+
+        buf = io.StringIO()
+        csv_writer = csv.DictWriter(buf, _get_csv_fields())
+        for receipt in receipts:
+            csv_writer.writerow(_receipt_to_row(receipt))
+
+        # a single write to a file opened for appending, so that rows of concurrent writers
+        # are not interleaved
+        fd = os.open(filepath, os.O_WRONLY | os.O_APPEND)
+        try:
+            os.write(fd, buf.getvalue().encode("utf8"))
+        finally:
+            os.close(fd)
+
+    def _create_partition(self, filepath: pathlib.Path) -> None:
+        buf = io.StringIO()
+        csv.DictWriter(buf, _get_csv_fields()).writeheader()
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="wt", dir=self.root, delete=False, encoding="utf8"
+        ) as temp_file:
+            temp_file.write(buf.getvalue())
+        temp_path = pathlib.Path(temp_file.name)
+        temp_path.chmod(0o644)
+        try:
+            # fails if another process has just created the partition
+            os.link(temp_path, filepath)
+        except FileExistsError:
+            pass
+        finally:
+            temp_path.unlink()
+
+    def prune(self, older_than: datetime.datetime) -> None:
+        cutoff = get_receipts_partition_name(get_receipts_partition_start(older_than))
+        for filepath in self.root.glob(PARTITION_GLOB):
+            # partition names sort chronologically
+            if filepath.name < cutoff:
+                filepath.unlink(missing_ok=True)
@@ -10,6 +10,8 @@ from compute_horde.receipts import (
 from compute_horde.utils import get_validators
 from constance import config
 from django.conf import settings
+from django.db import transaction
+from django.db.models import QuerySet
 from django.utils.timezone import now
 
 from compute_horde_miner.celery import app
@@ -21,6 +23,10 @@ logger = get_task_logger(__name__)
 
 RECEIPTS_MAX_RETENTION_PERIOD = datetime.timedelta(days=2)
 RECEIPTS_MAX_SERVED_PERIOD = datetime.timedelta(days=1)
+# receipts are published at most this many seconds after they are created, in batches
+RECEIPTS_PUBLICATION_DELAY = 10
+# old receipts are deleted this many at a time, each chunk in a short transaction of its own
+RECEIPTS_DELETE_CHUNK_SIZE = 5_000
 
 
 @app.task
@@ -67,6 +73,41 @@ def fetch_validators():
 
 @app.task
 def prepare_receipts():
+    """
+    Append the receipts created since the last run to the current receipts partition.
+    """
+    with transaction.atomic():
+        job_started_receipts = list(
+            JobStartedReceipt.objects.select_for_update(skip_locked=True)
+            .filter(published=False)
+            .order_by("time_accepted")
+        )
+        job_finished_receipts = list(
+            JobFinishedReceipt.objects.select_for_update(skip_locked=True)
+            .filter(published=False)
+            .order_by("time_started")
+        )
+        receipts = [jr.to_receipt() for jr in job_started_receipts]
+        receipts += [jr.to_receipt() for jr in job_finished_receipts]
+        if not receipts:
+            return
+
+        receipts_store.append(receipts, published_at=now())
+        JobStartedReceipt.objects.filter(pk__in=[jr.pk for jr in job_started_receipts]).update(
+            published=True
+        )
+        JobFinishedReceipt.objects.filter(pk__in=[jr.pk for jr in job_finished_receipts]).update(
+            published=True
+        )
+    logger.debug(f"Published {len(receipts)} receipts")
+
+
+@app.task
+def prepare_receipts_csv():
+    """
+    Write all receipts of the served period into a single CSV, for validators which don't fetch
+    receipts partitions.
+    """
     receipts = []
 
     job_started_receipts = JobStartedReceipt.objects.order_by("time_accepted").filter(
@@ -82,14 +123,24 @@ def prepare_receipts():
     receipts_store.store(receipts)
 
 
+def _delete_in_chunks(queryset: QuerySet, chunk_size: int) -> None:
+    while True:
+        pks = list(queryset.values_list("pk", flat=True)[:chunk_size])
+        if not pks:
+            return
+        queryset.model.objects.filter(pk__in=pks).delete()
+
+
 @app.task
 def clear_old_receipts():
-    JobFinishedReceipt.objects.filter(
-        time_started__lt=now() - RECEIPTS_MAX_RETENTION_PERIOD
-    ).delete()
-    JobStartedReceipt.objects.filter(
-        time_accepted__lt=now() - RECEIPTS_MAX_RETENTION_PERIOD
-    ).delete()
+    cutoff = now() - RECEIPTS_MAX_RETENTION_PERIOD
+    _delete_in_chunks(
+        JobFinishedReceipt.objects.filter(time_started__lt=cutoff), RECEIPTS_DELETE_CHUNK_SIZE
+    )
+    _delete_in_chunks(
+        JobStartedReceipt.objects.filter(time_accepted__lt=cutoff), RECEIPTS_DELETE_CHUNK_SIZE
+    )
+    receipts_store.prune(older_than=now() - RECEIPTS_MAX_SERVED_PERIOD)
 
 
 @app.task
@@ -0,0 +1,192 @@
+import csv
+import datetime
+import gzip
+import json
+import uuid
+from pathlib import Path
+
+import pytest
+from compute_horde.executor_class import DEFAULT_EXECUTOR_CLASS
+from compute_horde.receipts import ReceiptType, parse_receipt
+from django.utils.timezone import now
+from freezegun import freeze_time
+
+from compute_horde_miner.miner import tasks
+from compute_horde_miner.miner.models import JobFinishedReceipt, JobStartedReceipt
+from compute_horde_miner.miner.tasks import clear_old_receipts, prepare_receipts
+from compute_horde_miner.miner.views import get_receipts
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def receipts_root(settings, tmp_path: Path):
+    settings.LOCAL_RECEIPTS_ROOT = tmp_path
+    return tmp_path
+
+
+def create_job_started_receipt(validator_hotkey: str = "validator") -> JobStartedReceipt:
+    return JobStartedReceipt.objects.create(
+        validator_signature="0xv",
+        miner_signature="0xm",
+        job_uuid=uuid.uuid4(),
+        miner_hotkey="miner",
+        validator_hotkey=validator_hotkey,
+        executor_class=DEFAULT_EXECUTOR_CLASS,
+        time_accepted=now(),
+        max_timeout=30,
+    )
+
+
+def create_job_finished_receipt(validator_hotkey: str = "validator") -> JobFinishedReceipt:
+    return JobFinishedReceipt.objects.create(
+        validator_signature="0xv",
+        miner_signature="0xm",
+        job_uuid=uuid.uuid4(),
+        miner_hotkey="miner",
+        validator_hotkey=validator_hotkey,
+        time_started=now(),
+        time_took_us=1_000_000,
+        score_str="1.0",
+    )
+
+
+def read_partition(path: Path) -> list[dict[str, str]]:
+    with path.open() as f:
+        return list(csv.DictReader(f))
+
+
+@freeze_time("2024-01-02 01:55:00")
+def test_prepare_receipts__appends_new_receipts(receipts_root):
+    started = create_job_started_receipt()
+    finished = create_job_finished_receipt()
+
+    prepare_receipts()
+
+    partition = receipts_root / "receipts-2024-01-02-01.csv"
+    rows = read_partition(partition)
+    assert [row["job_uuid"] for row in rows] == [str(started.job_uuid), str(finished.job_uuid)]
+    assert not JobStartedReceipt.objects.filter(published=False).exists()
+    assert not JobFinishedReceipt.objects.filter(published=False).exists()
+
+    # already published receipts are not written again
+    later = create_job_finished_receipt()
+    prepare_receipts()
+    rows = read_partition(partition)
+    assert [row["job_uuid"] for row in rows] == [
+        str(started.job_uuid),
+        str(finished.job_uuid),
+        str(later.job_uuid),
+    ]
+    assert partition.read_text().count("validator_signature") == 1
+
+
+def test_prepare_receipts__partition_per_hour(receipts_root):
+    with freeze_time("2024-01-02 01:55:00"):
+        create_job_started_receipt()
+        prepare_receipts()
+    with freeze_time("2024-01-02 02:05:00"):
+        create_job_finished_receipt()
+        prepare_receipts()
+        # nothing new, no partition is touched
+        prepare_receipts()
+
+    assert len(read_partition(receipts_root / "receipts-2024-01-02-01.csv")) == 1
+    assert len(read_partition(receipts_root / "receipts-2024-01-02-02.csv")) == 1
+
+
+def test_clear_old_receipts__deletes_in_chunks(monkeypatch):
+    monkeypatch.setattr(tasks, "RECEIPTS_DELETE_CHUNK_SIZE", 2)
+    with freeze_time("2024-01-01 12:00:00"):
+        for _ in range(5):
+            create_job_started_receipt()
+            create_job_finished_receipt()
+    with freeze_time("2024-01-02 12:00:00"):
+        started = create_job_started_receipt()
+        finished = create_job_finished_receipt()
+
+    with freeze_time("2024-01-03 13:00:00"):
+        clear_old_receipts()
+
+    assert list(JobStartedReceipt.objects.all()) == [started]
+    assert list(JobFinishedReceipt.objects.all()) == [finished]
+
+
+def test_clear_old_receipts__prunes_partitions(receipts_root):
+    for hour in range(0, 24, 6):
+        with freeze_time(datetime.datetime(2024, 1, 2, hour, 30, tzinfo=datetime.UTC)):
+            create_job_started_receipt()
+            prepare_receipts()
+
+    with freeze_time("2024-01-03 07:00:00"):
+        clear_old_receipts()
+
+    assert sorted(path.name for path in receipts_root.iterdir()) == [
+        "receipts-2024-01-02-12.csv",
+        "receipts-2024-01-02-18.csv",
+    ]
+
+
+def get_all_receipts_pages(rf, **params) -> tuple[list[dict], int]:
+    receipts = []
+    pages = 0
+    while True:
+        response = get_receipts(rf.get("/api/v1/receipts", params, HTTP_ACCEPT_ENCODING="gzip"))
+        assert response.status_code == 200
+        assert response["Content-Encoding"] == "gzip"
+        page = json.loads(gzip.decompress(response.content))
+        receipts += page["receipts"]
+        pages += 1
+        if page["next_cursor"] is None:
+            return receipts, pages
+        params["cursor"] = page["next_cursor"]
+
+
+def test_receipts_api__pagination(rf):
+    created = []
+    for minute in range(5):
+        with freeze_time(datetime.datetime(2024, 1, 2, 1, minute, tzinfo=datetime.UTC)):
+            created.append(create_job_started_receipt())
+            created.append(create_job_finished_receipt())
+
+    receipts, pages = get_all_receipts_pages(rf, limit=3)
+
+    assert [receipt["job_uuid"] for receipt in receipts] == [str(r.job_uuid) for r in created]
+    assert pages == 4
+    assert receipts[0]["type"] == ReceiptType.JobStartedReceipt.value
+    assert parse_receipt(receipts[0]) == created[0].to_receipt()
+    assert parse_receipt(receipts[1]) == created[1].to_receipt()
+
+
+def test_receipts_api__filters(rf):
+    with freeze_time("2024-01-02 01:00:00"):
+        create_job_started_receipt()
+    with freeze_time("2024-01-02 02:00:00"):
+        create_job_started_receipt(validator_hotkey="other")
+        expected = create_job_finished_receipt()
+    with freeze_time("2024-01-02 03:00:00"):
+        create_job_finished_receipt()
+
+    receipts, _ = get_all_receipts_pages(
+        rf,
+        validator_hotkey="validator",
+        since="2024-01-02T01:30:00+00:00",
+        until="2024-01-02T02:30:00+00:00",
+    )
+
+    assert [receipt["job_uuid"] for receipt in receipts] == [str(expected.job_uuid)]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"since": "yesterday"},
+        {"since": "2024-01-02T01:30:00"},
+        {"cursor": "nonsense"},
+        {"limit": "0"},
+        {"limit": "many"},
+    ],
+)
+def test_receipts_api__invalid_query(rf, params):
+    response = get_receipts(rf.get("/api/v1/receipts", params))
+    assert response.status_code == 400
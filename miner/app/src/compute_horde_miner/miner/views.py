@@ -1,9 +1,135 @@
+import base64
+import datetime
+import json
 import os
 
-from django.http import JsonResponse
+from compute_horde.receipts import RECEIPTS_API_PAGE_SIZE, receipt_to_dict
+from django.db.models import Model, Q
+from django.http import HttpRequest, JsonResponse
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import require_GET
+
+from compute_horde_miner.miner.models import JobFinishedReceipt, JobStartedReceipt
+
+RECEIPTS_API_MAX_PAGE_SIZE = 5000
 
 
 def get_version(request):
     miner_version = os.environ.get("MINER_VERSION", "unknown")
     runner_version = os.environ.get("MINER_RUNNER_VERSION", "unknown")
     return JsonResponse({"miner_version": miner_version, "runner_version": runner_version})
+
+
+class InvalidReceiptsQuery(Exception):
+    pass
+
+
+def _parse_datetime(value: str | None) -> datetime.datetime | None:
+    if value is None:
+        return None
+    try:
+        timestamp = datetime.datetime.fromisoformat(value)
+    except ValueError as e:
+        raise InvalidReceiptsQuery(f"invalid timestamp: {value!r}") from e
+    if timestamp.tzinfo is None:
+        raise InvalidReceiptsQuery(f"timestamp without timezone: {value!r}")
+    return timestamp
+
+
+def _encode_cursor(positions: dict[str, tuple[datetime.datetime, int] | None]) -> str:
+    data = {
+        key: [position[0].isoformat(), position[1]] if position is not None else None
+        for key, position in positions.items()
+    }
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+
+def _decode_cursor(cursor: str | None) -> dict[str, tuple[datetime.datetime, int] | None]:
+    if cursor is None:
+        return {"started": None, "finished": None}
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return {
+            key: (datetime.datetime.fromisoformat(data[key][0]), int(data[key][1]))
+            if data[key] is not None
+            else None
+            for key in ["started", "finished"]
+        }
+    except (ValueError, TypeError, KeyError, IndexError) as e:
+        raise InvalidReceiptsQuery("invalid cursor") from e
+
+
+def _get_receipts_page(
+    model: type[Model],
+    time_field: str,
+    filters: Q,
+    after: tuple[datetime.datetime, int] | None,
+    limit: int,
+) -> list:
+    queryset = model.objects.filter(filters).order_by(time_field, "id")
+    if after is not None:
+        timestamp, pk = after
+        queryset = queryset.filter(
+            Q(**{f"{time_field}__gt": timestamp}) | Q(**{time_field: timestamp, "id__gt": pk})
+        )
+    return list(queryset[:limit])
+
+
+@require_GET
+@gzip_page
+def get_receipts(request: HttpRequest):
+    """
+    Receipts of this miner, oldest first, `limit` at a time.
+
+    Optional filters: `validator_hotkey`, and `since` / `until` (ISO 8601, with timezone) on the
+    time the job was accepted (job started receipts) or started (job finished receipts). Pass the
+    `next_cursor` of a response as `cursor` to get the next page; it is null on the last page.
+    """
+    try:
+        validator_hotkey = request.GET.get("validator_hotkey")
+        since = _parse_datetime(request.GET.get("since"))
+        until = _parse_datetime(request.GET.get("until"))
+        positions = _decode_cursor(request.GET.get("cursor"))
+        try:
+            limit = int(request.GET.get("limit", RECEIPTS_API_PAGE_SIZE))
+        except ValueError as e:
+            raise InvalidReceiptsQuery("invalid limit") from e
+        if not 0 < limit <= RECEIPTS_API_MAX_PAGE_SIZE:
+            raise InvalidReceiptsQuery(f"limit must be between 1 and {RECEIPTS_API_MAX_PAGE_SIZE}")
+    except InvalidReceiptsQuery as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    pages = {}
+    # at the same time, job started receipts go first
+    for order, (key, model, time_field) in enumerate(
+        [
+            ("started", JobStartedReceipt, "time_accepted"),
+            ("finished", JobFinishedReceipt, "time_started"),
+        ]
+    ):
+        filters = Q()
+        if validator_hotkey is not None:
+            filters &= Q(validator_hotkey=validator_hotkey)
+        if since is not None:
+            filters &= Q(**{f"{time_field}__gte": since})
+        if until is not None:
+            filters &= Q(**{f"{time_field}__lt": until})
+        pages[key] = [
+            (getattr(receipt, time_field), order, receipt.id, key, receipt)
+            for receipt in _get_receipts_page(model, time_field, filters, positions[key], limit)
+        ]
+
+    merged = sorted(pages["started"] + pages["finished"], key=lambda item: item[:3])
+    page = merged[:limit]
+    for timestamp, _, pk, key, _ in page:
+        positions[key] = (timestamp, pk)
+
+    has_more = (
+        len(merged) > limit or len(pages["started"]) == limit or len(pages["finished"]) == limit
+    )
+    return JsonResponse(
+        {
+            "receipts": [receipt_to_dict(receipt.to_receipt()) for *_, receipt in page],
+            "next_cursor": _encode_cursor(positions) if has_more else None,
+        }
+    )
@@ -275,6 +275,16 @@ PROD_CELERY_BEAT_SCHEDULE = {
         "schedule": timedelta(hours=1),
         "options": {},
     },
+    "prepare_receipts": {
+        "task": "compute_horde_miner.miner.tasks.prepare_receipts",
+        "schedule": timedelta(minutes=1),
+        "options": {},
+    },
+    "prepare_receipts_csv": {
+        "task": "compute_horde_miner.miner.tasks.prepare_receipts_csv",
+        "schedule": timedelta(minutes=10),
+        "options": {},
+    },
     "fetch_validators": {
         "task": "compute_horde_miner.miner.tasks.fetch_validators",
         "schedule": 60,
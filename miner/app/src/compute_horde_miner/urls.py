@@ -5,13 +5,14 @@ from django.views.generic import RedirectView
 
 from .miner.business_metrics import metrics_manager
 from .miner.metrics import metrics_view
-from .miner.views import get_version
+from .miner.views import get_receipts, get_version
 
 urlpatterns = [
     path("admin/", site.urls),
     path("", RedirectView.as_view(url="/admin/"), name="home"),
     path("", include("django.contrib.auth.urls")),
     path("version", get_version, name="get-version"),
+    path("api/v1/receipts", get_receipts, name="receipts-api"),
     path("metrics", metrics_view, name="prometheus-django-metrics"),
     path("business-metrics", metrics_manager.view, name="prometheus-business-metrics"),
 ]
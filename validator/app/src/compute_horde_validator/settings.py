@@ -148,6 +148,11 @@ CONSTANCE_CONFIG = {
         "The synthetic jobs flow version",
         int,
     ),
+    "DYNAMIC_SYNTHETIC_JOBS_PREGENERATION_HEADROOM": (
+        0.2,
+        "How many more hashcat jobs than in the previous batch to pregenerate, as a fraction",
+        float,
+    ),
     "DYNAMIC_SYNTHETIC_JOBS_PLANNER_WAIT_IN_ADVANCE_BLOCKS": (
         3,
         "How many blocks in advance to start waiting before synthetic jobs spawn",
@@ -218,6 +223,14 @@ CONSTANCE_CONFIG = {
         "in seconds",
         int,
     ),
+    "DYNAMIC_RECEIPTS_BATCH_SIGNING": (
+        False,
+        (
+            "Sign the job finished receipts of a synthetic jobs batch with a single signature "
+            "of their Merkle root. Miners need to support it to accept such receipts"
+        ),
+        bool,
+    ),
     # llama params
     "DYNAMIC_MAX_PROMPT_SERIES": (
         3500,
@@ -405,6 +418,11 @@ CELERY_BEAT_SCHEDULE = {  # type: ignore
         "schedule": timedelta(seconds=30),
         "options": {},
     },
+    "pregenerate_synthetic_jobs": {
+        "task": "compute_horde_validator.validator.tasks.pregenerate_synthetic_jobs",
+        "schedule": timedelta(minutes=5),
+        "options": {},
+    },
     "check_missed_synthetic_jobs": {
         "task": "compute_horde_validator.validator.tasks.check_missed_synthetic_jobs",
         "schedule": timedelta(minutes=10),
@@ -424,6 +442,11 @@ CELERY_BEAT_SCHEDULE = {  # type: ignore
     #     "schedule": crontab(minute="15,45"),  # try to stay away from set_scores task :)
     #     "options": {},
     # },
+    "clear_old_receipts": {
+        "task": "compute_horde_validator.validator.tasks.clear_old_receipts",
+        "schedule": timedelta(hours=1),
+        "options": {},
+    },
     "reveal_scores": {
         "task": "compute_horde_validator.validator.tasks.reveal_scores",
         "schedule": timedelta(minutes=1),
@@ -434,6 +457,11 @@ CELERY_BEAT_SCHEDULE = {  # type: ignore
         "schedule": timedelta(minutes=5),
         "options": {},
     },
+    "clear_old_system_events": {
+        "task": "compute_horde_validator.validator.tasks.clear_old_system_events",
+        "schedule": timedelta(hours=1),
+        "options": {},
+    },
     "fetch_dynamic_config": {
         "task": "compute_horde_validator.validator.tasks.fetch_dynamic_config",
         "schedule": timedelta(minutes=5),
@@ -460,6 +488,18 @@ if env.bool("DEBUG_RUN_BEAT_VERY_OFTEN", default=False):
     CELERY_BEAT_SCHEDULE["set_scores"]["schedule"] = crontab(minute="*/3")
     CELERY_BEAT_SCHEDULE["fetch_receipts"]["schedule"] = crontab(minute="*/3")
 
+# the block watcher (`manage.py watch_blocks`) triggers these tasks at the blocks they are due
+# at, so that celery beat doesn't have to run them to poll subtensor for the current block
+BLOCK_WATCHER_ENABLED = env.bool("BLOCK_WATCHER_ENABLED", default=False)
+if BLOCK_WATCHER_ENABLED:
+    for task_name in (
+        "schedule_synthetic_jobs",
+        "run_synthetic_jobs",
+        "set_scores",
+        "reveal_scores",
+    ):
+        CELERY_BEAT_SCHEDULE.pop(task_name)
+
 CELERY_TASK_ROUTES = ["compute_horde_validator.celery.route_task"]
 CELERY_TASK_TIME_LIMIT = int(timedelta(hours=2, minutes=5).total_seconds())
 CELERY_TASK_ALWAYS_EAGER = env.bool("CELERY_TASK_ALWAYS_EAGER", default=False)
@@ -528,6 +568,10 @@ FACILITATOR_URI = env.str("FACILITATOR_URI", default="wss://facilitator.computeh
 STATS_COLLECTOR_URL = env.str(
     "STATS_COLLECTOR_URL", default="https://facilitator.computehorde.io/stats_collector/v0/"
 )
+# gzip system events sent to the stats collector, which has to accept `Content-Encoding: gzip`
+STATS_COLLECTOR_GZIP = env.bool("STATS_COLLECTOR_GZIP", default=False)
+# system events are deleted this many days after they were sent to the stats collector
+SYSTEM_EVENTS_RETENTION_DAYS = env.int("SYSTEM_EVENTS_RETENTION_DAYS", default=7)
 # if you need to hit a particular miner, without fetching their key, address or port from the blockchain
 DEBUG_MINER_KEY = env.str("DEBUG_MINER_KEY", default="")
 DEBUG_MINER_ADDRESS = env.str("DEBUG_MINER_ADDRESS", default="")
@@ -559,6 +603,13 @@ DYNAMIC_CONFIG_ENV = env.str("DYNAMIC_CONFIG_ENV", default="prod")
 # we start them from some offset because scheduling takes some time
 SYNTHETIC_JOBS_RUN_OFFSET = env.int("SYNTHETIC_JOBS_RUN_OFFSET", default=24)
 
+# number of processes used for pregenerating hashcat synthetic jobs, 0 means one per cpu core
+SYNTHETIC_JOBS_GENERATION_PROCESSES = env.int("SYNTHETIC_JOBS_GENERATION_PROCESSES", default=0)
+
+# number of processes a synthetic jobs batch is split across, each running the batch
+# for a shard of the miners - 1 runs the whole batch in the celery worker itself
+SYNTHETIC_JOBS_BATCH_SHARDS = env.int("SYNTHETIC_JOBS_BATCH_SHARDS", default=1)
+
 PROMPT_JOB_GENERATOR = env.str(
     "PROMPT_JOB_GENERATOR",
     default="compute_horde_validator.validator.cross_validation.generator.v0:PromptJobGenerator",
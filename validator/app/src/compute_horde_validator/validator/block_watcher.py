@@ -0,0 +1,124 @@
+"""
+Block-driven scheduling of the validator's periodic work.
+
+Instead of celery tasks polling subtensor for the current block (and holding a worker while
+sleeping until the right block comes), a single watcher process subscribes to new chain heads
+and triggers the work at the exact blocks it is due at.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from typing import Protocol
+
+import bittensor
+from constance import config
+from django.conf import settings
+
+from compute_horde_validator.validator.models import SyntheticJobBatch, SystemEvent
+from compute_horde_validator.validator.tasks import (
+    CommitRevealInterval,
+    get_cycle_containing_block,
+    reveal_scores,
+    run_synthetic_jobs,
+    schedule_synthetic_jobs,
+    set_scores,
+    start_synthetic_job_batch,
+)
+
+logger = logging.getLogger(__name__)
+
+# tasks that need retrying until they succeed are triggered every this many blocks (~1 minute)
+PERIODIC_TASK_BLOCKS = 5
+RESUBSCRIBE_DELAY = 5
+
+
+class BlockSource(Protocol):
+    def subscribe(self, on_block: Callable[[int], None]) -> None:
+        """
+        Call `on_block` with the number of each new block. Only returns on connection failure.
+        """
+        ...
+
+
+class SubtensorBlockSource:
+    def __init__(self, network: str):
+        self.network = network
+
+    def subscribe(self, on_block: Callable[[int], None]) -> None:
+        subtensor = bittensor.subtensor(network=self.network)
+
+        def handler(obj, update_nr, subscription_id):
+            on_block(obj["header"]["number"])
+
+        subtensor.substrate.subscribe_block_headers(handler)
+
+
+class BlockWatcher:
+    def __init__(self, source: BlockSource):
+        self.source = source
+        self.current_block: int | None = None
+        self._current_cycle: range | None = None
+
+    def run_forever(self) -> None:
+        while True:
+            try:
+                self.source.subscribe(self.on_block)
+            except Exception as exc:
+                msg = f"Block subscription failed: {exc!r}"
+                logger.warning(msg)
+                SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).create(
+                    type=SystemEvent.EventType.VALIDATOR_FAILURE,
+                    subtype=SystemEvent.EventSubType.SUBTENSOR_CONNECTIVITY_ERROR,
+                    long_description=msg,
+                    data={},
+                )
+            time.sleep(RESUBSCRIBE_DELAY)
+
+    def on_block(self, block: int) -> None:
+        if self.current_block is not None and block <= self.current_block:
+            # a re-org, or a head we have already seen after re-subscribing
+            return
+        self.current_block = block
+        logger.debug("New block %s", block)
+
+        for trigger in (
+            self._schedule_synthetic_jobs,
+            self._run_synthetic_jobs,
+            self._set_scores,
+        ):
+            try:
+                trigger(block)
+            except Exception:
+                logger.exception("Failed to trigger %s at block %s", trigger.__name__, block)
+
+    def _schedule_synthetic_jobs(self, block: int) -> None:
+        cycle = get_cycle_containing_block(block=block, netuid=settings.BITTENSOR_NETUID)
+        new_cycle = cycle != self._current_cycle
+        self._current_cycle = cycle
+        if not new_cycle and block % PERIODIC_TASK_BLOCKS:
+            return
+        if SyntheticJobBatch.objects.filter(block__gte=cycle.start, block__lt=cycle.stop).exists():
+            return
+        schedule_synthetic_jobs.delay()
+
+    def _run_synthetic_jobs(self, block: int) -> None:
+        if settings.DEBUG_DONT_STAGGER_VALIDATORS:
+            if block % PERIODIC_TASK_BLOCKS == 0:
+                run_synthetic_jobs.delay()
+            return
+        start_synthetic_job_batch(block)
+
+    def _set_scores(self, block: int) -> None:
+        if not config.DYNAMIC_COMMIT_REVEAL_WEIGHTS_ENABLED:
+            if block % PERIODIC_TASK_BLOCKS == 0:
+                set_scores.delay()
+            return
+
+        interval = CommitRevealInterval(block)
+        if block in interval.commit_window:
+            if (block - interval.commit_start) % PERIODIC_TASK_BLOCKS == 0:
+                set_scores.delay()
+        elif block in interval.reveal_window:
+            if (block - interval.reveal_start) % PERIODIC_TASK_BLOCKS == 0:
+                reveal_scores.delay()
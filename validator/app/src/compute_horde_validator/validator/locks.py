@@ -1,3 +1,6 @@
+import contextlib
+from collections.abc import Iterator
+
 from django.db import connection
 
 
@@ -22,3 +25,22 @@ def get_advisory_lock(type_: LockType) -> None:
     unlocked = cursor.fetchall()[0][0]
     if not unlocked:
         raise Locked
+
+
+@contextlib.contextmanager
+def advisory_lease(type_: LockType) -> Iterator[None]:
+    """
+    Obtain postgres session-level advisory lock for the duration of the block.
+    Unlike `get_advisory_lock`, it doesn't need a transaction to be kept open while the lock is held. Throws `Locked`
+    if not able to obtain the lock. If the connection is lost, e.g. when the worker dies, postgres releases the lock.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_try_advisory_lock(%s)", [type_])
+        unlocked = cursor.fetchall()[0][0]
+    if not unlocked:
+        raise Locked
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_unlock(%s)", [type_])
@@ -0,0 +1,11 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from compute_horde_validator.validator.block_watcher import BlockWatcher, SubtensorBlockSource
+
+
+class Command(BaseCommand):
+    help = "Trigger synthetic jobs and weight setting at the blocks they are due at"
+
+    def handle(self, *args, **options):
+        BlockWatcher(SubtensorBlockSource(settings.BITTENSOR_NETWORK)).run_forever()
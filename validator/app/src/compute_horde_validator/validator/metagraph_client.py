@@ -1,19 +1,133 @@
 import asyncio
 import datetime as dt
 import logging
+import time
+from typing import Any, NamedTuple
 
 import bittensor
 from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.db import transaction
+from django.utils.timezone import now
 
-from .models import SystemEvent
+from .models import MetagraphSnapshot, SystemEvent
 
 logger = logging.getLogger(__name__)
 
 
+class NeuronInfo(NamedTuple):
+    uid: int
+    hotkey: str
+    axon_info: bittensor.AxonInfo
+
+
+class Metagraph:
+    """
+    Neurons of a metagraph snapshot, indexed by hotkey.
+    """
+
+    def __init__(self, block: int, updated_at: dt.datetime, neurons: list[NeuronInfo]):
+        self.block = block
+        self.updated_at = updated_at
+        self.neurons = neurons
+        self._neurons_by_hotkey = {neuron.hotkey: neuron for neuron in neurons}
+
+    @classmethod
+    def from_snapshot(cls, snapshot: MetagraphSnapshot) -> "Metagraph":
+        return cls(
+            block=snapshot.block,
+            updated_at=snapshot.updated_at,
+            neurons=[
+                NeuronInfo(
+                    uid=neuron["uid"],
+                    hotkey=neuron["hotkey"],
+                    axon_info=bittensor.AxonInfo(**neuron["axon_info"]),
+                )
+                for neuron in snapshot.neurons
+            ],
+        )
+
+    def get_neuron(self, hotkey: str) -> NeuronInfo | None:
+        return self._neurons_by_hotkey.get(hotkey)
+
+
+def _serialize_neuron(neuron: Any) -> dict[str, Any]:
+    axon_info = neuron.axon_info
+    return {
+        "uid": int(neuron.uid),
+        "hotkey": neuron.hotkey,
+        "axon_info": {
+            "version": axon_info.version,
+            "ip": axon_info.ip,
+            "port": axon_info.port,
+            "ip_type": axon_info.ip_type,
+            "hotkey": axon_info.hotkey,
+            "coldkey": axon_info.coldkey,
+        },
+    }
+
+
+def try_to_get_metagraph(netuid, network, tries=3):
+    for try_number in range(tries):
+        try:
+            subtensor = bittensor.subtensor(network=network)
+            return subtensor.metagraph(netuid)
+        except Exception:
+            if try_number == tries - 1:
+                raise
+            logger.exception("Encountered when fetching metagraph")
+            time.sleep(try_number + 1)
+
+
+def _is_fresh(updated_at: dt.datetime | None, max_age: dt.timedelta) -> bool:
+    return updated_at is not None and now() - updated_at < max_age
+
+
+_cached_metagraphs: dict[tuple[int, str], Metagraph] = {}
+
+
+def get_metagraph_snapshot(
+    netuid: int | None = None, network: str | None = None, max_age: dt.timedelta | None = None
+) -> Metagraph:
+    """
+    Return the metagraph snapshot shared by all validator processes. It is synced from the chain
+    when older than `max_age` (a block by default) - by a single process, while the others wait
+    for its result instead of syncing the metagraph themselves.
+    """
+    netuid = settings.BITTENSOR_NETUID if netuid is None else netuid
+    network = settings.BITTENSOR_NETWORK if network is None else network
+    max_age = settings.BITTENSOR_APPROXIMATE_BLOCK_DURATION if max_age is None else max_age
+
+    snapshots = MetagraphSnapshot.objects
+    updated_at = (
+        snapshots.filter(netuid=netuid, network=network)
+        .values_list("updated_at", flat=True)
+        .first()
+    )
+    if not _is_fresh(updated_at, max_age):
+        with transaction.atomic():
+            snapshots.get_or_create(netuid=netuid, network=network)
+            snapshot = snapshots.select_for_update().get(netuid=netuid, network=network)
+            # another process could have synced it while we were waiting for the lock
+            if not _is_fresh(snapshot.updated_at, max_age):
+                metagraph = try_to_get_metagraph(netuid, network=network)
+                snapshot.block = metagraph.block.item()
+                snapshot.neurons = [_serialize_neuron(neuron) for neuron in metagraph.neurons]
+                snapshot.updated_at = now()
+                snapshot.save()
+            updated_at = snapshot.updated_at
+
+    cached = _cached_metagraphs.get((netuid, network))
+    if cached is None or cached.updated_at != updated_at:
+        cached = _cached_metagraphs[(netuid, network)] = Metagraph.from_snapshot(
+            snapshots.get(netuid=netuid, network=network)
+        )
+    return cached
+
+
 class AsyncMetagraphClient:
-    def __init__(self, cache_time=dt.timedelta(minutes=5)):
-        self.cache_time = cache_time
+    def __init__(self, cache_time=None):
+        self.cache_time = cache_time or settings.BITTENSOR_APPROXIMATE_BLOCK_DURATION
         self._metagraph_future = None
         self._future_lock = asyncio.Lock()
         self._cached_metagraph = None
@@ -49,11 +163,8 @@ class AsyncMetagraphClient:
         else:
             return await future
 
-    @sync_to_async(thread_sensitive=False)
-    def _get_metagraph(self):
-        return bittensor.metagraph(
-            netuid=settings.BITTENSOR_NETUID, network=settings.BITTENSOR_NETWORK
-        )
+    async def _get_metagraph(self):
+        return await sync_to_async(get_metagraph_snapshot)()
 
     async def periodic_refresh(self, period=None):
         if period is None:
@@ -78,10 +189,10 @@ async_metagraph_client = AsyncMetagraphClient()
 
 async def get_miner_axon_info(hotkey: str) -> bittensor.AxonInfo:
     metagraph = await async_metagraph_client.get_metagraph()
-    neurons = [n for n in metagraph.neurons if n.hotkey == hotkey]
-    if not neurons:
+    neuron = metagraph.get_neuron(hotkey)
+    if neuron is None:
         raise ValueError(f"Miner with {hotkey=} not present in this subnetwork")
-    return neurons[0].axon_info
+    return neuron.axon_info
 
 
 def create_metagraph_refresh_task(period=None):
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.15 on 2026-10-17 06:55
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("validator", "0038_alter_systemevent_subtype_alter_systemevent_type"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PregeneratedHashcatJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("weights_version", models.IntegerField()),
+                ("miner_hotkey", models.CharField(default=None, max_length=255, null=True)),
+                ("hash_job", models.BinaryField(help_text="pickled hashcat SyntheticJob")),
+                ("answer", models.TextField()),
+                (
+                    "volume_contents",
+                    models.TextField(help_text="base64 encoded zip with the job payload"),
+                ),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["weights_version", "miner_hotkey"],
+                        name="validator_p_weights_4efaf1_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.15 on 2026-10-17 07:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("validator", "0039_pregeneratedhashcatjob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="syntheticjobbatch",
+            name="scores",
+            field=models.JSONField(
+                blank=True, help_text="Cached score of each miner hotkey in this batch", null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="syntheticjobbatch",
+            name="scores_fingerprint",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="Fingerprint of the scoring parameters the cached scores were computed with",
+                max_length=64,
+            ),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.15 on 2026-10-17 07:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("validator", "0040_syntheticjobbatch_scores"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MetagraphSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("netuid", models.PositiveIntegerField()),
+                ("network", models.CharField(max_length=255)),
+                (
+                    "block",
+                    models.BigIntegerField(
+                        help_text="Block at which the metagraph was synced", null=True
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(null=True)),
+                (
+                    "neurons",
+                    models.JSONField(
+                        default=list,
+                        help_text="uid, hotkey and axon info of each neuron in the subnet",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="metagraphsnapshot",
+            constraint=models.UniqueConstraint(
+                fields=("netuid", "network"), name="unique_metagraph_snapshot"
+            ),
+        ),
+    ]
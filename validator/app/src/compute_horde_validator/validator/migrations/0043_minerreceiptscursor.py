@@ -0,0 +1,34 @@
+# Generated by Django 4.2.15 on 2026-10-17 08:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("validator", "0042_systemevent_receipt_fetch"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MinerReceiptsCursor",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("miner_hotkey", models.CharField(max_length=256, unique=True)),
+                ("etag", models.CharField(blank=True, default="", max_length=256)),
+                ("last_modified", models.CharField(blank=True, default="", max_length=256)),
+                (
+                    "last_receipt_at",
+                    models.DateTimeField(
+                        help_text="Timestamp of the newest receipt fetched from the miner",
+                        null=True,
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.15 on 2026-10-17 08:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("validator", "0043_minerreceiptscursor"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="minerreceiptscursor",
+            name="last_partition_at",
+            field=models.DateTimeField(
+                help_text="Start of the newest receipts partition fetched from the miner", null=True
+            ),
+        ),
+    ]
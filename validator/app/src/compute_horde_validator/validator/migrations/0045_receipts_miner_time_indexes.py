@@ -0,0 +1,32 @@
+# Generated by Django 4.2.15 on 2026-10-17 09:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("validator", "0044_minerreceiptscursor_last_partition_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="jobfinishedreceipt",
+            index=models.Index(
+                fields=["miner_hotkey", "time_started"], name="validator_j_miner_h_e2c8c7_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobfinishedreceipt",
+            index=models.Index(fields=["time_started"], name="validator_j_time_st_b404cd_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="jobstartedreceipt",
+            index=models.Index(
+                fields=["miner_hotkey", "time_accepted"], name="validator_j_miner_h_c9592c_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobstartedreceipt",
+            index=models.Index(fields=["time_accepted"], name="validator_j_time_ac_9d7734_idx"),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.15 on 2026-10-17 09:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("validator", "0045_receipts_miner_time_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="systemevent",
+            name="claimed_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When the event was claimed for sending to the stats collector",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.15 on 2026-10-17 09:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("validator", "0046_systemevent_claimed_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="systemevent",
+            index=models.Index(
+                condition=models.Q(("sent", False)), fields=["id"], name="systemevent_unsent_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="systemevent",
+            index=models.Index(fields=["timestamp"], name="validator_s_timesta_e10cfc_idx"),
+        ),
+    ]
@@ -7,7 +7,7 @@ from os import urandom
 from compute_horde.executor_class import DEFAULT_EXECUTOR_CLASS
 from django.contrib.postgres.fields import ArrayField
 from django.db import models
-from django.db.models import UniqueConstraint
+from django.db.models import Q, UniqueConstraint
 from django.utils.timezone import now
 
 logger = logging.getLogger(__name__)
@@ -63,6 +63,7 @@ class SystemEvent(models.Model):
         JOB_EXECUTION_TIMEOUT = "JOB_EXECUTION_TIMEOUT"
         RECEIPT_FETCH_ERROR = "RECEIPT_FETCH_ERROR"
         RECEIPT_SEND_ERROR = "RECEIPT_SEND_ERROR"
+        RECEIPT_FETCH = "RECEIPT_FETCH"
         SPECS_SEND_ERROR = "SPECS_SENDING_ERROR"
         HEARTBEAT_ERROR = "HEARTBEAT_ERROR"
         UNEXPECTED_MESSAGE = "UNEXPECTED_MESSAGE"
@@ -86,6 +87,18 @@ class SystemEvent(models.Model):
     )
     data = models.JSONField(blank=True)
     sent = models.BooleanField(default=False)
+    claimed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the event was claimed for sending to the stats collector",
+    )
+
+    class Meta:
+        indexes = [
+            # only as large as the backlog of events to send, however large the table grows
+            models.Index(fields=["id"], condition=Q(sent=False), name="systemevent_unsent_idx"),
+            models.Index(fields=["timestamp"]),
+        ]
 
     def to_dict(self):
         return {
@@ -152,11 +165,42 @@ class SyntheticJobBatch(models.Model):
     is_missed = models.BooleanField(
         default=False, help_text="Whether the batch was missed (not run)"
     )
+    scores = models.JSONField(
+        null=True, blank=True, help_text="Cached score of each miner hotkey in this batch"
+    )
+    scores_fingerprint = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="Fingerprint of the scoring parameters the cached scores were computed with",
+    )
 
     def __str__(self) -> str:
         return f"Scheduled validation #{self.pk} at block #{self.block}"
 
 
+class MetagraphSnapshot(models.Model):
+    """
+    Latest metagraph of a subnet synced from the chain, shared by all validator processes.
+    """
+
+    netuid = models.PositiveIntegerField()
+    network = models.CharField(max_length=255)
+    block = models.BigIntegerField(null=True, help_text="Block at which the metagraph was synced")
+    updated_at = models.DateTimeField(null=True)
+    neurons = models.JSONField(
+        default=list, help_text="uid, hotkey and axon info of each neuron in the subnet"
+    )
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(fields=["netuid", "network"], name="unique_metagraph_snapshot"),
+        ]
+
+    def __str__(self) -> str:
+        return f"Metagraph of subnet {self.netuid} at block #{self.block}"
+
+
 class MinerManifest(models.Model):
     miner = models.ForeignKey(Miner, on_delete=models.CASCADE)
     batch = models.ForeignKey(SyntheticJobBatch, on_delete=models.CASCADE)
@@ -201,6 +245,25 @@ class SyntheticJob(JobBase):
     score = models.FloatField(default=0)
 
 
+class PregeneratedHashcatJob(models.Model):
+    """
+    A hashcat synthetic job generated ahead of time, waiting to be claimed by a batch.
+    Jobs for weights versions which embed the miner hotkey in the payload are bound to a miner.
+    """
+
+    weights_version = models.IntegerField()
+    miner_hotkey = models.CharField(max_length=255, null=True, default=None)
+    hash_job = models.BinaryField(help_text="pickled hashcat SyntheticJob")
+    answer = models.TextField()
+    volume_contents = models.TextField(help_text="base64 encoded zip with the job payload")
+    created_at = models.DateTimeField(default=now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["weights_version", "miner_hotkey"]),
+        ]
+
+
 class OrganicJob(JobBase):
     stdout = models.TextField(blank=True, default="")
     stderr = models.TextField(blank=True, default="")
@@ -260,6 +323,12 @@ class JobFinishedReceipt(AbstractReceipt):
     time_took_us = models.BigIntegerField()
     score_str = models.CharField(max_length=256)
 
+    class Meta(AbstractReceipt.Meta):
+        indexes = [
+            models.Index(fields=["miner_hotkey", "time_started"]),
+            models.Index(fields=["time_started"]),
+        ]
+
     def time_took(self):
         return timedelta(microseconds=self.time_took_us)
 
@@ -272,6 +341,32 @@ class JobStartedReceipt(AbstractReceipt):
     time_accepted = models.DateTimeField()
     max_timeout = models.IntegerField()
 
+    class Meta(AbstractReceipt.Meta):
+        indexes = [
+            models.Index(fields=["miner_hotkey", "time_accepted"]),
+            models.Index(fields=["time_accepted"]),
+        ]
+
+
+class MinerReceiptsCursor(models.Model):
+    """
+    How far the receipts of a miner have been synced, so that only new receipts are fetched.
+    """
+
+    miner_hotkey = models.CharField(max_length=256, unique=True)
+    etag = models.CharField(max_length=256, blank=True, default="")
+    last_modified = models.CharField(max_length=256, blank=True, default="")
+    last_receipt_at = models.DateTimeField(
+        null=True, help_text="Timestamp of the newest receipt fetched from the miner"
+    )
+    last_partition_at = models.DateTimeField(
+        null=True, help_text="Start of the newest receipts partition fetched from the miner"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"receipts of {self.miner_hotkey} synced up to {self.last_receipt_at}"
+
 
 def get_random_salt() -> list[int]:
     return list(urandom(8))
@@ -0,0 +1,437 @@
+"""
+Collecting job receipts from miners.
+
+All miners are fetched concurrently over a pooled http client. Receipts are parsed while the CSV
+is streamed, and their signatures are verified in a process pool, off the event loop.
+
+Syncing is incremental: a cursor per miner remembers the newest partition (or receipt) synced and
+the ETag and Last-Modified of the file fetched last time, and receipts which are already stored are
+not verified again.
+
+Old receipts are deleted in bounded chunks, so that retention doesn't get slower as tables grow.
+"""
+
+import asyncio
+import csv
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+import httpx
+import pydantic
+from asgiref.sync import sync_to_async
+from compute_horde.receipts import (
+    RECEIPTS_PARTITION_PERIOD,
+    JobFinishedReceiptPayload,
+    JobStartedReceiptPayload,
+    Receipt,
+    ReceiptFetchError,
+    get_receipts_partition_name,
+    get_receipts_partition_start,
+    parse_receipt,
+    verify_receipts,
+)
+from django.conf import settings
+from django.utils.timezone import now
+
+from compute_horde_validator.validator.models import (
+    JobFinishedReceipt,
+    JobStartedReceipt,
+    MinerReceiptsCursor,
+    SystemEvent,
+)
+from compute_horde_validator.validator.utils import delete_in_chunks
+
+logger = logging.getLogger(__name__)
+
+RECEIPTS_FETCH_TIMEOUT = 5
+MAX_CONCURRENT_FETCHES = 64
+MAX_VERIFICATION_PROCESSES = 4
+# receipts may be written to the miner's CSV out of order, within this margin
+RECEIPTS_SYNC_TOLERANCE = timedelta(hours=1)
+# partitions fetched from a miner synced for the first time - miners serve a day of receipts
+RECEIPTS_PARTITIONS_LOOKBACK = timedelta(days=1)
+RECEIPTS_RETENTION_PERIOD = timedelta(days=7)
+# old receipts are deleted this many at a time, each chunk in a short transaction of its own
+RECEIPTS_DELETE_CHUNK_SIZE = 5_000
+
+
+class MinerAxon(NamedTuple):
+    hotkey: str
+    ip: str
+    port: int
+
+
+class MinerReceipts(NamedTuple):
+    receipts: list[Receipt]
+    etag: str
+    last_modified: str
+    # start of the newest partition fetched, None for the full receipts CSV
+    partition: datetime | None = None
+
+
+def get_receipt_timestamp(receipt: Receipt) -> datetime:
+    match receipt.payload:
+        case JobStartedReceiptPayload():
+            return receipt.payload.time_accepted
+        case JobFinishedReceiptPayload():
+            return receipt.payload.time_started
+    raise ValueError(f"Unknown receipt payload {receipt.payload!r}")
+
+
+async def _fetch_receipts_csv(
+    client: httpx.AsyncClient,
+    url: str,
+    miner: MinerAxon,
+    headers: dict[str, str],
+    since: datetime | None = None,
+) -> MinerReceipts | None:
+    receipts = []
+    async with client.stream("GET", url, headers=headers) as response:
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return None
+        response.raise_for_status()
+        header = None
+        async for line in response.aiter_lines():
+            if not line:
+                continue
+            row = next(csv.reader([line]))
+            if header is None:
+                header = row
+                continue
+            raw_receipt = dict(zip(header, row))
+            try:
+                receipt = parse_receipt(raw_receipt)
+            except (KeyError, ValueError, pydantic.ValidationError):
+                logger.warning(f"Miner sent invalid receipt {raw_receipt=}")
+                continue
+
+            if receipt.payload.miner_hotkey != miner.hotkey:
+                logger.warning(f"Miner sent receipt of a different miner {receipt=}")
+                continue
+
+            if since is not None and get_receipt_timestamp(receipt) < since:
+                continue
+
+            receipts.append(receipt)
+    return MinerReceipts(
+        receipts=receipts,
+        etag=response.headers.get("ETag", ""),
+        last_modified=response.headers.get("Last-Modified", ""),
+    )
+
+
+def _get_conditional_headers(cursor: MinerReceiptsCursor) -> dict[str, str]:
+    headers = {}
+    if cursor.etag:
+        headers["If-None-Match"] = cursor.etag
+    if cursor.last_modified:
+        headers["If-Modified-Since"] = cursor.last_modified
+    return headers
+
+
+async def _fetch_receipts_partitions(
+    client: httpx.AsyncClient, miner: MinerAxon, cursor: MinerReceiptsCursor | None
+) -> MinerReceipts | None:
+    """
+    Fetch the hourly partitions published since the last sync. The last partition synced is
+    fetched again if the miner appended to it since.
+    """
+    now_ = now()
+    partition = get_receipts_partition_start(now_ - RECEIPTS_PARTITIONS_LOOKBACK)
+    last_partition = None
+    if cursor is not None:
+        last_partition = cursor.last_partition_at
+        # receipts published before the full CSV was synced last time are in that CSV
+        synced_partition = last_partition or get_receipts_partition_start(cursor.updated_at)
+        partition = max(partition, synced_partition)
+
+    receipts = []
+    modified = False
+    while partition <= now_:
+        url = f"http://{miner.ip}:{miner.port}/receipts/{get_receipts_partition_name(partition)}"
+        headers = _get_conditional_headers(cursor) if partition == last_partition else {}
+        try:
+            partition_receipts = await _fetch_receipts_csv(client, url, miner, headers)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != httpx.codes.NOT_FOUND:
+                raise
+            # nothing was published in this period
+            partition_receipts = None
+        else:
+            if partition_receipts is not None:
+                receipts += partition_receipts.receipts
+                etag, last_modified = partition_receipts.etag, partition_receipts.last_modified
+                last_partition = partition
+                modified = True
+        partition += RECEIPTS_PARTITION_PERIOD
+
+    if not modified:
+        return None
+    return MinerReceipts(
+        receipts=receipts, etag=etag, last_modified=last_modified, partition=last_partition
+    )
+
+
+async def fetch_miner_receipts(
+    client: httpx.AsyncClient, miner: MinerAxon, cursor: MinerReceiptsCursor | None = None
+) -> MinerReceipts | None:
+    """
+    Fetch the receipts a miner published since the last sync, described by `cursor`. None is
+    returned if nothing changed since. Signatures are not verified.
+
+    Miners publish receipts in hourly partitions, and only the partitions which are new or were
+    appended to are downloaded. Miners which don't publish partitions serve a single CSV; it is
+    only downloaded if it changed, and receipts older than the newest one already synced are
+    skipped.
+    """
+    try:
+        miner_receipts = await _fetch_receipts_partitions(client, miner, cursor)
+        if miner_receipts is not None or (
+            cursor is not None and cursor.last_partition_at is not None
+        ):
+            return miner_receipts
+
+        headers = {}
+        since = None
+        if cursor is not None:
+            headers = _get_conditional_headers(cursor)
+            if cursor.last_receipt_at is not None:
+                since = cursor.last_receipt_at - RECEIPTS_SYNC_TOLERANCE
+        url = f"http://{miner.ip}:{miner.port}/receipts/receipts.csv"
+        return await _fetch_receipts_csv(client, url, miner, headers, since)
+    except httpx.HTTPError as e:
+        raise ReceiptFetchError("failed to get receipts from miner") from e
+
+
+def filter_known_receipts(receipts: list[Receipt]) -> list[Receipt]:
+    """
+    Drop the receipts which are already stored, so that their signatures are not verified again.
+    """
+    started_uuids = [
+        receipt.payload.job_uuid
+        for receipt in receipts
+        if isinstance(receipt.payload, JobStartedReceiptPayload)
+    ]
+    finished_uuids = [
+        receipt.payload.job_uuid
+        for receipt in receipts
+        if isinstance(receipt.payload, JobFinishedReceiptPayload)
+    ]
+    known_started_uuids = {
+        str(job_uuid)
+        for job_uuid in JobStartedReceipt.objects.filter(job_uuid__in=started_uuids).values_list(
+            "job_uuid", flat=True
+        )
+    }
+    known_finished_uuids = {
+        str(job_uuid)
+        for job_uuid in JobFinishedReceipt.objects.filter(job_uuid__in=finished_uuids).values_list(
+            "job_uuid", flat=True
+        )
+    }
+    return [
+        receipt
+        for receipt in receipts
+        if not (
+            isinstance(receipt.payload, JobStartedReceiptPayload)
+            and receipt.payload.job_uuid in known_started_uuids
+        )
+        and not (
+            isinstance(receipt.payload, JobFinishedReceiptPayload)
+            and receipt.payload.job_uuid in known_finished_uuids
+        )
+    ]
+
+
+def store_miner_receipts(hotkey: str, receipts: list[Receipt]) -> None:
+    tolerance = RECEIPTS_SYNC_TOLERANCE
+
+    latest_job_started_receipt = (
+        JobStartedReceipt.objects.filter(miner_hotkey=hotkey).order_by("-time_accepted").first()
+    )
+    job_started_receipt_cutoff_time = (
+        latest_job_started_receipt.time_accepted - tolerance if latest_job_started_receipt else None
+    )
+    job_started_receipt_to_create = [
+        JobStartedReceipt(
+            job_uuid=receipt.payload.job_uuid,
+            miner_hotkey=receipt.payload.miner_hotkey,
+            validator_hotkey=receipt.payload.validator_hotkey,
+            executor_class=receipt.payload.executor_class,
+            time_accepted=receipt.payload.time_accepted,
+            max_timeout=receipt.payload.max_timeout,
+        )
+        for receipt in receipts
+        if isinstance(receipt.payload, JobStartedReceiptPayload)
+        and (
+            job_started_receipt_cutoff_time is None
+            or receipt.payload.time_accepted > job_started_receipt_cutoff_time
+        )
+    ]
+    logger.debug(f"Creating {len(job_started_receipt_to_create)} JobStartedReceipt. {hotkey=}")
+    JobStartedReceipt.objects.bulk_create(job_started_receipt_to_create, ignore_conflicts=True)
+
+    latest_job_finished_receipt = (
+        JobFinishedReceipt.objects.filter(miner_hotkey=hotkey).order_by("-time_started").first()
+    )
+    job_finished_receipt_cutoff_time = (
+        latest_job_finished_receipt.time_started - tolerance
+        if latest_job_finished_receipt
+        else None
+    )
+    job_finished_receipt_to_create = [
+        JobFinishedReceipt(
+            job_uuid=receipt.payload.job_uuid,
+            miner_hotkey=receipt.payload.miner_hotkey,
+            validator_hotkey=receipt.payload.validator_hotkey,
+            time_started=receipt.payload.time_started,
+            time_took_us=receipt.payload.time_took_us,
+            score_str=receipt.payload.score_str,
+        )
+        for receipt in receipts
+        if isinstance(receipt.payload, JobFinishedReceiptPayload)
+        and (
+            job_finished_receipt_cutoff_time is None
+            or receipt.payload.time_started > job_finished_receipt_cutoff_time
+        )
+    ]
+    logger.debug(f"Creating {len(job_finished_receipt_to_create)} JobFinishedReceipt. {hotkey=}")
+    JobFinishedReceipt.objects.bulk_create(job_finished_receipt_to_create, ignore_conflicts=True)
+
+
+def update_receipts_cursor(
+    hotkey: str, miner_receipts: MinerReceipts, cursor: MinerReceiptsCursor | None
+) -> None:
+    last_receipt_at = cursor.last_receipt_at if cursor is not None else None
+    for receipt in miner_receipts.receipts:
+        timestamp = get_receipt_timestamp(receipt)
+        if last_receipt_at is None or timestamp > last_receipt_at:
+            last_receipt_at = timestamp
+    MinerReceiptsCursor.objects.update_or_create(
+        miner_hotkey=hotkey,
+        defaults={
+            "etag": miner_receipts.etag,
+            "last_modified": miner_receipts.last_modified,
+            "last_receipt_at": last_receipt_at,
+            "last_partition_at": miner_receipts.partition,
+        },
+    )
+
+
+def _save_receipt_fetch_error(miner: MinerAxon, exc: Exception) -> None:
+    comment = f"Failed to fetch receipts from miner {miner.hotkey} {miner.ip}:{miner.port}: {exc!r}"
+    logger.warning(comment)
+    SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).create(
+        type=SystemEvent.EventType.RECEIPT_FAILURE,
+        subtype=SystemEvent.EventSubType.RECEIPT_FETCH_ERROR,
+        long_description=comment,
+        data={"miner_hotkey": miner.hotkey, "miner_ip": miner.ip, "miner_port": miner.port},
+    )
+
+
+async def _collect_miner_receipts(
+    client: httpx.AsyncClient,
+    executor: Executor,
+    semaphore: asyncio.Semaphore,
+    miner: MinerAxon,
+) -> dict[str, float] | None:
+    start = time.monotonic()
+    try:
+        cursor = await MinerReceiptsCursor.objects.filter(miner_hotkey=miner.hotkey).afirst()
+        async with semaphore:
+            miner_receipts = await fetch_miner_receipts(client, miner, cursor)
+        fetch_time = time.monotonic() - start
+        if miner_receipts is None:
+            return {
+                "receipts": 0,
+                "not_modified": True,
+                "fetch_time": fetch_time,
+                "total_time": fetch_time,
+                "receipts_per_second": 0.0,
+            }
+
+        new_receipts = await sync_to_async(filter_known_receipts)(miner_receipts.receipts)
+        loop = asyncio.get_running_loop()
+        receipts = await loop.run_in_executor(executor, verify_receipts, new_receipts)
+        await sync_to_async(store_miner_receipts)(miner.hotkey, receipts)
+        await sync_to_async(update_receipts_cursor)(miner.hotkey, miner_receipts, cursor)
+    except Exception as exc:
+        await sync_to_async(_save_receipt_fetch_error)(miner, exc)
+        return None
+
+    total_time = time.monotonic() - start
+    return {
+        "receipts": len(receipts),
+        "known_receipts": len(miner_receipts.receipts) - len(new_receipts),
+        "fetch_time": fetch_time,
+        "total_time": total_time,
+        "receipts_per_second": len(receipts) / total_time if total_time else 0.0,
+    }
+
+
+async def collect_receipts(miners: list[MinerAxon], executor: Executor | None = None) -> None:
+    """
+    Fetch, verify and store the receipts of all `miners`. The throughput of each miner, and of the
+    whole collection, is reported as a telemetry system event.
+    """
+    start = time.monotonic()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    limits = httpx.Limits(max_connections=MAX_CONCURRENT_FETCHES)
+    own_executor = None
+    if executor is None:
+        # spawn instead of fork - we are called from a process with open db connections and threads
+        executor = own_executor = ProcessPoolExecutor(
+            max_workers=MAX_VERIFICATION_PROCESSES, mp_context=multiprocessing.get_context("spawn")
+        )
+    try:
+        async with httpx.AsyncClient(
+            limits=limits, timeout=RECEIPTS_FETCH_TIMEOUT, follow_redirects=True
+        ) as client:
+            results = await asyncio.gather(
+                *[_collect_miner_receipts(client, executor, semaphore, miner) for miner in miners]
+            )
+    finally:
+        if own_executor is not None:
+            own_executor.shutdown(cancel_futures=True)
+
+    per_miner = {
+        miner.hotkey: result for miner, result in zip(miners, results) if result is not None
+    }
+    total_receipts = sum(result["receipts"] for result in per_miner.values())
+    total_time = time.monotonic() - start
+    logger.info(
+        "Collected %d receipts from %d/%d miners in %.2fs",
+        total_receipts,
+        len(per_miner),
+        len(miners),
+        total_time,
+    )
+    await SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).acreate(
+        type=SystemEvent.EventType.VALIDATOR_TELEMETRY,
+        subtype=SystemEvent.EventSubType.RECEIPT_FETCH,
+        long_description="receipts collection telemetry",
+        data={
+            "miners": len(miners),
+            "miners_succeeded": len(per_miner),
+            "receipts": total_receipts,
+            "total_time": total_time,
+            "receipts_per_second": total_receipts / total_time if total_time else 0.0,
+            "per_miner": per_miner,
+        },
+    )
+
+
+def delete_old_receipts() -> int:
+    """
+    Delete the receipts older than the retention period. Returns the number of deleted receipts.
+    """
+    cutoff = now() - RECEIPTS_RETENTION_PERIOD
+    return delete_in_chunks(
+        JobStartedReceipt.objects.filter(time_accepted__lt=cutoff), RECEIPTS_DELETE_CHUNK_SIZE
+    ) + delete_in_chunks(
+        JobFinishedReceipt.objects.filter(time_started__lt=cutoff), RECEIPTS_DELETE_CHUNK_SIZE
+    )
@@ -1,3 +1,4 @@
+import asyncio
 import functools
 import logging
 
@@ -62,8 +63,47 @@ def download_prompts_from_s3_url(s3_url: str) -> list[str]:
     return response.text.splitlines()
 
 
-async def download_file_content(s3_url: str) -> bytes:
-    async with httpx.AsyncClient() as client:
-        response = await client.get(s3_url, timeout=5)
-        response.raise_for_status()
-        return response.content
+_DOWNLOAD_TIMEOUT = 5
+_DOWNLOAD_ATTEMPTS = 3
+_DOWNLOAD_RETRY_DELAY = 0.5
+
+
+def create_download_client(max_connections: int = 100) -> httpx.AsyncClient:
+    """
+    Create a pooled client to be shared by many concurrent downloads.
+
+    At most `max_connections` downloads run at the same time, the rest wait for a free
+    connection - only the download itself is time limited, not waiting for the pool.
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+        timeout=httpx.Timeout(_DOWNLOAD_TIMEOUT, pool=None),
+    )
+
+
+def _is_retryable(exc: httpx.HTTPError) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+async def download_file_content(s3_url: str, client: httpx.AsyncClient | None = None) -> bytes:
+    if client is None:
+        async with create_download_client() as client:
+            return await download_file_content(s3_url, client)
+
+    attempt = 1
+    while True:
+        try:
+            response = await client.get(s3_url)
+            response.raise_for_status()
+            return response.content
+        except httpx.HTTPError as exc:
+            if attempt >= _DOWNLOAD_ATTEMPTS or not _is_retryable(exc):
+                raise
+            logger.info("Failed to download %s (attempt %d): %r", s3_url, attempt, exc)
+            await asyncio.sleep(_DOWNLOAD_RETRY_DELAY * attempt)
+            attempt += 1
@@ -1,3 +1,5 @@
+import hashlib
+import json
 import logging
 from collections import defaultdict
 from functools import partial
@@ -5,8 +7,10 @@ from functools import partial
 import numpy as np
 from compute_horde.executor_class import ExecutorClass
 from django.conf import settings
+from django.db.models import Count, Sum
 
 from .dynamic_config import get_executor_class_weights
+from .models import SyntheticJob, SyntheticJobBatch
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +53,26 @@ def horde_score(benchmarks, alpha=0, beta=0, delta=0):
     return scaled_avg_benchmark * sum_agent * scaled_inverted_n
 
 
+def horde_scores(score_sums, job_counts, alpha=0, beta=0, delta=0):
+    """`horde_score` as array operations, over the sum and the count of each horde's benchmarks"""
+    inverted_n = 1 / job_counts
+    avg_benchmark = score_sums * inverted_n
+    scaled_inverted_n = reversed_sigmoid(inverted_n, beta=10**beta, delta=delta)
+    scaled_avg_benchmark = avg_benchmark**alpha
+    return scaled_avg_benchmark * score_sums * scaled_inverted_n
+
+
+def _horde_score_params():
+    return dict(
+        # scaling factor for avg_score of a horde - best in range [0, 1] (0 means no effect on score)
+        alpha=settings.HORDE_SCORE_AVG_PARAM,
+        # sigmoid steepnes param - best in range [0, 5] (0 means no effect on score)
+        beta=settings.HORDE_SCORE_SIZE_PARAM,
+        # horde size for 0.5 value of sigmoid - sigmoid is for 1 / horde_size
+        delta=1 / settings.HORDE_SCORE_CENTRAL_SIZE_PARAM,
+    )
+
+
 def score_jobs(jobs, score_aggregation=sum, normalization_weight=1):
     batch_scores = defaultdict(list)
     score_per_hotkey = {}
@@ -67,15 +91,7 @@ def score_batch(batch):
         if job.executor_class in executor_class_weights:
             executor_class_jobs[job.executor_class].append(job)
 
-    parametriezed_horde_score = partial(
-        horde_score,
-        # scaling factor for avg_score of a horde - best in range [0, 1] (0 means no effect on score)
-        alpha=settings.HORDE_SCORE_AVG_PARAM,
-        # sigmoid steepnes param - best in range [0, 5] (0 means no effect on score)
-        beta=settings.HORDE_SCORE_SIZE_PARAM,
-        # horde size for 0.5 value of sigmoid - sigmoid is for 1 / horde_size
-        delta=1 / settings.HORDE_SCORE_CENTRAL_SIZE_PARAM,
-    )
+    parametriezed_horde_score = partial(horde_score, **_horde_score_params())
     batch_scores = defaultdict(float)
     for executor_class, jobs in executor_class_jobs.items():
         executor_class_weight = executor_class_weights[executor_class]
@@ -101,3 +117,97 @@ def score_batches(batches):
         for hotkey, score in batch_scores.items():
             hotkeys_scores[hotkey] += score
     return hotkeys_scores
+
+
+def score_batches_aggregated(batches):
+    """
+    Same as `score_batches`, but the job scores are summed up per batch, executor class and miner
+    in the database, and the rest is computed with array operations over these sums.
+
+    The results only differ from `score_batches` by the order in which floats are summed up.
+    """
+    executor_class_weights = get_executor_class_weights()
+    batch_positions = {batch.id: position for position, batch in enumerate(batches)}
+    rows = list(
+        SyntheticJob.objects.filter(
+            batch_id__in=batch_positions.keys(),
+            executor_class__in=executor_class_weights.keys(),
+        )
+        .values("batch_id", "executor_class", "miner__hotkey")
+        .annotate(score_sum=Sum("score"), job_count=Count("id"))
+        .order_by("batch_id", "executor_class", "miner__hotkey")
+    )
+    if not rows:
+        return {}
+
+    # one group per batch and executor class, scores are normalized within a group
+    groups: dict[tuple[int, str], int] = {}
+    group_indices = np.array(
+        [groups.setdefault((row["batch_id"], row["executor_class"]), len(groups)) for row in rows]
+    )
+    hotkeys, hotkey_indices = np.unique([row["miner__hotkey"] for row in rows], return_inverse=True)
+    score_sums = np.array([row["score_sum"] for row in rows], dtype=np.float64)
+    job_counts = np.array([row["job_count"] for row in rows], dtype=np.int64)
+    weights = np.array([executor_class_weights[row["executor_class"]] for row in rows])
+    is_horde = np.array(
+        [row["executor_class"] == ExecutorClass.spin_up_4min__gpu_24gb for row in rows]
+    )
+
+    aggregated_scores = score_sums.copy()
+    aggregated_scores[is_horde] = horde_scores(
+        score_sums[is_horde], job_counts[is_horde], **_horde_score_params()
+    )
+
+    # np.bincount adds up in order, like the sum() in normalize()
+    totals = np.bincount(group_indices, weights=aggregated_scores)[group_indices]
+    normalized_scores = np.divide(
+        weights * aggregated_scores,
+        totals,
+        out=aggregated_scores.copy(),
+        where=totals != 0,
+    )
+
+    # sum up per batch first, then across batches, like score_batches()
+    batch_scores = np.zeros((len(batches), len(hotkeys)))
+    np.add.at(
+        batch_scores,
+        ([batch_positions[row["batch_id"]] for row in rows], hotkey_indices),
+        normalized_scores,
+    )
+    hotkey_scores = batch_scores.sum(axis=0)
+    return {str(hotkey): float(score) for hotkey, score in zip(hotkeys, hotkey_scores)}
+
+
+def scoring_params_fingerprint() -> str:
+    """Changes whenever any of the parameters which batch scores depend on change"""
+    params = {
+        "executor_class_weights": sorted(get_executor_class_weights().items()),
+        **_horde_score_params(),
+    }
+    return hashlib.sha256(json.dumps(params).encode()).hexdigest()
+
+
+def get_batch_scores(batch: SyntheticJobBatch, fingerprint: str | None = None) -> dict[str, float]:
+    """
+    Scores of the miners in `batch`, computed once and cached on the batch,
+    until the scoring parameters change.
+    """
+    if fingerprint is None:
+        fingerprint = scoring_params_fingerprint()
+    if batch.scores is not None and batch.scores_fingerprint == fingerprint:
+        return batch.scores
+
+    batch.scores = score_batches_aggregated([batch])
+    batch.scores_fingerprint = fingerprint
+    batch.save(update_fields=["scores", "scores_fingerprint"])
+    return batch.scores
+
+
+def score_batches_cached(batches):
+    """Same as `score_batches`, from the cached scores of each batch"""
+    fingerprint = scoring_params_fingerprint()
+    hotkeys_scores = defaultdict(float)
+    for batch in batches:
+        for hotkey, score in get_batch_scores(batch, fingerprint).items():
+            hotkeys_scores[hotkey] += score
+    return hotkeys_scores
@@ -1,16 +1,19 @@
 import asyncio
+import itertools
 import logging
 import random
 import statistics
 import time
 import uuid
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from functools import partial
+from typing import Any, NamedTuple
 
 import bittensor
+import httpx
 from asgiref.sync import sync_to_async
 from channels.layers import get_channel_layer
 from compute_horde.base.output_upload import OutputUpload
@@ -47,27 +50,40 @@ from compute_horde.mv_protocol.validator_requests import (
     V0JobRequest,
     V0JobStartedReceiptRequest,
 )
+from compute_horde.receipts import sign_receipts_batch
 from compute_horde.transport import AbstractTransport, WSTransport
 from django.conf import settings
 from django.db import transaction
+from django.db.models.functions import Mod
 from pydantic import BaseModel
 
-from compute_horde_validator.validator.dynamic_config import get_miner_max_executors_per_class
+from compute_horde_validator.validator.dynamic_config import (
+    aget_config,
+    aget_weights_version,
+    get_miner_max_executors_per_class,
+)
 from compute_horde_validator.validator.models import (
     JobFinishedReceipt,
     JobStartedReceipt,
     Miner,
     MinerManifest,
+    PregeneratedHashcatJob,
     PromptSample,
     SyntheticJob,
     SyntheticJobBatch,
     SystemEvent,
 )
+from compute_horde_validator.validator.s3 import create_download_client
+from compute_horde_validator.validator.scoring import get_batch_scores
 from compute_horde_validator.validator.synthetic_jobs.generator import current
 from compute_horde_validator.validator.synthetic_jobs.generator.base import (
     BaseSyntheticJobGenerator,
 )
+from compute_horde_validator.validator.synthetic_jobs.hashcat_jobs import (
+    MINER_BOUND_WEIGHTS_VERSIONS,
+)
 from compute_horde_validator.validator.synthetic_jobs.scoring import get_manifest_multiplier
+from compute_horde_validator.validator.synthetic_jobs.sharding import BatchShard
 from compute_horde_validator.validator.utils import MACHINE_SPEC_CHANNEL
 
 logger = logging.getLogger(__name__)
@@ -82,8 +98,23 @@ _MIN_SPIN_UP_TIME = 2
 
 _CLOSE_TIMEOUT = 1
 _SEND_RECEIPT_TIMEOUT = 5
+# job finished receipts are sent to all miners concurrently,
+# with a single deadline for the whole stage
+_SEND_JOB_FINISHED_RECEIPTS_TIMEOUT = 30
 _SEND_MACHINE_SPECS_TIMEOUT = 5
 
+# system events are written to the database in the background, in batches
+# of up to _SYSTEM_EVENTS_WRITE_BATCH_SIZE, at least every
+# _SYSTEM_EVENTS_WRITE_INTERVAL seconds. stage checkpoints wait for the
+# writer to catch up once there are _SYSTEM_EVENTS_MAX_PENDING unwritten events
+_SYSTEM_EVENTS_WRITE_BATCH_SIZE = 1000
+_SYSTEM_EVENTS_WRITE_INTERVAL = 1
+_SYSTEM_EVENTS_MAX_PENDING = 10_000
+
+# llm prompt answers are downloaded as soon as each job finishes,
+# through one pooled client shared by the whole batch
+_LLM_PROMPT_ANSWERS_MAX_CONCURRENT_DOWNLOADS = 32
+
 # extra time to wait for a job response, so we can record the
 # responses of slow executors.
 # it is not taken into account when scoring, jobs will still
@@ -215,6 +246,112 @@ class MinerClient(AbstractMinerClient):
         )
 
 
+class SystemEventRecord(NamedTuple):
+    # lightweight stand-in for a SystemEvent model instance, building model
+    # instances is comparatively slow, so they are only created in bulk when
+    # the events are persisted
+    type: SystemEvent.EventType
+    subtype: SystemEvent.EventSubType
+    long_description: str
+    data: dict[str, Any]
+
+    def to_system_event(self) -> SystemEvent:
+        return SystemEvent(
+            type=self.type,
+            subtype=self.subtype,
+            long_description=self.long_description,
+            data=self.data,
+        )
+
+
+class SystemEventWriter:
+    def __init__(self) -> None:
+        self.pending: list[SystemEventRecord] = []
+        self._wakeup = asyncio.Event()
+        self._written = asyncio.Event()
+        self._closing = False
+        self._task: asyncio.Task | None = None
+        # while paused, events are only written if too many are pending
+        self.paused = False
+
+    def start(self) -> None:
+        assert self._task is None
+        self._task = asyncio.create_task(self._run(), name="SystemEventWriter._run")
+
+    def append(self, event: SystemEventRecord) -> None:
+        # called from the hot path, never blocks
+        self.pending.append(event)
+        if len(self.pending) >= _SYSTEM_EVENTS_WRITE_BATCH_SIZE:
+            self._wakeup.set()
+
+    async def put(self, event: SystemEventRecord) -> None:
+        # backpressure: wait for the writer if it fell too far behind
+        while len(self.pending) >= _SYSTEM_EVENTS_MAX_PENDING and self._is_running():
+            self._written.clear()
+            self._wakeup.set()
+            await self._written.wait()
+        self.append(event)
+
+    async def close(self) -> None:
+        # final flush, whatever is still pending after this is lost
+        self._closing = True
+        self._wakeup.set()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+        await self._write()
+
+    def _is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def _run(self) -> None:
+        while not self._closing:
+            try:
+                async with asyncio.timeout(_SYSTEM_EVENTS_WRITE_INTERVAL):
+                    await self._wakeup.wait()
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            if self.paused and len(self.pending) < _SYSTEM_EVENTS_MAX_PENDING:
+                continue
+            await self._write()
+
+    async def _write(self) -> None:
+        while self.pending:
+            events = self.pending[:_SYSTEM_EVENTS_WRITE_BATCH_SIZE]
+            del self.pending[: len(events)]
+            written = await _db_persist_system_events(events)
+            self._written.set()
+            if not written:
+                # retry on the next round
+                self.pending[:0] = events
+                return
+
+
+class JobResult(NamedTuple):
+    # everything needed to persist a job, picklable so that
+    # sharded batches can ship it back to the coordinating process
+    uuid: str
+    miner_hotkey: str
+    executor_class: ExecutorClass
+    success: bool
+    comment: str
+    job_description: str
+    score: float
+    prompt_sample: PromptSample | None
+    job_started_receipt: V0JobStartedReceiptRequest | None
+    job_finished_receipt: V0JobFinishedReceiptRequest | None
+
+
+@dataclass
+class BatchResult:
+    started_at: datetime
+    accepting_results_until: datetime
+    jobs: list[JobResult]
+    # miner.hotkey as key
+    manifests: dict[str, ExecutorManifest | None]
+    online_executor_count: dict[str, int]
+
+
 @dataclass
 class ExceptionInfo:
     exception: BaseException
@@ -236,6 +373,11 @@ class Job:
     volume: Volume | None
     output_upload: OutputUpload | None
 
+    # requests, serialized when the job is generated so that sending
+    # them after the start barrier is just a write to the socket
+    initial_job_request_json: str = ""
+    job_request_json: str = ""
+
     # responses
 
     exception: BaseException | None = None
@@ -244,6 +386,7 @@ class Job:
     exception_stage: str | None = None
 
     accept_barrier_time: datetime | None = None
+    accept_planned_send_time: datetime | None = None
     accept_before_sent_time: datetime | None = None
     accept_after_sent_time: datetime | None = None
     accept_response: V0AcceptJobRequest | V0DeclineJobRequest | None = None
@@ -255,11 +398,15 @@ class Job:
     executor_response_event: asyncio.Event = field(default_factory=asyncio.Event)
 
     job_barrier_time: datetime | None = None
+    job_planned_send_time: datetime | None = None
     job_before_sent_time: datetime | None = None
     job_after_sent_time: datetime | None = None
     job_response: V0JobFailedRequest | V0JobFinishedRequest | None = None
     job_response_time: datetime | None = None
     job_response_event: asyncio.Event = field(default_factory=asyncio.Event)
+    # set if the job is scored as soon as its response arrives
+    score_task: asyncio.Task | None = None
+    llm_prompt_answers_download_time: timedelta | None = None
 
     machine_specs: V0MachineSpecsRequest | None = None
 
@@ -311,6 +458,17 @@ class Job:
                     self.job_response = msg
                     self.job_response_time = datetime.now(tz=UTC)
                     self.job_response_event.set()
+                    # score the job right away, instead of waiting for all the other
+                    # jobs. this needs the job request to be already sent, and the
+                    # send time bonus needs the average send time of all the jobs
+                    if (
+                        not _GIVE_AVERAGE_JOB_SEND_TIME_BONUS
+                        and self.job_before_sent_time is not None
+                    ):
+                        self.score_task = asyncio.create_task(
+                            _score_job_on_response(self.ctx, self),
+                            name=f"{self.uuid}._score_job_on_response",
+                        )
                 else:
                     duplicate = True
 
@@ -330,7 +488,7 @@ class Job:
         description: str,
         func: str | None = None,
         data: dict[str, str] | None = None,
-    ) -> SystemEvent | None:
+    ) -> SystemEventRecord | None:
         return self.ctx.system_event(
             type=type,
             subtype=subtype,
@@ -341,7 +499,7 @@ class Job:
             func=func,
         )
 
-    def emit_telemetry_event(self) -> SystemEvent | None:
+    def emit_telemetry_event(self) -> SystemEventRecord | None:
         data = dict(
             job_uuid=self.uuid,
             miner_hotkey=self.miner_hotkey,
@@ -355,6 +513,7 @@ class Job:
             exception_time=_datetime_dump(self.exception_time),
             exception_stage=self.exception_stage,
             accept_barrier_time=_datetime_dump(self.accept_barrier_time),
+            accept_planned_send_time=_datetime_dump(self.accept_planned_send_time),
             accept_before_sent_time=_datetime_dump(self.accept_before_sent_time),
             accept_after_sent_time=_datetime_dump(self.accept_after_sent_time),
             accept_response=_model_dump(self.accept_response),
@@ -362,10 +521,12 @@ class Job:
             executor_response=_model_dump(self.executor_response),
             executor_response_time=_datetime_dump(self.executor_response_time),
             job_barrier_time=_datetime_dump(self.job_barrier_time),
+            job_planned_send_time=_datetime_dump(self.job_planned_send_time),
             job_before_sent_time=_datetime_dump(self.job_before_sent_time),
             job_after_sent_time=_datetime_dump(self.job_after_sent_time),
             job_response=_model_dump(self.job_response),
             job_response_time=_datetime_dump(self.job_response_time),
+            llm_prompt_answers_download_time=_timedelta_dump(self.llm_prompt_answers_download_time),
             machine_specs=_model_dump(self.machine_specs),
             time_took=_timedelta_dump(self.time_took),
             success=self.success,
@@ -408,6 +569,8 @@ class BatchContext:
 
     manifests: dict[str, ExecutorManifest | None]
     manifest_events: dict[str, asyncio.Event]
+    # started at the very beginning of the batch, see _start_connecting()
+    connect_tasks: dict[str, asyncio.Task[bool]]
 
     # randomized, but order preserving list of job.uuid
     # used to go from indices returned by asyncio.gather() back to job.uuid
@@ -416,16 +579,22 @@ class BatchContext:
     # job.uuid as key
     jobs: dict[str, Job]
 
+    # shared by all llm prompt answers downloads
+    download_client: httpx.AsyncClient
+
     # telemetry
 
-    # system events, periodically flushed to database, which is why
-    # we need a separate event_count field to track how many we
+    # system events, written to the database in the background, which
+    # is why we need a separate event_count field to track how many we
     # created during a batch run
-    events: list[SystemEvent]
+    event_writer: SystemEventWriter
     event_count: int
 
     stage_start_time: dict[str, datetime]
     average_job_send_time: timedelta | None = None
+    # set when this batch run is one shard of a sharded batch
+    shard: BatchShard | None = None
+    send_skew: dict[str, dict[str, float] | None] | None = None
 
     # for tests
     _loop: asyncio.AbstractEventLoop | None = None
@@ -441,7 +610,7 @@ class BatchContext:
         miner_hotkey: str | None = None,
         func: str | None = None,
         append: bool = True,
-    ) -> SystemEvent | None:
+    ) -> SystemEventRecord | None:
         if data is None:
             data = {}
 
@@ -461,25 +630,22 @@ class BatchContext:
             data["func"] = func
 
         try:
-            event = SystemEvent(
+            event = SystemEventRecord(
                 type=type,
                 subtype=subtype,
                 long_description=description,
                 data=data,
             )
-            # checkpoint events are sent directly to the database,
-            # don't append them to avoid duplication
+            # checkpoint events are queued by the caller, with backpressure
             if append:
-                self.events.append(event)
+                self.event_writer.append(event)
             self.event_count += 1
             return event
         except Exception as exc:
             logger.error("Failed to emit system event: %r", exc)
             return None
 
-    # sync_to_async is needed since we use the sync Django ORM
-    @sync_to_async
-    def checkpoint_system_event(self, stage: str, *, dt: datetime | None = None) -> None:
+    async def checkpoint_system_event(self, stage: str, *, dt: datetime | None = None) -> None:
         try:
             if dt is None:
                 dt = datetime.now(tz=UTC)
@@ -497,11 +663,11 @@ class BatchContext:
                 append=False,
             )
             if event is not None:
-                event.save()
+                await self.event_writer.put(event)
         except Exception as exc:
             logger.error("Failed to checkpoint system event: %r", exc)
 
-    def emit_telemetry_event(self) -> SystemEvent | None:
+    def emit_telemetry_event(self) -> SystemEventRecord | None:
         messages_count: dict[str, int] = defaultdict(int)
         for job in self.jobs.values():
             for msg in (
@@ -549,6 +715,7 @@ class BatchContext:
                 stage: _datetime_dump(dt) for stage, dt in self.stage_start_time.items()
             },
             average_job_send_time=_timedelta_dump(self.average_job_send_time),
+            send_skew=self.send_skew,
             counts=counts,
             manifests=manifests,
         )
@@ -604,6 +771,7 @@ def _init_context(
     serving_miners: list[Miner],
     batch_id: int | None = None,
     create_miner_client: Callable | None = None,
+    shard: BatchShard | None = None,
 ) -> BatchContext:
     own_wallet = settings.BITTENSOR_WALLET()
     own_keypair = own_wallet.get_hotkey()
@@ -624,13 +792,19 @@ def _init_context(
         previous_online_executor_count={},
         manifests={},
         manifest_events={},
+        connect_tasks={},
         job_uuids=[],
         jobs={},
-        events=[],
+        download_client=create_download_client(
+            max_connections=_LLM_PROMPT_ANSWERS_MAX_CONCURRENT_DOWNLOADS
+        ),
+        event_writer=SystemEventWriter(),
         event_count=0,
         stage_start_time={},
+        shard=shard,
         _loop=asyncio.get_running_loop(),
     )
+    ctx.event_writer.start()
 
     for miner in serving_miners:
         hotkey = miner.hotkey
@@ -692,8 +866,7 @@ def _generate_job_started_receipt(ctx: BatchContext, job: Job) -> None:
     )
 
 
-def _generate_job_finished_receipt(ctx: BatchContext, job: Job) -> None:
-    assert job.job_finished_receipt is None
+def _get_job_finished_receipt_payload(ctx: BatchContext, job: Job) -> JobFinishedReceiptPayload:
     assert job.job_before_sent_time is not None
 
     if not job.success:
@@ -704,7 +877,7 @@ def _generate_job_finished_receipt(ctx: BatchContext, job: Job) -> None:
     else:
         time_took_sec = 0
 
-    payload = JobFinishedReceiptPayload(
+    return JobFinishedReceiptPayload(
         job_uuid=job.uuid,
         miner_hotkey=job.miner_hotkey,
         validator_hotkey=ctx.own_keypair.ss58_address,
@@ -712,32 +885,73 @@ def _generate_job_finished_receipt(ctx: BatchContext, job: Job) -> None:
         time_took_us=int(time_took_sec * 1_000_000),
         score_str=f"{job.score:.6g}",
     )
+
+
+def _generate_job_finished_receipt(ctx: BatchContext, job: Job) -> None:
+    assert job.job_finished_receipt is None
+
+    payload = _get_job_finished_receipt_payload(ctx, job)
     job.job_finished_receipt = V0JobFinishedReceiptRequest(
         payload=payload,
         signature=f"0x{ctx.own_keypair.sign(payload.blob_for_signing()).hex()}",
     )
 
 
+def _generate_job_finished_receipts_batch(ctx: BatchContext, jobs: list[Job]) -> None:
+    # one signature of the Merkle root of all the receipts, instead of one per receipt
+    payloads: list[tuple[Job, JobFinishedReceiptPayload]] = []
+    for job in jobs:
+        try:
+            payloads.append((job, _get_job_finished_receipt_payload(ctx, job)))
+        except Exception as exc:
+            _job_finished_receipt_failure(job, exc)
+    if not payloads:
+        return
+
+    signatures = sign_receipts_batch(ctx.own_keypair, [payload for _, payload in payloads])
+    for (job, payload), signature in zip(payloads, signatures):
+        job.job_finished_receipt = V0JobFinishedReceiptRequest(payload=payload, signature=signature)
+
+
+async def _connect_client(ctx: BatchContext, miner_hotkey: str) -> bool:
+    client = ctx.clients[miner_hotkey]
+
+    try:
+        async with asyncio.timeout(_GET_MANIFEST_TIMEOUT):
+            await client.connect()
+    except TransportConnectionError as exc:
+        name = ctx.names[miner_hotkey]
+        logger.warning("%s connection error: %r", name, exc)
+        ctx.system_event(
+            type=SystemEvent.EventType.MINER_SYNTHETIC_JOB_FAILURE,
+            subtype=SystemEvent.EventSubType.MINER_CONNECTION_ERROR,
+            description=repr(exc),
+            miner_hotkey=miner_hotkey,
+            func="connect",
+        )
+        return False
+    return True
+
+
+def _start_connecting(ctx: BatchContext) -> None:
+    # open and authenticate all miner connections in the background, while
+    # the batch is still preparing, so that the manifests (which miners send
+    # right after authentication) are already on their way once we need them
+    for miner_hotkey in ctx.hotkeys:
+        ctx.connect_tasks[miner_hotkey] = asyncio.create_task(
+            _connect_client(ctx, miner_hotkey),
+            name=f"{miner_hotkey}._connect_client",
+        )
+
+
 async def _get_miner_manifest(
     ctx: BatchContext, start_barrier: asyncio.Barrier, miner_hotkey: str
 ) -> None:
     await start_barrier.wait()
 
-    client = ctx.clients[miner_hotkey]
-
     async with asyncio.timeout(_GET_MANIFEST_TIMEOUT):
-        try:
-            await client.connect()
-        except TransportConnectionError as exc:
-            name = ctx.names[miner_hotkey]
-            logger.warning("%s connection error: %r", name, exc)
-            ctx.system_event(
-                type=SystemEvent.EventType.MINER_SYNTHETIC_JOB_FAILURE,
-                subtype=SystemEvent.EventSubType.MINER_CONNECTION_ERROR,
-                description=repr(exc),
-                miner_hotkey=miner_hotkey,
-                func="connect",
-            )
+        connected = await ctx.connect_tasks[miner_hotkey]
+        if not connected:
             return
 
         await ctx.manifest_events[miner_hotkey].wait()
@@ -777,8 +991,14 @@ async def get_llm_prompt_samples(ctx: BatchContext) -> list[PromptSample] | None
         .filter(
             synthetic_job__isnull=True,
             workload__finished_at__isnull=False,
-        )[:llm_executor_count]
+        )
     )
+    if ctx.shard is not None:
+        # shards pick from disjoint sets of samples, so that no sample is used twice
+        prompt_samples = prompt_samples.alias(shard_index=Mod("id", ctx.shard.count)).filter(
+            shard_index=ctx.shard.index
+        )
+    prompt_samples = prompt_samples[:llm_executor_count]
     prompt_samples = [ps async for ps in prompt_samples]
     if len(prompt_samples) < llm_executor_count:
         ctx.system_event(
@@ -800,7 +1020,115 @@ async def get_llm_prompt_samples(ctx: BatchContext) -> list[PromptSample] | None
     return prompt_samples
 
 
-async def _generate_jobs(ctx: BatchContext) -> None:
+@sync_to_async
+def _db_claim_pregenerated_hashcat_jobs(
+    weights_version: int, job_counts: dict[str, int]
+) -> dict[str, list[PregeneratedHashcatJob]]:
+    claimed: dict[str, list[PregeneratedHashcatJob]] = {}
+    with transaction.atomic():
+        # oldest first, so that no job waits in the pool until it expires
+        pool = (
+            PregeneratedHashcatJob.objects.select_for_update(skip_locked=True)
+            .filter(weights_version=weights_version)
+            .order_by("created_at", "id")
+        )
+        if weights_version in MINER_BOUND_WEIGHTS_VERSIONS:
+            for hotkey, count in job_counts.items():
+                claimed[hotkey] = list(pool.filter(miner_hotkey=hotkey)[:count])
+        else:
+            pregenerated_jobs = iter(
+                pool.filter(miner_hotkey__isnull=True)[: sum(job_counts.values())]
+            )
+            for hotkey, count in job_counts.items():
+                claimed[hotkey] = list(itertools.islice(pregenerated_jobs, count))
+
+        PregeneratedHashcatJob.objects.filter(
+            pk__in=[
+                pregenerated_job.pk
+                for pregenerated_jobs in claimed.values()
+                for pregenerated_job in pregenerated_jobs
+            ]
+        ).delete()
+    return claimed
+
+
+async def get_pregenerated_hashcat_jobs(
+    ctx: BatchContext, miner_hotkeys: list[str] | None = None
+) -> dict[str, list[PregeneratedHashcatJob]]:
+    if miner_hotkeys is None:
+        miner_hotkeys = list(ctx.executors.keys())
+    job_counts = {}
+    for hotkey in miner_hotkeys:
+        executors = ctx.executors[hotkey]
+        count = sum(
+            count
+            for executor_class, count in executors.items()
+            if executor_class != ExecutorClass.always_on__llm__a6000
+        )
+        if count > 0:
+            job_counts[hotkey] = count
+    if not job_counts or not current.synthetic_job_generator_factory.uses_pregenerated_hashcat_jobs:
+        return {}
+
+    weights_version = await aget_weights_version()
+    pregenerated_jobs = await _db_claim_pregenerated_hashcat_jobs(weights_version, job_counts)
+    claimed_count = sum(len(jobs) for jobs in pregenerated_jobs.values())
+    logger.info(
+        "Claimed %d pregenerated hashcat jobs, %d more will be generated",
+        claimed_count,
+        sum(job_counts.values()) - claimed_count,
+    )
+    return pregenerated_jobs
+
+
+async def _generate_job(
+    ctx: BatchContext, hotkey: str, executor_class: ExecutorClass, **kwargs
+) -> BaseSyntheticJobGenerator:
+    job_generator = await current.synthetic_job_generator_factory.create(executor_class, **kwargs)
+    await job_generator.ainit(miner_hotkey=hotkey)
+    job_uuid = str(job_generator.uuid())
+    ctx.jobs[job_uuid] = Job(
+        ctx=ctx,
+        uuid=job_uuid,
+        name=f"{ctx.names[hotkey]} job {job_uuid}",
+        miner_hotkey=hotkey,
+        executor_class=executor_class,
+        job_generator=job_generator,
+        volume=await job_generator.volume(),
+        output_upload=await job_generator.output_upload(),
+    )
+    _encode_job_requests(ctx.jobs[job_uuid])
+    ctx.job_uuids.append(job_uuid)
+    return job_generator
+
+
+async def _generate_miner_jobs(ctx: BatchContext, hotkey: str) -> None:
+    # generates all the jobs of a miner, except for llm jobs, which need
+    # prompt samples picked across all miners, see _generate_llm_jobs()
+    start_time = time.time()
+
+    pregenerated_jobs = await get_pregenerated_hashcat_jobs(ctx, [hotkey])
+
+    generated_job_count = 0
+    for executor_class, count in ctx.executors[hotkey].items():
+        if executor_class == ExecutorClass.always_on__llm__a6000:
+            continue
+        job_generators = []
+        for _ in range(count):
+            kwargs = {}
+            if pregenerated_jobs.get(hotkey):
+                kwargs = {"pregenerated_job": pregenerated_jobs[hotkey].pop()}
+            job_generators.append(await _generate_job(ctx, hotkey, executor_class, **kwargs))
+            generated_job_count += 1
+        ctx.job_generators[hotkey][executor_class] = job_generators
+
+    duration = time.time() - start_time
+    logger.debug(
+        "%s generated %d jobs in %.2f seconds", ctx.names[hotkey], generated_job_count, duration
+    )
+
+
+async def _generate_llm_jobs(ctx: BatchContext) -> None:
     start_time = time.time()
     generated_job_count = 0
 
@@ -808,166 +1136,310 @@ async def _generate_jobs(ctx: BatchContext) -> None:
     prompt_samples_iter = iter(prompt_samples) if prompt_samples is not None else None
 
     for hotkey, executors in ctx.executors.items():
-        miner_name = ctx.names[hotkey]
         for executor_class, count in executors.items():
+            if executor_class != ExecutorClass.always_on__llm__a6000:
+                continue
             job_generators = []
             for _ in range(count):
-                kwargs = {}
-                if executor_class == ExecutorClass.always_on__llm__a6000:
-                    if prompt_samples_iter is None:
-                        logger.warning("No llm prompt samples available, skipping llm job")
-                        continue
-                    prompt_sample = next(prompt_samples_iter, None)
-                    if prompt_sample is None:
-                        # it means that there is some bug - we want to see it in sentry
-                        # and continue, so other executor classes are not affected
-                        logger.error(
-                            "Dried prompt_samples_iter, this should not happen, skipping llm job"
-                        )
-                        continue
-                    kwargs = {
-                        "prompt_sample": prompt_sample,
-                        "expected_prompts": list(prompt_sample.prompts.all()),
-                        "s3_url": prompt_sample.series.s3_url,
-                        "seed": prompt_sample.workload.seed,
-                    }
-
-                job_generator = await current.synthetic_job_generator_factory.create(
-                    executor_class, **kwargs
-                )
-                await job_generator.ainit(miner_hotkey=hotkey)
-                job_uuid = str(job_generator.uuid())
-                ctx.jobs[job_uuid] = Job(
-                    ctx=ctx,
-                    uuid=job_uuid,
-                    name=f"{miner_name} job {job_uuid}",
-                    miner_hotkey=hotkey,
-                    executor_class=executor_class,
-                    job_generator=job_generator,
-                    volume=await job_generator.volume(),
-                    output_upload=await job_generator.output_upload(),
-                )
-                ctx.job_uuids.append(job_uuid)
-                job_generators.append(job_generator)
+                if prompt_samples_iter is None:
+                    logger.warning("No llm prompt samples available, skipping llm job")
+                    continue
+                prompt_sample = next(prompt_samples_iter, None)
+                if prompt_sample is None:
+                    # it means that there is some bug - we want to see it in sentry
+                    # and continue, so other executor classes are not affected
+                    logger.error(
+                        "Dried prompt_samples_iter, this should not happen, skipping llm job"
+                    )
+                    continue
+                kwargs = {
+                    "prompt_sample": prompt_sample,
+                    "expected_prompts": list(prompt_sample.prompts.all()),
+                    "s3_url": prompt_sample.series.s3_url,
+                    "seed": prompt_sample.workload.seed,
+                }
+                job_generators.append(await _generate_job(ctx, hotkey, executor_class, **kwargs))
                 generated_job_count += 1
             ctx.job_generators[hotkey][executor_class] = job_generators
 
     duration = time.time() - start_time
-    logger.info("Generated %d jobs in %.2f seconds", generated_job_count, duration)
+    logger.info("Generated %d llm jobs in %.2f seconds", generated_job_count, duration)
 
 
-async def _send_initial_job_request(
-    ctx: BatchContext, start_barrier: asyncio.Barrier, max_spin_up_time: int, job_uuid: str
-) -> None:
-    await start_barrier.wait()
-    barrier_time = datetime.now(tz=UTC)
+def _encode_job_requests(job: Job) -> None:
+    volume_in_initial_req = job.job_generator.volume_in_initial_req()
+    job.initial_job_request_json = V0InitialJobRequest(
+        job_uuid=job.uuid,
+        executor_class=job.executor_class,
+        base_docker_image_name=job.job_generator.base_docker_image_name(),
+        timeout_seconds=job.job_generator.timeout_seconds(),
+        volume=job.volume if volume_in_initial_req else None,
+    ).model_dump_json()
+    job.job_request_json = V0JobRequest(
+        job_uuid=job.uuid,
+        executor_class=job.executor_class,
+        docker_image_name=job.job_generator.docker_image_name(),
+        docker_run_options_preset=job.job_generator.docker_run_options_preset(),
+        docker_run_cmd=job.job_generator.docker_run_cmd(),
+        raw_script=job.job_generator.raw_script(),
+        volume=job.volume if not volume_in_initial_req else None,
+        output_upload=job.output_upload,
+    ).model_dump_json()
 
-    job = ctx.jobs[job_uuid]
-    job.accept_barrier_time = barrier_time
-    client = ctx.clients[job.miner_hotkey]
 
-    spin_up_time = EXECUTOR_CLASS[job.executor_class].spin_up_time
+def _get_stagger_wait_interval(max_spin_up_time: int, executor_class: ExecutorClass) -> int:
+    spin_up_time = EXECUTOR_CLASS[executor_class].spin_up_time
     assert spin_up_time is not None
     spin_up_time = max(spin_up_time, _MIN_SPIN_UP_TIME)
     stagger_wait_interval = max_spin_up_time - spin_up_time
     assert stagger_wait_interval >= 0
+    return stagger_wait_interval
 
-    request = V0InitialJobRequest(
-        job_uuid=job.uuid,
-        executor_class=job.executor_class,
-        base_docker_image_name=job.job_generator.base_docker_image_name(),
-        timeout_seconds=job.job_generator.timeout_seconds(),
-        volume=job.volume if job.job_generator.volume_in_initial_req() else None,
-    )
-    request_json = request.model_dump_json()
-
-    async with asyncio.timeout(max_spin_up_time):
-        if stagger_wait_interval > 0:
-            await asyncio.sleep(stagger_wait_interval)
-
-        # send can block, so take a timestamp
-        # on both sides to detect long send times
-        job.accept_before_sent_time = datetime.now(tz=UTC)
-        await client.send_check(request_json)
-        job.accept_after_sent_time = datetime.now(tz=UTC)
-
-        await job.accept_response_event.wait()
-        if isinstance(job.accept_response, V0AcceptJobRequest):
-            await job.executor_response_event.wait()
-
-    # send the receipt from outside the timeout
-    if isinstance(job.executor_response, V0ExecutorReadyRequest):
-        _generate_job_started_receipt(ctx, job)
-        assert job.job_started_receipt is not None
-        try:
-            receipt_json = job.job_started_receipt.model_dump_json()
-            async with asyncio.timeout(_SEND_RECEIPT_TIMEOUT):
-                await client.send_check(receipt_json)
-        except (Exception, asyncio.CancelledError) as exc:
-            logger.warning("%s failed to send job started receipt: %r", job.name, exc)
-            job.system_event(
-                type=SystemEvent.EventType.RECEIPT_FAILURE,
-                subtype=SystemEvent.EventSubType.RECEIPT_SEND_ERROR,
-                description=repr(exc),
-                func="_send_initial_job_request",
+
+def _set_job_exception(job: Job, exc: BaseException, stage: str) -> None:
+    job.exception = exc
+    job.exception_time = datetime.now(tz=UTC)
+    job.exception_stage = stage
+
+
+def _get_job_exceptions(ctx: BatchContext, job_uuids: list[str], stage: str) -> list[ExceptionInfo]:
+    exceptions: list[ExceptionInfo] = []
+    for job_uuid in job_uuids:
+        job = ctx.jobs[job_uuid]
+        if job.exception is not None and job.exception_stage == stage:
+            exceptions.append(
+                ExceptionInfo(
+                    exception=job.exception,
+                    miner_hotkey=job.miner_hotkey,
+                    job_uuid=job.uuid,
+                    stage=stage,
+                )
             )
+    return exceptions
+
+
+def _group_jobs_by_miner(ctx: BatchContext, job_uuids: list[str]) -> dict[str, list[Job]]:
+    # keeps the (randomized) order of job_uuids within each miner
+    jobs: dict[str, list[Job]] = defaultdict(list)
+    for job_uuid in job_uuids:
+        job = ctx.jobs[job_uuid]
+        jobs[job.miner_hotkey].append(job)
+    return jobs
+
 
+def _get_dispatch_start_time() -> tuple[float, datetime]:
+    # all sends are planned relative to this point in time, both as event loop
+    # time (for scheduling) and as wall clock time (for telemetry). timers which
+    # are already due fire together in the next loop iteration, after all the
+    # miner connections had a chance to set up theirs
+    return asyncio.get_running_loop().time(), datetime.now(tz=UTC)
 
-async def _send_job_request(
-    ctx: BatchContext, start_barrier: asyncio.Barrier, job_uuid: str
+
+async def _dispatch_job_requests(
+    schedule: dict[float, list[Job]],
+    deadline: Callable[[Job], float],
+    send: Callable[[Job], Awaitable[None]],
+    stage: str,
 ) -> None:
-    await start_barrier.wait()
-    barrier_time = datetime.now(tz=UTC)
+    # sends the jobs of a single miner connection at their planned times.
+    # there is a single `call_at` timer for each planned time, which releases
+    # all the jobs planned for that time at once, so the event loop doesn't
+    # need to wake up a task for every job
+    loop = asyncio.get_running_loop()
+    due: asyncio.Queue[list[Job]] = asyncio.Queue()
+    timers = [loop.call_at(when, due.put_nowait, jobs) for when, jobs in schedule.items()]
+    try:
+        for _ in range(len(timers)):
+            for job in await due.get():
+                try:
+                    async with asyncio.timeout_at(deadline(job)):
+                        await send(job)
+                except (Exception, asyncio.CancelledError) as exc:
+                    _set_job_exception(job, exc, stage)
+    finally:
+        for timer in timers:
+            timer.cancel()
+
+
+async def _send_initial_job_request(ctx: BatchContext, job: Job) -> None:
+    client = ctx.clients[job.miner_hotkey]
+
+    # send can block, so take a timestamp
+    # on both sides to detect long send times
+    job.accept_before_sent_time = datetime.now(tz=UTC)
+    await client.send_check(job.initial_job_request_json)
+    job.accept_after_sent_time = datetime.now(tz=UTC)
+
 
-    job = ctx.jobs[job_uuid]
-    job.job_barrier_time = barrier_time
+async def _send_job_started_receipt(ctx: BatchContext, job: Job) -> None:
     client = ctx.clients[job.miner_hotkey]
 
-    request = V0JobRequest(
-        job_uuid=job.uuid,
-        executor_class=job.executor_class,
-        docker_image_name=job.job_generator.docker_image_name(),
-        docker_run_options_preset=job.job_generator.docker_run_options_preset(),
-        docker_run_cmd=job.job_generator.docker_run_cmd(),
-        raw_script=job.job_generator.raw_script(),
-        volume=job.volume if not job.job_generator.volume_in_initial_req() else None,
-        output_upload=job.output_upload,
+    _generate_job_started_receipt(ctx, job)
+    assert job.job_started_receipt is not None
+    try:
+        receipt_json = job.job_started_receipt.model_dump_json()
+        async with asyncio.timeout(_SEND_RECEIPT_TIMEOUT):
+            await client.send_check(receipt_json)
+    except (Exception, asyncio.CancelledError) as exc:
+        logger.warning("%s failed to send job started receipt: %r", job.name, exc)
+        job.system_event(
+            type=SystemEvent.EventType.RECEIPT_FAILURE,
+            subtype=SystemEvent.EventSubType.RECEIPT_SEND_ERROR,
+            description=repr(exc),
+            func="_send_initial_job_request",
+        )
+
+
+async def _wait_for_executor_responses(ctx: BatchContext, jobs: list[Job], deadline: float) -> None:
+    # all jobs share the same deadline, so waiting for them one after the
+    # other doesn't make any job wait longer than it would on its own
+    for job in jobs:
+        try:
+            async with asyncio.timeout_at(deadline):
+                await job.accept_response_event.wait()
+                if isinstance(job.accept_response, V0AcceptJobRequest):
+                    await job.executor_response_event.wait()
+        except TimeoutError as exc:
+            # don't override an error from sending the request
+            if job.exception is None:
+                _set_job_exception(job, exc, "_send_initial_job_request")
+            continue
+
+        # send the receipt from outside the timeout
+        if isinstance(job.executor_response, V0ExecutorReadyRequest):
+            await _send_job_started_receipt(ctx, job)
+
+
+async def _send_initial_job_requests(
+    ctx: BatchContext,
+    jobs: list[Job],
+    max_spin_up_time: int,
+    start_loop_time: float,
+    start_time: datetime,
+) -> None:
+    # jobs with a shorter spin-up time are sent later,
+    # so that all executors are ready at the same time
+    schedule: dict[float, list[Job]] = defaultdict(list)
+    for job in jobs:
+        stagger_wait_interval = _get_stagger_wait_interval(max_spin_up_time, job.executor_class)
+        job.accept_barrier_time = start_time
+        job.accept_planned_send_time = start_time + timedelta(seconds=stagger_wait_interval)
+        schedule[start_loop_time + stagger_wait_interval].append(job)
+
+    deadline = start_loop_time + max_spin_up_time
+    await asyncio.gather(
+        _dispatch_job_requests(
+            schedule,
+            deadline=lambda job: deadline,
+            send=partial(_send_initial_job_request, ctx),
+            stage="_send_initial_job_request",
+        ),
+        _wait_for_executor_responses(ctx, jobs, deadline),
+    )
+
+
+async def _send_job_request(ctx: BatchContext, job: Job) -> None:
+    client = ctx.clients[job.miner_hotkey]
+
+    # send can block, so take a timestamp
+    # on both sides to detect long send times
+    job.job_before_sent_time = datetime.now(tz=UTC)
+    await client.send_check(job.job_request_json)
+    job.job_after_sent_time = datetime.now(tz=UTC)
+
+
+async def _wait_for_job_responses(jobs: list[Job], deadlines: dict[str, float]) -> None:
+    # wait in deadline order, so that no job waits past its own deadline
+    for job in sorted(jobs, key=lambda job: deadlines[job.uuid]):
+        try:
+            async with asyncio.timeout_at(deadlines[job.uuid]):
+                await job.job_response_event.wait()
+        except TimeoutError as exc:
+            # don't override an error from sending the request
+            if job.exception is None:
+                _set_job_exception(job, exc, "_send_job_request")
+
+
+async def _send_job_requests(
+    ctx: BatchContext,
+    jobs: list[Job],
+    start_loop_time: float,
+    start_time: datetime,
+) -> None:
+    deadlines: dict[str, float] = {}
+    for job in jobs:
+        job.job_barrier_time = start_time
+        job.job_planned_send_time = start_time
+        timeout = job.job_generator.timeout_seconds() + _JOB_RESPONSE_EXTRA_TIMEOUT
+        deadlines[job.uuid] = start_loop_time + timeout
+
+    await asyncio.gather(
+        _dispatch_job_requests(
+            {start_loop_time: jobs},
+            deadline=lambda job: deadlines[job.uuid],
+            send=partial(_send_job_request, ctx),
+            stage="_send_job_request",
+        ),
+        _wait_for_job_responses(jobs, deadlines),
+    )
+
+
+def _job_finished_receipt_failure(job: Job, exc: BaseException) -> None:
+    logger.warning("%s failed to send job finished receipt: %r", job.name, exc)
+    job.system_event(
+        type=SystemEvent.EventType.RECEIPT_FAILURE,
+        subtype=SystemEvent.EventSubType.RECEIPT_SEND_ERROR,
+        description=repr(exc),
+        func="_send_job_finished_receipts",
     )
-    request_json = request.model_dump_json()
 
-    timeout = job.job_generator.timeout_seconds() + _JOB_RESPONSE_EXTRA_TIMEOUT
-    async with asyncio.timeout(timeout):
-        # send can block, so take a timestamp
-        # on both sides to detect long send times
-        job.job_before_sent_time = datetime.now(tz=UTC)
-        await client.send_check(request_json)
-        job.job_after_sent_time = datetime.now(tz=UTC)
 
-        await job.job_response_event.wait()
+async def _send_miner_job_finished_receipts(
+    ctx: BatchContext, miner_hotkey: str, jobs: list[Job], deadline: float
+) -> None:
+    # all receipts are serialized up front, so they go out back to back
+    receipts: list[tuple[Job, str]] = []
+    for job in jobs:
+        if job.job_finished_receipt is None:
+            continue
+        try:
+            receipts.append((job, job.job_finished_receipt.model_dump_json()))
+        except Exception as exc:
+            _job_finished_receipt_failure(job, exc)
+
+    client = ctx.clients[miner_hotkey]
+    sent_count = 0
+    try:
+        async with asyncio.timeout_at(deadline):
+            for _, receipt_json in receipts:
+                await client.send_check(receipt_json)
+                sent_count += 1
+    except (Exception, asyncio.CancelledError) as exc:
+        for job, _ in receipts[sent_count:]:
+            _job_finished_receipt_failure(job, exc)
 
 
 async def _send_job_finished_receipts(ctx: BatchContext) -> None:
-    for job in ctx.jobs.values():
-        # generate job finished receipts for all jobs
-        # which returned a response, even if they failed
-        if job.job_response is not None:
-            client = ctx.clients[job.miner_hotkey]
+    # generate job finished receipts for all jobs
+    # which returned a response, even if they failed
+    jobs = [job for job in ctx.jobs.values() if job.job_response is not None]
+    if await aget_config("DYNAMIC_RECEIPTS_BATCH_SIGNING"):
+        _generate_job_finished_receipts_batch(ctx, jobs)
+    else:
+        for job in jobs:
             try:
                 _generate_job_finished_receipt(ctx, job)
-                assert job.job_finished_receipt is not None
-
-                receipt_json = job.job_finished_receipt.model_dump_json()
-                async with asyncio.timeout(_SEND_RECEIPT_TIMEOUT):
-                    await client.send_check(receipt_json)
-
-            except (Exception, asyncio.CancelledError) as exc:
-                logger.warning("%s failed to send job finished receipt: %r", job.name, exc)
-                job.system_event(
-                    type=SystemEvent.EventType.RECEIPT_FAILURE,
-                    subtype=SystemEvent.EventSubType.RECEIPT_SEND_ERROR,
-                    description=repr(exc),
-                    func="_send_job_finished_receipts",
-                )
+            except Exception as exc:
+                _job_finished_receipt_failure(job, exc)
+
+    job_uuids = [job.uuid for job in jobs]
+    deadline = asyncio.get_running_loop().time() + _SEND_JOB_FINISHED_RECEIPTS_TIMEOUT
+    await asyncio.gather(
+        *[
+            _send_miner_job_finished_receipts(ctx, miner_hotkey, miner_jobs, deadline)
+            for miner_hotkey, miner_jobs in _group_jobs_by_miner(ctx, job_uuids).items()
+        ]
+    )
 
 
 def _emit_decline_or_failure_events(ctx: BatchContext) -> None:
@@ -1040,11 +1512,38 @@ async def _send_machine_specs(ctx: BatchContext) -> None:
         )
 
 
+async def _get_miner_manifest_and_generate_jobs(
+    ctx: BatchContext,
+    start_barrier: asyncio.Barrier,
+    max_executors_per_class: dict[ExecutorClass, int],
+    miner_hotkey: str,
+) -> None:
+    await _get_miner_manifest(ctx, start_barrier, miner_hotkey)
+    _adjust_miner_max_executors_per_class(ctx, miner_hotkey, max_executors_per_class)
+
+    # generate the jobs as soon as the manifest arrives, so that job
+    # generation overlaps with waiting for the manifests of slower miners
+    try:
+        await _generate_miner_jobs(ctx, miner_hotkey)
+    except (Exception, asyncio.CancelledError) as exc:
+        logger.warning("%s failed to generate jobs: %r", ctx.names[miner_hotkey], exc)
+        ctx.system_event(
+            type=SystemEvent.EventType.VALIDATOR_FAILURE,
+            subtype=SystemEvent.EventSubType.GENERIC_ERROR,
+            description=repr(exc),
+            miner_hotkey=miner_hotkey,
+            func="_generate_miner_jobs",
+        )
+
+
 async def _multi_get_miner_manifest(ctx: BatchContext) -> None:
+    max_executors_per_class = await get_miner_max_executors_per_class()
     start_barrier = asyncio.Barrier(len(ctx.hotkeys))
     tasks = [
         asyncio.create_task(
-            _get_miner_manifest(ctx, start_barrier, miner_hotkey),
+            _get_miner_manifest_and_generate_jobs(
+                ctx, start_barrier, max_executors_per_class, miner_hotkey
+            ),
             name=f"{miner_hotkey}._get_miner_manifest",
         )
         for miner_hotkey in ctx.hotkeys
@@ -1074,25 +1573,31 @@ async def _multi_get_miner_manifest(ctx: BatchContext) -> None:
             assert result is None
 
 
-async def _adjust_miner_max_executors_per_class(ctx: BatchContext) -> None:
-    max_executors_per_class = await get_miner_max_executors_per_class()
-    for hotkey, executors in ctx.executors.items():
-        for executor_class, count in executors.items():
-            if executor_class not in max_executors_per_class:
-                continue
-            if count > max_executors_per_class[executor_class]:
-                logger.warning(
-                    "%s manifest for executor class %s has more count (%s) than the max limit (%s), capping at limit",
-                    ctx.names[hotkey],
-                    executor_class,
-                    count,
-                    max_executors_per_class[executor_class],
-                )
-                ctx.executors[hotkey][executor_class] = max_executors_per_class[executor_class]
-                # TODO: add a system event?
+def _adjust_miner_max_executors_per_class(
+    ctx: BatchContext, hotkey: str, max_executors_per_class: dict[ExecutorClass, int]
+) -> None:
+    executors = ctx.executors[hotkey]
+    for executor_class, count in executors.items():
+        if executor_class not in max_executors_per_class:
+            continue
+        if count > max_executors_per_class[executor_class]:
+            logger.warning(
+                "%s manifest for executor class %s has more count (%s) than the max limit (%s), capping at limit",
+                ctx.names[hotkey],
+                executor_class,
+                count,
+                max_executors_per_class[executor_class],
+            )
+            executors[executor_class] = max_executors_per_class[executor_class]
+            # TODO: add a system event?
 
 
 async def _multi_close_client(ctx: BatchContext) -> None:
+    # connections may still be opening if the batch failed early
+    for connect_task in ctx.connect_tasks.values():
+        connect_task.cancel()
+    await asyncio.gather(*ctx.connect_tasks.values(), return_exceptions=True)
+
     tasks = [
         asyncio.create_task(
             _close_client(ctx, miner_hotkey),
@@ -1117,36 +1622,26 @@ async def _multi_send_initial_job_request(ctx: BatchContext) -> None:
     logger.debug("Max spin-up time: %d seconds", max_spin_up_time)
 
     logger.info("Sending initial job requests for %d jobs", len(ctx.job_uuids))
-    start_barrier = asyncio.Barrier(len(ctx.job_uuids))
+    jobs_by_miner = _group_jobs_by_miner(ctx, ctx.job_uuids)
+    start_loop_time, start_time = _get_dispatch_start_time()
     tasks = [
         asyncio.create_task(
-            _send_initial_job_request(ctx, start_barrier, max_spin_up_time, job_uuid),
-            name=f"{job_uuid}._send_initial_job_request",
+            _send_initial_job_requests(ctx, jobs, max_spin_up_time, start_loop_time, start_time),
+            name=f"{miner_hotkey}._send_initial_job_requests",
         )
-        for job_uuid in ctx.job_uuids
+        for miner_hotkey, jobs in jobs_by_miner.items()
     ]
 
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
-    exceptions: list[ExceptionInfo] = []
-    for i, result in enumerate(results):
+    for jobs, result in zip(jobs_by_miner.values(), results):
         if isinstance(result, BaseException):
-            job_uuid = ctx.job_uuids[i]
-            job = ctx.jobs[job_uuid]
-            job.exception = result
-            job.exception_time = datetime.now(tz=UTC)
-            job.exception_stage = "_send_initial_job_request"
-            exceptions.append(
-                ExceptionInfo(
-                    exception=job.exception,
-                    miner_hotkey=job.miner_hotkey,
-                    job_uuid=job.uuid,
-                    stage=job.exception_stage,
-                )
-            )
+            for job in jobs:
+                if job.exception is None:
+                    _set_job_exception(job, result, "_send_initial_job_request")
         else:
             assert result is None
-    _handle_exceptions(ctx, exceptions)
+    _handle_exceptions(ctx, _get_job_exceptions(ctx, ctx.job_uuids, "_send_initial_job_request"))
 
 
 async def _multi_send_job_request(ctx: BatchContext) -> None:
@@ -1160,36 +1655,26 @@ async def _multi_send_job_request(ctx: BatchContext) -> None:
         and job.job_response is None
     ]
     logger.info("Sending job requests for %d ready jobs", len(executor_ready_job_uuids))
-    start_barrier = asyncio.Barrier(len(executor_ready_job_uuids))
+    jobs_by_miner = _group_jobs_by_miner(ctx, executor_ready_job_uuids)
+    start_loop_time, start_time = _get_dispatch_start_time()
     tasks = [
         asyncio.create_task(
-            _send_job_request(ctx, start_barrier, job_uuid),
-            name=f"{job_uuid}._send_job_request",
+            _send_job_requests(ctx, jobs, start_loop_time, start_time),
+            name=f"{miner_hotkey}._send_job_requests",
         )
-        for job_uuid in executor_ready_job_uuids
+        for miner_hotkey, jobs in jobs_by_miner.items()
     ]
 
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
-    exceptions: list[ExceptionInfo] = []
-    for i, result in enumerate(results):
+    for jobs, result in zip(jobs_by_miner.values(), results):
         if isinstance(result, BaseException):
-            job_uuid = executor_ready_job_uuids[i]
-            job = ctx.jobs[job_uuid]
-            job.exception = result
-            job.exception_time = datetime.now(tz=UTC)
-            job.exception_stage = "_send_job_request"
-            exceptions.append(
-                ExceptionInfo(
-                    exception=job.exception,
-                    miner_hotkey=job.miner_hotkey,
-                    job_uuid=job.uuid,
-                    stage=job.exception_stage,
-                )
-            )
+            for job in jobs:
+                if job.exception is None:
+                    _set_job_exception(job, result, "_send_job_request")
         else:
             assert result is None
-    _handle_exceptions(ctx, exceptions)
+    _handle_exceptions(ctx, _get_job_exceptions(ctx, executor_ready_job_uuids, "_send_job_request"))
 
 
 def _compute_average_send_time(ctx: BatchContext) -> None:
@@ -1212,6 +1697,39 @@ def _compute_average_send_time(ctx: BatchContext) -> None:
     logger.info("Average job send time: %.6f seconds", average_duration_sec)
 
 
+def _send_skew_stats(skews_sec: list[float]) -> dict[str, float] | None:
+    if not skews_sec:
+        return None
+    skews_sec = sorted(skews_sec)
+    return dict(
+        count=len(skews_sec),
+        median=statistics.median(skews_sec),
+        p95=skews_sec[int(0.95 * (len(skews_sec) - 1))],
+        max=skews_sec[-1],
+    )
+
+
+def _compute_send_skew(ctx: BatchContext) -> None:
+    # send skew is how late a request was actually sent,
+    # compared to the time it was planned to be sent at
+    initial_job_request_skews_sec: list[float] = []
+    job_request_skews_sec: list[float] = []
+
+    for job in ctx.jobs.values():
+        if job.accept_planned_send_time is not None and job.accept_before_sent_time is not None:
+            skew = job.accept_before_sent_time - job.accept_planned_send_time
+            initial_job_request_skews_sec.append(skew.total_seconds())
+        if job.job_planned_send_time is not None and job.job_before_sent_time is not None:
+            skew = job.job_before_sent_time - job.job_planned_send_time
+            job_request_skews_sec.append(skew.total_seconds())
+
+    ctx.send_skew = dict(
+        initial_job_request=_send_skew_stats(initial_job_request_skews_sec),
+        job_request=_send_skew_stats(job_request_skews_sec),
+    )
+    logger.info("Job send skew: %s", ctx.send_skew)
+
+
 async def _score_job(ctx: BatchContext, job: Job) -> None:
     job.score = 0
     job.score_manifest_multiplier = None
@@ -1304,48 +1822,73 @@ async def _score_job(ctx: BatchContext, job: Job) -> None:
     )
 
 
+async def _download_llm_prompt_answers(ctx: BatchContext, job: Job) -> None:
+    start_time = time.time()
+    try:
+        await job.job_generator._download_answers(ctx.download_client)
+    except (Exception, asyncio.CancelledError) as exc:
+        logger.warning("failed to get llm prompt answers of %s: %r", job.name, exc)
+        ctx.system_event(
+            type=SystemEvent.EventType.VALIDATOR_TELEMETRY,
+            subtype=SystemEvent.EventSubType.LLM_PROMPT_ANSWERS_DOWNLOAD_FAILED,
+            description=repr(exc),
+            miner_hotkey=job.miner_hotkey,
+            func="_download_llm_prompts_answers",
+        )
+    finally:
+        job.llm_prompt_answers_download_time = timedelta(seconds=time.time() - start_time)
+
+
+def _needs_llm_prompt_answers(job: Job) -> bool:
+    return job.executor_class == ExecutorClass.always_on__llm__a6000 and isinstance(
+        job.job_response, V0JobFinishedRequest
+    )
+
+
 async def _download_llm_prompts_answers(ctx: BatchContext) -> None:
     start_time = time.time()
 
+    # jobs scored on response download their answers themselves
     jobs = [
         job
         for job in ctx.jobs.values()
-        if job.executor_class == ExecutorClass.always_on__llm__a6000
-        and job.job_response is not None
-        and isinstance(job.job_response, V0JobFinishedRequest)
+        if job.score_task is None and _needs_llm_prompt_answers(job)
     ]
-    tasks = [asyncio.create_task(job.job_generator._download_answers()) for job in jobs]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    for i, result in enumerate(results):
-        if isinstance(result, BaseException):
-            job = jobs[i]
-            logger.warning("failed to get llm prompt answers of %s: %r", job.name, result)
-            ctx.system_event(
-                type=SystemEvent.EventType.VALIDATOR_TELEMETRY,
-                subtype=SystemEvent.EventSubType.LLM_PROMPT_ANSWERS_DOWNLOAD_FAILED,
-                description=repr(result),
-                miner_hotkey=job.miner_hotkey,
-                func="_download_llm_prompts_answers",
-            )
-        else:
-            assert result is None
+    await asyncio.gather(*[_download_llm_prompt_answers(ctx, job) for job in jobs])
 
     duration = time.time() - start_time
     logger.info("Downloaded miners' llm prompt answers in %.2f seconds", duration)
 
 
+async def _try_score_job(ctx: BatchContext, job: Job) -> None:
+    try:
+        await _score_job(ctx, job)
+    except (Exception, asyncio.CancelledError) as exc:
+        logger.warning("%s failed to score: %r", job.name, exc)
+        job.system_event(
+            type=SystemEvent.EventType.MINER_SYNTHETIC_JOB_FAILURE,
+            subtype=SystemEvent.EventSubType.MINER_SCORING_ERROR,
+            description=repr(exc),
+            func="_score_jobs",
+        )
+
+
+async def _score_job_on_response(ctx: BatchContext, job: Job) -> None:
+    if _needs_llm_prompt_answers(job):
+        await _download_llm_prompt_answers(ctx, job)
+    await _try_score_job(ctx, job)
+
+
 async def _score_jobs(ctx: BatchContext) -> None:
+    # most jobs were already scored when their response arrived,
+    # wait for those still in progress and score the rest
+    score_tasks = [job.score_task for job in ctx.jobs.values() if job.score_task is not None]
+    await asyncio.gather(*score_tasks, return_exceptions=True)
+    logger.info("%d jobs were scored as their response arrived", len(score_tasks))
+
     for job in ctx.jobs.values():
-        try:
-            await _score_job(ctx, job)
-        except (Exception, asyncio.CancelledError) as exc:
-            logger.warning("%s failed to score: %r", job.name, exc)
-            job.system_event(
-                type=SystemEvent.EventType.MINER_SYNTHETIC_JOB_FAILURE,
-                subtype=SystemEvent.EventSubType.MINER_SCORING_ERROR,
-                description=repr(exc),
-                func="_score_jobs",
-            )
+        if job.score_task is None:
+            await _try_score_job(ctx, job)
 
     # compute for each hotkey how many executors finished successfully
     for job in ctx.jobs.values():
@@ -1354,13 +1897,17 @@ async def _score_jobs(ctx: BatchContext) -> None:
 
     # apply manifest bonus
     # do not combine with the previous loop, we use online_executor_count
+    # the multiplier only depends on the miner, compute it once per miner
+    manifest_multipliers: dict[str, float | None] = {}
     for job in ctx.jobs.values():
         if job.success:
             try:
-                job.score_manifest_multiplier = await get_manifest_multiplier(
-                    ctx.previous_online_executor_count[job.miner_hotkey],
-                    ctx.online_executor_count[job.miner_hotkey],
-                )
+                if job.miner_hotkey not in manifest_multipliers:
+                    manifest_multipliers[job.miner_hotkey] = await get_manifest_multiplier(
+                        ctx.previous_online_executor_count[job.miner_hotkey],
+                        ctx.online_executor_count[job.miner_hotkey],
+                    )
+                job.score_manifest_multiplier = manifest_multipliers[job.miner_hotkey]
             except (Exception, asyncio.CancelledError) as exc:
                 logger.warning("%s failed to score: %r", job.name, exc)
                 job.system_event(
@@ -1394,49 +1941,96 @@ def _db_get_previous_online_executor_count(ctx: BatchContext) -> None:
 
 # sync_to_async is needed since we use the sync Django ORM
 @sync_to_async
-def _db_persist_system_events(ctx: BatchContext) -> None:
-    if not ctx.events:
-        return
-
-    logger.info("Persisting %d system events", len(ctx.events))
+def _db_persist_system_events(events: list[SystemEventRecord]) -> bool:
+    logger.info("Persisting %d system events", len(events))
     try:
         # it's possible some events were already inserted during
-        # a previous call, but the operation failed before clearing
-        # the events list, so ignore insert conflicts
-        SystemEvent.objects.bulk_create(ctx.events, ignore_conflicts=True)
-        # we call this function multiple times during a batch,
-        # clear the list to avoid persisting the same event
-        # multiple times
-        ctx.events.clear()
+        # a previous call, but the operation failed before returning,
+        # so ignore insert conflicts
+        SystemEvent.objects.bulk_create(
+            [event.to_system_event() for event in events], ignore_conflicts=True
+        )
+        return True
     except Exception as exc:
         logger.error("Failed to persist system events: %r", exc)
+        return False
 
 
 # sync_to_async is needed since we use the sync Django ORM
-@sync_to_async
-def _db_persist(ctx: BatchContext) -> None:
+def _get_batch_result(ctx: BatchContext) -> BatchResult:
+    jobs: list[JobResult] = []
+    for job in ctx.jobs.values():
+        prompt_sample = None
+        if job.executor_class == ExecutorClass.always_on__llm__a6000:
+            prompt_sample = job.job_generator.prompt_sample
+        jobs.append(
+            JobResult(
+                uuid=job.uuid,
+                miner_hotkey=job.miner_hotkey,
+                executor_class=job.executor_class,
+                success=job.success,
+                comment=job.comment,
+                job_description=job.job_generator.job_description(),
+                score=job.score,
+                prompt_sample=prompt_sample,
+                job_started_receipt=job.job_started_receipt,
+                job_finished_receipt=job.job_finished_receipt,
+            )
+        )
+
+    # accepting_results_until is not used anywhere, it doesn't
+    # matter that we pick a somewhat arbitrary time for it
+    now = datetime.now(tz=UTC)
+    return BatchResult(
+        started_at=ctx.stage_start_time["BATCH_BEGIN"],
+        accepting_results_until=ctx.stage_start_time.get("_multi_send_job_request", now),
+        jobs=jobs,
+        manifests=ctx.manifests,
+        online_executor_count=ctx.online_executor_count,
+    )
+
+
+def merge_batch_results(results: list[BatchResult]) -> BatchResult:
+    assert results
+    merged = BatchResult(
+        started_at=min(result.started_at for result in results),
+        accepting_results_until=min(result.accepting_results_until for result in results),
+        jobs=[],
+        manifests={},
+        online_executor_count={},
+    )
+    for result in results:
+        merged.jobs.extend(result.jobs)
+        merged.manifests.update(result.manifests)
+        merged.online_executor_count.update(result.online_executor_count)
+    return merged
+
+
+def persist_batch_result(
+    batch_id: int | None,
+    axons: dict[str, bittensor.AxonInfo],
+    miners: dict[str, Miner],
+    result: BatchResult,
+) -> None:
     start_time = time.time()
 
     # persist the batch and the jobs in the same transaction, to
     # prevent a situation where because of a crash only some of
     # the jobs are saved, which would generate incorrect weights
     with transaction.atomic():
-        if ctx.batch_id is not None:
-            batch = SyntheticJobBatch.objects.get(id=ctx.batch_id)
+        if batch_id is not None:
+            batch = SyntheticJobBatch.objects.get(id=batch_id)
         else:
             batch = SyntheticJobBatch(
-                started_at=ctx.stage_start_time["BATCH_BEGIN"],
+                started_at=result.started_at,
             )
-        # accepting_results_until is not used anywhere, it doesn't
-        # matter that we pick a somewhat arbitrary time for it
-        now = datetime.now(tz=UTC)
-        batch.accepting_results_until = ctx.stage_start_time.get("_multi_send_job_request", now)
+        batch.accepting_results_until = result.accepting_results_until
         batch.save()
 
         synthetic_jobs: list[SyntheticJob] = []
-        for job in ctx.jobs.values():
-            axon = ctx.axons[job.miner_hotkey]
-            miner = ctx.miners[job.miner_hotkey]
+        for job in result.jobs:
+            axon = axons[job.miner_hotkey]
+            miner = miners[job.miner_hotkey]
             status = SyntheticJob.Status.COMPLETED if job.success else SyntheticJob.Status.FAILED
             synthetic_job = SyntheticJob(
                 job_uuid=job.uuid,
@@ -1448,22 +2042,21 @@ def _db_persist(ctx: BatchContext) -> None:
                 executor_class=job.executor_class,
                 status=status,
                 comment=job.comment,
-                job_description=job.job_generator.job_description(),
+                job_description=job.job_description,
                 score=job.score,
             )
             synthetic_jobs.append(synthetic_job)
         synthetic_jobs = SyntheticJob.objects.bulk_create(synthetic_jobs)
 
     miner_manifests: list[MinerManifest] = []
-    for miner in ctx.miners.values():
-        manifest = ctx.manifests[miner.hotkey]
+    for hotkey, manifest in result.manifests.items():
         if manifest is not None:
             miner_manifests.append(
                 MinerManifest(
-                    miner=miner,
+                    miner=miners[hotkey],
                     batch=batch,
                     executor_count=manifest.total_count,
-                    online_executor_count=ctx.online_executor_count[miner.hotkey],
+                    online_executor_count=result.online_executor_count[hotkey],
                 )
             )
     MinerManifest.objects.bulk_create(miner_manifests)
@@ -1474,16 +2067,16 @@ def _db_persist(ctx: BatchContext) -> None:
     }
     prompt_samples: list[PromptSample] = []
 
-    for job in ctx.jobs.values():
-        if job.executor_class != ExecutorClass.always_on__llm__a6000:
+    for job in result.jobs:
+        if job.prompt_sample is None:
             continue
-        prompt_sample = job.job_generator.prompt_sample
+        prompt_sample = job.prompt_sample
         prompt_sample.synthetic_job = synthetic_jobs_map.get(job.uuid)
         prompt_samples.append(prompt_sample)
     PromptSample.objects.bulk_update(prompt_samples, fields=["synthetic_job"])
 
     job_started_receipts: list[JobStartedReceipt] = []
-    for job in ctx.jobs.values():
+    for job in result.jobs:
         if job.job_started_receipt is not None:
             payload = job.job_started_receipt.payload
             job_started_receipts.append(
@@ -1499,7 +2092,7 @@ def _db_persist(ctx: BatchContext) -> None:
     JobStartedReceipt.objects.bulk_create(job_started_receipts)
 
     job_finished_receipts: list[JobFinishedReceipt] = []
-    for job in ctx.jobs.values():
+    for job in result.jobs:
         if job.job_finished_receipt is not None:
             payload = job.job_finished_receipt.payload
             job_finished_receipts.append(
@@ -1514,19 +2107,45 @@ def _db_persist(ctx: BatchContext) -> None:
             )
     JobFinishedReceipt.objects.bulk_create(job_finished_receipts)
 
+    # score the batch once, weight setting reuses the cached scores
+    try:
+        get_batch_scores(batch)
+    except Exception as exc:
+        logger.warning("Failed to cache batch scores: %r", exc)
+
     duration = time.time() - start_time
     logger.info("Persisted to database in %.2f seconds", duration)
 
 
+@sync_to_async
+def _db_persist(ctx: BatchContext) -> None:
+    persist_batch_result(ctx.batch_id, ctx.axons, ctx.miners, _get_batch_result(ctx))
+
+
+async def _wait_for_shard_start(shard: BatchShard) -> None:
+    delay = shard.start_at - time.monotonic()
+    if delay < 0:
+        logger.warning("Shard %d/%d started %.2fs late", shard.index, shard.count, -delay)
+        return
+    await asyncio.sleep(delay)
+
+
 async def execute_synthetic_batch_run(
     axons: dict[str, bittensor.AxonInfo],
     serving_miners: list[Miner],
     batch_id: int | None = None,
     create_miner_client: Callable | None = None,
-) -> None:
+    shard: BatchShard | None = None,
+) -> BatchResult | None:
+    """
+    Run a synthetic jobs batch and persist its results.
+
+    If `shard` is given, this is one shard of a sharded batch: the results are returned
+    instead, for the coordinating process to persist together with the other shards.
+    """
     if not axons or not serving_miners:
         logger.warning("No miners provided")
-        return
+        return None
 
     start_time = datetime.now(tz=UTC)
     logger.info("Executing synthetic jobs batch for %d miners", len(serving_miners))
@@ -1534,118 +2153,133 @@ async def execute_synthetic_batch_run(
     # randomize the order of miners each batch to avoid systemic bias
     random.shuffle(serving_miners)
 
-    ctx = _init_context(axons, serving_miners, batch_id, create_miner_client)
-    await ctx.checkpoint_system_event("BATCH_BEGIN", dt=start_time)
-
+    result: BatchResult | None = None
+    ctx = _init_context(axons, serving_miners, batch_id, create_miner_client, shard)
     try:
-        await ctx.checkpoint_system_event("_db_get_previous_online_executor_count")
-        await _db_get_previous_online_executor_count(ctx)
-
-        await ctx.checkpoint_system_event("_multi_get_miner_manifest")
-        await _multi_get_miner_manifest(ctx)
-        await _adjust_miner_max_executors_per_class(ctx)
+        await ctx.checkpoint_system_event("BATCH_BEGIN", dt=start_time)
 
-        await ctx.checkpoint_system_event("_get_total_executor_count")
-        total_executor_count = _get_total_executor_count(ctx)
+        try:
+            await ctx.checkpoint_system_event("_start_connecting")
+            _start_connecting(ctx)
 
-        if total_executor_count != 0:
-            await ctx.checkpoint_system_event("_generate_jobs")
-            await _generate_jobs(ctx)
+            await ctx.checkpoint_system_event("_db_get_previous_online_executor_count")
+            await _db_get_previous_online_executor_count(ctx)
 
-            # randomize the order of jobs each batch to avoid systemic bias
-            random.shuffle(ctx.job_uuids)
+            if shard is not None:
+                await ctx.checkpoint_system_event("_wait_for_shard_start")
+                await _wait_for_shard_start(shard)
 
-            await ctx.checkpoint_system_event("_multi_send_initial_job_request")
-            await _multi_send_initial_job_request(ctx)
+            await ctx.checkpoint_system_event("_multi_get_miner_manifest")
+            # also generates the jobs of each miner as soon as its manifest arrives
+            await _multi_get_miner_manifest(ctx)
 
-            if any(
-                isinstance(job.accept_response, V0AcceptJobRequest) for job in ctx.jobs.values()
-            ):
-                await ctx.checkpoint_system_event("_multi_send_job_request")
-                await _multi_send_job_request(ctx)
+            await ctx.checkpoint_system_event("_get_total_executor_count")
+            total_executor_count = _get_total_executor_count(ctx)
 
-                # don't persist system events before this point, we want to minimize
-                # any extra interactions which could slow down job processing before
-                # we get the responses from the miners
-                await _db_persist_system_events(ctx)
+            if total_executor_count != 0:
+                await ctx.checkpoint_system_event("_generate_llm_jobs")
+                await _generate_llm_jobs(ctx)
+                logger.info("Generated %d jobs", len(ctx.jobs))
 
-                await ctx.checkpoint_system_event("_compute_average_send_time")
-                _compute_average_send_time(ctx)
+                # randomize the order of jobs each batch to avoid systemic bias
+                random.shuffle(ctx.job_uuids)
 
-                # NOTE: download the answers for llm prompts jobs before scoring
-                await ctx.checkpoint_system_event("_download_llm_prompts_answers")
-                await _download_llm_prompts_answers(ctx)
+                # don't write system events while sending jobs and waiting for the
+                # responses, we want to minimize any extra work which could slow
+                # down job processing before we get the responses from the miners
+                ctx.event_writer.paused = True
 
-                await ctx.checkpoint_system_event("_score_jobs")
-                await _score_jobs(ctx)
+                await ctx.checkpoint_system_event("_multi_send_initial_job_request")
+                await _multi_send_initial_job_request(ctx)
 
-                await _db_persist_system_events(ctx)
+                if any(
+                    isinstance(job.accept_response, V0AcceptJobRequest) for job in ctx.jobs.values()
+                ):
+                    await ctx.checkpoint_system_event("_multi_send_job_request")
+                    await _multi_send_job_request(ctx)
 
-                await ctx.checkpoint_system_event("_send_job_finished_receipts")
-                await _send_job_finished_receipts(ctx)
+                    ctx.event_writer.paused = False
 
-            else:
-                logger.warning("No jobs accepted")
+                    await ctx.checkpoint_system_event("_compute_average_send_time")
+                    _compute_average_send_time(ctx)
 
-            await _db_persist_system_events(ctx)
+                    # NOTE: download the answers for llm prompts jobs before scoring
+                    await ctx.checkpoint_system_event("_download_llm_prompts_answers")
+                    await _download_llm_prompts_answers(ctx)
 
-            await ctx.checkpoint_system_event("_emit_decline_or_failure_events")
-            _emit_decline_or_failure_events(ctx)
+                    await ctx.checkpoint_system_event("_score_jobs")
+                    await _score_jobs(ctx)
 
-        else:
-            logger.warning("No executors available")
+                    await ctx.checkpoint_system_event("_send_job_finished_receipts")
+                    await _send_job_finished_receipts(ctx)
 
-    except (Exception, asyncio.CancelledError) as exc:
-        logger.error("Synthetic jobs batch failure: %r", exc)
-        ctx.system_event(
-            type=SystemEvent.EventType.VALIDATOR_FAILURE,
-            subtype=SystemEvent.EventSubType.GENERIC_ERROR,
-            description=repr(exc),
-            func="execute_synthetic_batch_run",
-        )
+                else:
+                    logger.warning("No jobs accepted")
 
-    await _db_persist_system_events(ctx)
+                await ctx.checkpoint_system_event("_emit_decline_or_failure_events")
+                _emit_decline_or_failure_events(ctx)
 
-    await ctx.checkpoint_system_event("_multi_close_client")
-    try:
-        await _multi_close_client(ctx)
-    except (Exception, asyncio.CancelledError) as exc:
-        logger.error("Synthetic jobs batch failure: %r", exc)
-        ctx.system_event(
-            type=SystemEvent.EventType.VALIDATOR_FAILURE,
-            subtype=SystemEvent.EventSubType.GENERIC_ERROR,
-            description=repr(exc),
-            func="_multi_close_client",
-        )
+            else:
+                logger.warning("No executors available")
 
-    await ctx.checkpoint_system_event("_emit_telemetry_events")
-    try:
-        _emit_telemetry_events(ctx)
-    except (Exception, asyncio.CancelledError) as exc:
-        logger.error("Synthetic jobs batch failure: %r", exc)
-        ctx.system_event(
-            type=SystemEvent.EventType.VALIDATOR_FAILURE,
-            subtype=SystemEvent.EventSubType.GENERIC_ERROR,
-            description=repr(exc),
-            func="_emit_telemetry_events",
-        )
+        except (Exception, asyncio.CancelledError) as exc:
+            logger.error("Synthetic jobs batch failure: %r", exc)
+            ctx.system_event(
+                type=SystemEvent.EventType.VALIDATOR_FAILURE,
+                subtype=SystemEvent.EventSubType.GENERIC_ERROR,
+                description=repr(exc),
+                func="execute_synthetic_batch_run",
+            )
 
-    await _db_persist_system_events(ctx)
+        ctx.event_writer.paused = False
 
-    await ctx.checkpoint_system_event("_db_persist")
-    await _db_persist(ctx)
+        await ctx.checkpoint_system_event("_multi_close_client")
+        try:
+            await _multi_close_client(ctx)
+        except (Exception, asyncio.CancelledError) as exc:
+            logger.error("Synthetic jobs batch failure: %r", exc)
+            ctx.system_event(
+                type=SystemEvent.EventType.VALIDATOR_FAILURE,
+                subtype=SystemEvent.EventSubType.GENERIC_ERROR,
+                description=repr(exc),
+                func="_multi_close_client",
+            )
 
-    # we turn off specs cause it is unreliable to send them over channels and we
-    # have already this data in telemetry event - but processing telemetry is slow
-    # so we might try this way another time - just turn it of as hotfix
-    if _SEND_MACHINE_SPECS:
-        # send the machine specs after the batch is done, it can fail or take a long time
-        await ctx.checkpoint_system_event("_send_machine_specs")
+        await ctx.checkpoint_system_event("_emit_telemetry_events")
         try:
-            await _send_machine_specs(ctx)
+            _compute_send_skew(ctx)
+            _emit_telemetry_events(ctx)
         except (Exception, asyncio.CancelledError) as exc:
             logger.error("Synthetic jobs batch failure: %r", exc)
+            ctx.system_event(
+                type=SystemEvent.EventType.VALIDATOR_FAILURE,
+                subtype=SystemEvent.EventSubType.GENERIC_ERROR,
+                description=repr(exc),
+                func="_emit_telemetry_events",
+            )
+
+        if shard is None:
+            await ctx.checkpoint_system_event("_db_persist")
+            await _db_persist(ctx)
+        else:
+            await ctx.checkpoint_system_event("_get_batch_result")
+            result = _get_batch_result(ctx)
+
+        # we turn off specs cause it is unreliable to send them over channels and we
+        # have already this data in telemetry event - but processing telemetry is slow
+        # so we might try this way another time - just turn it of as hotfix
+        if _SEND_MACHINE_SPECS:
+            # send the machine specs after the batch is done, it can fail or take a long time
+            await ctx.checkpoint_system_event("_send_machine_specs")
+            try:
+                await _send_machine_specs(ctx)
+            except (Exception, asyncio.CancelledError) as exc:
+                logger.error("Synthetic jobs batch failure: %r", exc)
 
-    await _db_persist_system_events(ctx)
+        await ctx.checkpoint_system_event("BATCH_END")
+    finally:
+        await ctx.download_client.aclose()
+        # flush the remaining system events, even if the batch was cancelled
+        await ctx.event_writer.close()
 
-    await ctx.checkpoint_system_event("BATCH_END")
+    return result
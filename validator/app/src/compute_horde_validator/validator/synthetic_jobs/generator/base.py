@@ -55,6 +55,10 @@ class BaseSyntheticJobGenerator(abc.ABC):
 
 
 class BaseSyntheticJobGeneratorFactory(abc.ABC):
+    # whether `create` builds hashcat generators from a `pregenerated_job` kwarg
+    # (see PregeneratedHashcatJob) - batches only claim pregenerated jobs if it does
+    uses_pregenerated_hashcat_jobs: bool = False
+
     @abc.abstractmethod
     async def create(
         self, executor_class: ExecutorClass, **kwargs
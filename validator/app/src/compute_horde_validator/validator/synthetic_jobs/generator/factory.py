@@ -13,6 +13,8 @@ from compute_horde_validator.validator.synthetic_jobs.generator.llm_prompts impo
 
 
 class DefaultSyntheticJobGeneratorFactory(BaseSyntheticJobGeneratorFactory):
+    uses_pregenerated_hashcat_jobs = True
+
     async def create(self, executor_class: ExecutorClass, **kwargs) -> BaseSyntheticJobGenerator:
         if executor_class == ExecutorClass.always_on__llm__a6000:
             return LlmPromptsSyntheticJobGenerator(**kwargs)
@@ -1,56 +1,84 @@
+import pickle
+from collections.abc import Iterator, Sequence
+
 from asgiref.sync import sync_to_async
 from compute_horde.base.volume import InlineVolume, Volume
 from compute_horde.mv_protocol.miner_requests import V0JobFinishedRequest
+from django.conf import settings
 
 from compute_horde_validator.validator.dynamic_config import aget_weights_version
+from compute_horde_validator.validator.models import PregeneratedHashcatJob
 from compute_horde_validator.validator.synthetic_jobs.generator.base import (
     BaseSyntheticJobGenerator,
 )
-from compute_horde_validator.validator.synthetic_jobs.synthetic_job import (
-    HASHJOB_PARAMS,
-    Algorithm,
+from compute_horde_validator.validator.synthetic_jobs.hashcat_jobs import (
+    generate_encoded_hash_job,
+    generate_encoded_hash_jobs,
+    generate_hash_job,
 )
-from compute_horde_validator.validator.synthetic_jobs.v0_synthetic_job import V0SyntheticJob
-from compute_horde_validator.validator.synthetic_jobs.v1_synthetic_job import V1SyntheticJob
-from compute_horde_validator.validator.synthetic_jobs.v2_synthetic_job import V2SyntheticJob
 from compute_horde_validator.validator.utils import single_file_zip
 
 MAX_SCORE = 2
 
 
+def pregenerate_hash_jobs(
+    weights_version: int, miner_hotkeys: Sequence[str | None]
+) -> Iterator[PregeneratedHashcatJob]:
+    """
+    Generate hashcat jobs with their answers and payload volumes precomputed, to be stored in db.
+    The work is spread over `settings.SYNTHETIC_JOBS_GENERATION_PROCESSES` processes.
+    """
+    for miner_hotkey, encoded_job in zip(
+        miner_hotkeys,
+        generate_encoded_hash_jobs(
+            weights_version, miner_hotkeys, settings.SYNTHETIC_JOBS_GENERATION_PROCESSES
+        ),
+    ):
+        yield PregeneratedHashcatJob(
+            weights_version=weights_version,
+            miner_hotkey=miner_hotkey,
+            hash_job=encoded_job.hash_job,
+            answer=encoded_job.answer,
+            volume_contents=encoded_job.volume_contents,
+        )
+
+
+def pregenerate_hash_job(weights_version: int, miner_hotkey: str | None) -> PregeneratedHashcatJob:
+    """Generate a single hashcat job to be stored in db, in the current process"""
+    encoded_job = generate_encoded_hash_job(weights_version, miner_hotkey)
+    return PregeneratedHashcatJob(
+        weights_version=weights_version,
+        miner_hotkey=miner_hotkey,
+        hash_job=encoded_job.hash_job,
+        answer=encoded_job.answer,
+        volume_contents=encoded_job.volume_contents,
+    )
+
+
 class GPUHashcatSyntheticJobGenerator(BaseSyntheticJobGenerator):
-    def __init__(self, **kwargs):
+    def __init__(self, pregenerated_job: PregeneratedHashcatJob | None = None, **kwargs):
         super().__init__(**kwargs)
         # set synthetic_jobs based on subnet weights_version
         self.weights_version = None
         self.hash_job = None
         self.expected_answer = None
         self.miner_hotkey = None
+        self.pregenerated_job = pregenerated_job
 
     async def ainit(self, miner_hotkey: str):
         """Allow to initialize generator in asyncio and non blocking"""
         self.miner_hotkey = miner_hotkey
+        if self.pregenerated_job is not None:
+            self.weights_version = self.pregenerated_job.weights_version
+            self.hash_job = pickle.loads(self.pregenerated_job.hash_job)
+            self.expected_answer = self.pregenerated_job.answer
+            return
         self.weights_version = await aget_weights_version()
         self.hash_job, self.expected_answer = await self._get_hash_job()
 
     @sync_to_async(thread_sensitive=False)
     def _get_hash_job(self):
-        if self.weights_version == 0:
-            algorithm = Algorithm.get_random_algorithm()
-            hash_job = V0SyntheticJob.generate(
-                algorithm, HASHJOB_PARAMS[self.weights_version][algorithm]
-            )
-        elif self.weights_version in [1, 2, 3]:
-            algorithms = Algorithm.get_all_algorithms()
-            params = [HASHJOB_PARAMS[self.weights_version][algorithm] for algorithm in algorithms]
-            hash_job = V1SyntheticJob.generate(algorithms, params)
-        elif self.weights_version == 4:
-            algorithms = Algorithm.get_all_algorithms()
-            params = [HASHJOB_PARAMS[self.weights_version][algorithm] for algorithm in algorithms]
-            hash_job = V2SyntheticJob.generate(algorithms, params, self.miner_hotkey)
-        else:
-            raise RuntimeError(f"No SyntheticJob for weights_version: {self.weights_version}")
-
+        hash_job = generate_hash_job(self.weights_version, self.miner_hotkey)
         # precompute anwer when already in thread
         return hash_job, hash_job.answer
 
@@ -80,8 +108,13 @@ class GPUHashcatSyntheticJobGenerator(BaseSyntheticJobGenerator):
     def raw_script(self) -> str | None:
         return self.hash_job.raw_script()
 
+    async def volume(self) -> Volume | None:
+        if self.pregenerated_job is not None:
+            return InlineVolume(contents=self.pregenerated_job.volume_contents)
+        return await self._volume()
+
     @sync_to_async(thread_sensitive=False)
-    def volume(self) -> Volume | None:
+    def _volume(self) -> Volume | None:
         return InlineVolume(contents=single_file_zip("payload.txt", self.hash_job.payload))
 
     def score(self, time_took: float) -> float:
@@ -1,5 +1,6 @@
 import uuid
 
+import httpx
 import pydantic
 from compute_horde.base.output_upload import MultiUpload, OutputUpload, SingleFilePutUpload
 from compute_horde.base.volume import MultiVolume, SingleFileVolume, Volume
@@ -90,8 +91,8 @@ class LlmPromptsJobGenerator(BaseSyntheticJobGenerator):
             ]
         )
 
-    async def _download_answers(self):
-        response = await download_file_content(self._url_for_download())
+    async def _download_answers(self, client: httpx.AsyncClient | None = None):
+        response = await download_file_content(self._url_for_download(), client)
         self.prompt_answers = pydantic.TypeAdapter(dict[str, str]).validate_json(response)
 
     def verify(self, msg: V0JobFinishedRequest, time_took: float) -> tuple[bool, str, float]:
@@ -0,0 +1,89 @@
+"""
+Generation of hashcat synthetic jobs in bulk.
+
+This module does not depend on django, so that it can be imported by spawned worker processes.
+"""
+
+import itertools
+import multiprocessing
+import os
+import pickle
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from compute_horde_validator.validator.synthetic_jobs.synthetic_job import (
+    HASHJOB_PARAMS,
+    Algorithm,
+    SyntheticJob,
+)
+from compute_horde_validator.validator.synthetic_jobs.v0_synthetic_job import V0SyntheticJob
+from compute_horde_validator.validator.synthetic_jobs.v1_synthetic_job import V1SyntheticJob
+from compute_horde_validator.validator.synthetic_jobs.v2_synthetic_job import V2SyntheticJob
+from compute_horde_validator.validator.utils import single_file_zip
+
+# weights versions for which the job payload depends on the miner hotkey
+MINER_BOUND_WEIGHTS_VERSIONS = {4}
+
+_CHUNK_SIZE = 16
+
+
+class EncodedHashJob(NamedTuple):
+    hash_job: bytes  # pickled SyntheticJob
+    answer: str
+    volume_contents: str  # base64 encoded zip with the job payload
+
+
+def generate_hash_job(weights_version: int, miner_hotkey: str | None) -> SyntheticJob:
+    if weights_version == 0:
+        algorithm = Algorithm.get_random_algorithm()
+        return V0SyntheticJob.generate(algorithm, HASHJOB_PARAMS[weights_version][algorithm])
+    elif weights_version in [1, 2, 3]:
+        algorithms = Algorithm.get_all_algorithms()
+        params = [HASHJOB_PARAMS[weights_version][algorithm] for algorithm in algorithms]
+        return V1SyntheticJob.generate(algorithms, params)
+    elif weights_version == 4:
+        assert miner_hotkey is not None
+        algorithms = Algorithm.get_all_algorithms()
+        params = [HASHJOB_PARAMS[weights_version][algorithm] for algorithm in algorithms]
+        return V2SyntheticJob.generate(algorithms, params, miner_hotkey)
+    else:
+        raise RuntimeError(f"No SyntheticJob for weights_version: {weights_version}")
+
+
+def generate_encoded_hash_job(weights_version: int, miner_hotkey: str | None) -> EncodedHashJob:
+    hash_job = generate_hash_job(weights_version, miner_hotkey)
+    return EncodedHashJob(
+        hash_job=pickle.dumps(hash_job),
+        answer=hash_job.answer,
+        volume_contents=single_file_zip("payload.txt", hash_job.payload),
+    )
+
+
+def generate_encoded_hash_jobs(
+    weights_version: int, miner_hotkeys: Iterable[str | None], processes: int = 0
+) -> Iterator[EncodedHashJob]:
+    """
+    Generate a job for each of `miner_hotkeys`, in order, spreading the work over `processes`
+    worker processes (0 means one per cpu core, 1 generates in the current process).
+    """
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        for miner_hotkey in miner_hotkeys:
+            yield generate_encoded_hash_job(weights_version, miner_hotkey)
+        return
+
+    # spawn instead of fork - we may be called from a process with open db connections and threads
+    executor = ProcessPoolExecutor(
+        max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+    )
+    try:
+        yield from executor.map(
+            generate_encoded_hash_job,
+            itertools.repeat(weights_version),
+            miner_hotkeys,
+            chunksize=_CHUNK_SIZE,
+        )
+    finally:
+        # don't wait for the remaining jobs if the consumer stopped early, e.g. on timeout
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,89 @@
+"""
+Sharded execution of synthetic jobs batches.
+
+The miners of a batch are split across worker processes, each running its shard of the batch
+on its own event loop, with its own miner connections. All shards start collecting manifests
+at the same moment, and ship their results back to the coordinating process for persistence.
+
+This module does not depend on django, so that it can be imported by spawned worker processes.
+"""
+
+import asyncio
+import multiprocessing
+import random
+import time
+from typing import Any, NamedTuple, TypeVar
+
+import uvloop
+
+# time to spawn the worker processes and set up django in them
+_SHARD_START_DELAY = 30
+
+T = TypeVar("T")
+
+
+class BatchShard(NamedTuple):
+    index: int
+    count: int
+    # time.monotonic() at which all shards start collecting manifests - the
+    # monotonic clock is system-wide, so it is the same in all processes
+    start_at: float
+
+
+def split_into_shards(items: list[T], count: int) -> list[list[T]]:
+    # randomized, so that the same miners don't always share a process
+    items = random.sample(items, len(items))
+    return [shard for shard in (items[index::count] for index in range(count)) if shard]
+
+
+def _init_worker() -> None:
+    import django
+
+    django.setup()
+
+
+def _run_batch_shard(
+    axons: dict[str, Any], miners: list[Any], batch_id: int | None, shard: BatchShard
+) -> Any:
+    # imported here, after django is set up in the worker process
+    from compute_horde_validator.validator.synthetic_jobs.batch_run import (
+        execute_synthetic_batch_run,
+    )
+
+    uvloop.install()
+    return asyncio.run(execute_synthetic_batch_run(axons, miners, batch_id, shard=shard))
+
+
+def run_batch_shards(
+    axons: dict[str, Any], miners: list[Any], batch_id: int | None, count: int
+) -> list[Any]:
+    """
+    Run the batch for `miners` split across `count` worker processes. Returns the `BatchResult`
+    of each shard, or the exception it failed with.
+    """
+    miner_shards = split_into_shards(miners, count)
+    start_at = time.monotonic() + _SHARD_START_DELAY
+
+    # spawn instead of fork - we are called from a process with open db connections and threads
+    mp_context = multiprocessing.get_context("spawn")
+    # the workers are terminated when leaving the block, e.g. on celery's soft time limit
+    with mp_context.Pool(processes=len(miner_shards), initializer=_init_worker) as pool:
+        async_results = [
+            pool.apply_async(
+                _run_batch_shard,
+                (
+                    {miner.hotkey: axons[miner.hotkey] for miner in shard_miners},
+                    shard_miners,
+                    batch_id,
+                    BatchShard(index=index, count=len(miner_shards), start_at=start_at),
+                ),
+            )
+            for index, shard_miners in enumerate(miner_shards)
+        ]
+        results = []
+        for async_result in async_results:
+            try:
+                results.append(async_result.get())
+            except Exception as exc:
+                results.append(exc)
+        return results
@@ -1,9 +1,12 @@
 import datetime
 import enum
 import hashlib
+import string
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
+import numpy as np
+
 
 class SyntheticJob(ABC):
     @property
@@ -90,3 +93,32 @@ HASHJOB_PARAMS = {
 HASHJOB_PARAMS[2] = HASHJOB_PARAMS[1]
 HASHJOB_PARAMS[3] = HASHJOB_PARAMS[1]
 HASHJOB_PARAMS[4] = HASHJOB_PARAMS[1]
+
+
+_LETTERS_AND_DIGITS = np.frombuffer((string.ascii_letters + string.digits).encode(), dtype=np.uint8)
+_DIGITS = np.frombuffer(string.digits.encode(), dtype=np.uint8)
+
+
+def random_passwords(params: JobParams, rng: np.random.Generator | None = None) -> list[str]:
+    """
+    Draw `params.num_hashes` distinct random passwords, sorted.
+    Passwords have `params.num_letters` alphanumeric characters followed by `params.num_digits` digits.
+    """
+    rng = rng or np.random.default_rng()
+    length = params.password_length
+    passwords = np.empty(0, dtype=f"S{length}")
+    while len(passwords) < params.num_hashes:
+        missing = params.num_hashes - len(passwords)
+        chars = np.concatenate(
+            [
+                _LETTERS_AND_DIGITS[
+                    rng.integers(len(_LETTERS_AND_DIGITS), size=(missing, params.num_letters))
+                ],
+                _DIGITS[rng.integers(len(_DIGITS), size=(missing, params.num_digits))],
+            ],
+            axis=1,
+        )
+        candidates = np.ascontiguousarray(chars).view(f"S{length}").ravel()
+        # np.unique sorts bytewise, which for ascii is the same order as sorting str
+        passwords = np.unique(np.concatenate([passwords, candidates]))
+    return [password.decode("ascii") for password in passwords.tolist()]
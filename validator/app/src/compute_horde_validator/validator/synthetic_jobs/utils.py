@@ -1,13 +1,19 @@
 import logging
-import time
 
 import bittensor
 import uvloop
 from asgiref.sync import async_to_sync
 from django.conf import settings
 
+from compute_horde_validator.validator.metagraph_client import Metagraph, get_metagraph_snapshot
 from compute_horde_validator.validator.models import Miner, SystemEvent
-from compute_horde_validator.validator.synthetic_jobs.batch_run import execute_synthetic_batch_run
+from compute_horde_validator.validator.synthetic_jobs.batch_run import (
+    BatchResult,
+    execute_synthetic_batch_run,
+    merge_batch_results,
+    persist_batch_result,
+)
+from compute_horde_validator.validator.synthetic_jobs.sharding import run_batch_shards
 
 # new synchronized flow waits longer for job responses
 SYNTHETIC_JOBS_SOFT_LIMIT = 20 * 60
@@ -16,18 +22,6 @@ SYNTHETIC_JOBS_HARD_LIMIT = SYNTHETIC_JOBS_SOFT_LIMIT + 10
 logger = logging.getLogger(__name__)
 
 
-def try_to_get_metagraph(netuid, network, tries=3):
-    for try_number in range(tries):
-        try:
-            subtensor = bittensor.subtensor(network=network)
-            return subtensor.metagraph(netuid)
-        except Exception:
-            if try_number == tries - 1:
-                raise
-            logger.exception("Encountered when fetching metagraph")
-            time.sleep(try_number + 1)
-
-
 def create_and_run_synthetic_job_batch(netuid, network, synthetic_jobs_batch_id: int | None = None):
     uvloop.install()
 
@@ -51,7 +45,7 @@ def create_and_run_synthetic_job_batch(netuid, network, synthetic_jobs_batch_id:
             )
     else:
         try:
-            metagraph = try_to_get_metagraph(netuid, network=network)
+            metagraph = get_metagraph_snapshot(netuid, network=network)
         except Exception as e:
             msg = f"Failed to get metagraph - will not run synthetic jobs: {e}"
             logger.warning(msg)
@@ -70,17 +64,53 @@ def create_and_run_synthetic_job_batch(netuid, network, synthetic_jobs_batch_id:
             if miner.hotkey in axons_by_key and axons_by_key[miner.hotkey].is_serving
         ]
 
-    async_to_sync(execute_synthetic_batch_run)(axons_by_key, miners, synthetic_jobs_batch_id)
+    if settings.SYNTHETIC_JOBS_BATCH_SHARDS > 1 and len(miners) > 1:
+        run_sharded_synthetic_job_batch(
+            axons_by_key, miners, synthetic_jobs_batch_id, settings.SYNTHETIC_JOBS_BATCH_SHARDS
+        )
+    else:
+        async_to_sync(execute_synthetic_batch_run)(axons_by_key, miners, synthetic_jobs_batch_id)
+
+
+def run_sharded_synthetic_job_batch(
+    axons_by_key: dict[str, bittensor.AxonInfo],
+    miners: list[Miner],
+    synthetic_jobs_batch_id: int | None,
+    shards: int,
+) -> None:
+    logger.info("Executing synthetic jobs batch for %d miners in %d shards", len(miners), shards)
+    results: list[BatchResult] = []
+    for result in run_batch_shards(axons_by_key, miners, synthetic_jobs_batch_id, shards):
+        if isinstance(result, BaseException):
+            # the jobs of the shard's miners are lost, same as when miners fail to respond
+            msg = f"Synthetic jobs batch shard failed: {result!r}"
+            logger.error(msg)
+            SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).create(
+                type=SystemEvent.EventType.VALIDATOR_FAILURE,
+                subtype=SystemEvent.EventSubType.GENERIC_ERROR,
+                long_description=msg,
+                data={"func": "run_sharded_synthetic_job_batch"},
+            )
+        elif result is not None:
+            results.append(result)
+
+    if results:
+        persist_batch_result(
+            synthetic_jobs_batch_id,
+            axons_by_key,
+            {miner.hotkey: miner for miner in miners},
+            merge_batch_results(results),
+        )
 
 
-def get_miners(metagraph) -> list[Miner]:
+def get_miners(metagraph: Metagraph) -> list[Miner]:
     keys = {n.hotkey for n in metagraph.neurons}
     existing = list(Miner.objects.filter(hotkey__in=keys))
     existing_keys = {m.hotkey for m in existing}
     new_miners = Miner.objects.bulk_create(
         [Miner(hotkey=n.hotkey) for n in metagraph.neurons if n.hotkey not in existing_keys]
     )
-    data = {"block": metagraph.block.item()}
+    data = {"block": metagraph.block}
     if new_miners:
         data["new_miners"] = len(new_miners)
     SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).create(
@@ -1,12 +1,10 @@
 import hashlib
 import pickle
-import random
 import secrets
-import string
 from base64 import b64encode
 from dataclasses import dataclass
 from pathlib import Path
-from typing import ClassVar, Self
+from typing import Self
 
 from cryptography.fernet import Fernet
 
@@ -15,6 +13,7 @@ from compute_horde_validator.validator.synthetic_jobs.synthetic_job import (
     Algorithm,
     JobParams,
     SyntheticJob,
+    random_passwords,
 )
 
 
@@ -25,30 +24,12 @@ class V1SyntheticJob(SyntheticJob):
     salts: list[bytes]
     params: list[JobParams]
 
-    DIGITS: ClassVar[str] = string.digits
-    ALPHABET: ClassVar[str] = string.ascii_letters + DIGITS
-
-    @classmethod
-    def random_string(cls, num_letters: int, num_digits: int) -> str:
-        return "".join(random.choice(cls.ALPHABET) for _ in range(num_letters)) + "".join(
-            random.choice(cls.DIGITS) for _ in range(num_digits)
-        )
-
     @classmethod
     def generate(
         cls, algorithms: list[Algorithm], params: list[JobParams], salt_length_bytes: int = 8
     ) -> Self:
         # generate distinct passwords for each algorithm
-        passwords = []
-        for _params in params:
-            _passwords = set()
-            while len(_passwords) < _params.num_hashes:
-                _passwords.add(
-                    cls.random_string(
-                        num_letters=_params.num_letters, num_digits=_params.num_digits
-                    )
-                )
-            passwords.append(sorted(list(_passwords)))
+        passwords = [random_passwords(_params) for _params in params]
 
         return cls(
             algorithms=algorithms,
@@ -65,8 +46,11 @@ class V1SyntheticJob(SyntheticJob):
         return ["?1" * params.num_letters + "?d" * params.num_digits for params in self.params]
 
     def hash_hexes(self, i) -> list[str]:
+        algorithm = self.algorithms[i]
+        hash_function = algorithm.params[algorithm]["hash_function"]
+        salt = self.salts[i]
         return [
-            self.algorithms[i].hash(password.encode("ascii") + self.salts[i]).hexdigest()
+            hash_function(password.encode("ascii") + salt).hexdigest()
             for password in self.passwords[i]
         ]
 
@@ -15,6 +15,7 @@ from compute_horde_validator.validator.synthetic_jobs.synthetic_job import (
     Algorithm,
     JobParams,
     SyntheticJob,
+    random_passwords,
 )
 
 
@@ -44,16 +45,7 @@ class V2SyntheticJob(SyntheticJob):
         salt_length_bytes: int = 8,
     ) -> Self:
         # generate distinct passwords for each algorithm
-        passwords = []
-        for _params in params:
-            _passwords = set()
-            while len(_passwords) < _params.num_hashes:
-                _passwords.add(
-                    cls.random_string(
-                        num_letters=_params.num_letters, num_digits=_params.num_digits
-                    )
-                )
-            passwords.append(sorted(list(_passwords)))
+        passwords = [random_passwords(_params) for _params in params]
 
         first_password = f"{miner_hotkey}-{cls.random_string(num_letters=48, num_digits=0)}"
 
@@ -73,8 +65,11 @@ class V2SyntheticJob(SyntheticJob):
         return ["?1" * params.num_letters + "?d" * params.num_digits for params in self.params]
 
     def hash_hexes(self, i) -> list[str]:
+        algorithm = self.algorithms[i]
+        hash_function = algorithm.params[algorithm]["hash_function"]
+        salt = self.salts[i]
         return [
-            self.algorithms[i].hash(password.encode("ascii") + self.salts[i]).hexdigest()
+            hash_function(password.encode("ascii") + salt).hexdigest()
             for password in self.passwords[i]
         ]
 
@@ -0,0 +1,164 @@
+"""
+Shipping system events to the stats collector of the facilitator.
+
+Events are claimed in batches by short transactions, which skip the rows locked by concurrent
+shippers and mark the claimed events, and are marked as sent once the stats collector acknowledges
+them. Uploads run outside of any transaction over a pooled http client, so a slow stats collector
+holds neither row locks nor a database connection. Events of a failed upload are released, and
+claims of a shipper which died are taken over after a timeout.
+
+The size of batches adapts to the upload time: it grows while the stats collector keeps up, and
+shrinks when it slows down.
+
+Sent events are deleted after `SYSTEM_EVENTS_RETENTION_DAYS`, in bounded chunks.
+"""
+
+import gzip
+import json
+import logging
+import time
+from datetime import timedelta
+
+import bittensor
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils.timezone import now
+
+from compute_horde_validator.validator.models import SystemEvent
+from compute_horde_validator.validator.utils import delete_in_chunks
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_EVENTS_UPLOAD_TIMEOUT = 30
+# claims older than this are assumed to be left by a shipper which died
+SYSTEM_EVENTS_CLAIM_TIMEOUT = timedelta(minutes=5)
+SYSTEM_EVENTS_INITIAL_BATCH_SIZE = 1_000
+SYSTEM_EVENTS_MIN_BATCH_SIZE = 100
+SYSTEM_EVENTS_MAX_BATCH_SIZE = 10_000
+# batches uploaded faster than this grow, slower ones shrink
+SYSTEM_EVENTS_TARGET_UPLOAD_TIME = 2.0
+# a run stops claiming new batches after this many seconds, the next one carries on
+SYSTEM_EVENTS_MAX_SHIPPING_TIME = 240
+# old events are deleted this many at a time, each chunk in a short transaction of its own
+SYSTEM_EVENTS_DELETE_CHUNK_SIZE = 10_000
+
+
+def _events():
+    return SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS)
+
+
+def _claim_events(limit: int) -> list[SystemEvent]:
+    claim_expired_at = now() - SYSTEM_EVENTS_CLAIM_TIMEOUT
+    with transaction.atomic(using=settings.DEFAULT_DB_ALIAS):
+        events = list(
+            _events()
+            .filter(sent=False)
+            .filter(Q(claimed_at__isnull=True) | Q(claimed_at__lt=claim_expired_at))
+            .select_for_update(skip_locked=True)
+            .order_by("id")[:limit]
+        )
+        if events:
+            _events().filter(id__in=[event.id for event in events]).update(claimed_at=now())
+    return events
+
+
+def _encode_events(events: list[SystemEvent], compress: bool) -> bytes:
+    body = json.dumps([event.to_dict() for event in events]).encode()
+    if compress:
+        return gzip.compress(body)
+    return body
+
+
+def _mark_events_sent(event_ids: list[int]) -> None:
+    _events().filter(id__in=event_ids).update(sent=True)
+
+
+def _release_events(event_ids: list[int]) -> None:
+    _events().filter(id__in=event_ids).update(claimed_at=None)
+
+
+def _get_next_batch_size(batch_size: int, upload_time: float) -> int:
+    if upload_time < SYSTEM_EVENTS_TARGET_UPLOAD_TIME:
+        return min(batch_size * 2, SYSTEM_EVENTS_MAX_BATCH_SIZE)
+    return max(batch_size // 2, SYSTEM_EVENTS_MIN_BATCH_SIZE)
+
+
+async def _upload_events(
+    client: httpx.AsyncClient, keypair: bittensor.Keypair, body: bytes, compressed: bool
+) -> httpx.Response:
+    hotkey = keypair.ss58_address
+    signing_timestamp = int(time.time())
+    to_sign = json.dumps(
+        {"signing_timestamp": signing_timestamp, "validator_ss58_address": hotkey},
+        sort_keys=True,
+    )
+    headers = {
+        "Content-Type": "application/json",
+        "Validator-Signature": f"0x{keypair.sign(to_sign).hex()}",
+        "Validator-Signing-Timestamp": str(signing_timestamp),
+    }
+    if compressed:
+        headers["Content-Encoding"] = "gzip"
+    url = settings.STATS_COLLECTOR_URL + f"validator/{hotkey}/system_events"
+    return await client.post(url, content=body, headers=headers)
+
+
+async def ship_system_events(keypair: bittensor.Keypair) -> int:
+    """
+    Send unsent system events to the stats collector, until there are none left, an upload fails,
+    or the shipping time runs out. Returns the number of events sent.
+    """
+    compress = settings.STATS_COLLECTOR_GZIP
+    batch_size = SYSTEM_EVENTS_INITIAL_BATCH_SIZE
+    deadline = time.monotonic() + SYSTEM_EVENTS_MAX_SHIPPING_TIME
+    sent_count = 0
+
+    async with httpx.AsyncClient(timeout=SYSTEM_EVENTS_UPLOAD_TIMEOUT) as client:
+        while time.monotonic() < deadline:
+            events = await sync_to_async(_claim_events)(batch_size)
+            if not events:
+                break
+            event_ids = [event.id for event in events]
+            body = await sync_to_async(_encode_events)(events, compress)
+
+            upload_start = time.monotonic()
+            try:
+                response = await _upload_events(client, keypair, body, compress)
+                error = None if response.status_code == 201 else repr(response)
+            except Exception as exc:
+                # whatever went wrong, the claimed events have to be released
+                error = repr(exc)
+            upload_time = time.monotonic() - upload_start
+
+            if error is not None:
+                logger.error(f"Failed to send system events to facilitator: {error}")
+                await sync_to_async(_release_events)(event_ids)
+                break
+
+            await sync_to_async(_mark_events_sent)(event_ids)
+            sent_count += len(events)
+            logger.info(
+                f"Sent {len(events)} system events to facilitator "
+                f"({len(body)} bytes in {upload_time:.2f}s)"
+            )
+
+            if len(events) < batch_size:
+                # the backlog is drained
+                break
+            batch_size = _get_next_batch_size(batch_size, upload_time)
+
+    return sent_count
+
+
+def delete_old_system_events() -> int:
+    """
+    Delete the events sent to the stats collector before the retention period.
+    Unsent events are kept. Returns the number of deleted events.
+    """
+    cutoff = now() - timedelta(days=settings.SYSTEM_EVENTS_RETENTION_DAYS)
+    return delete_in_chunks(
+        _events().filter(sent=True, timestamp__lt=cutoff), SYSTEM_EVENTS_DELETE_CHUNK_SIZE
+    )
@@ -1,10 +1,11 @@
+import asyncio
 import contextlib
-import json
 import numbers
 import random
 import time
 import traceback
 import uuid
+from collections import defaultdict
 from datetime import timedelta
 from functools import cached_property
 from math import ceil, floor
@@ -13,44 +14,56 @@ import billiard.exceptions
 import bittensor
 import celery.exceptions
 import numpy as np
-import requests
 from asgiref.sync import async_to_sync
 from bittensor.utils.weight_utils import process_weights_for_netuid
 from celery import shared_task
 from celery.result import allow_join_result
 from celery.utils.log import get_task_logger
 from compute_horde.dynamic_config import sync_dynamic_config
-from compute_horde.receipts import (
-    JobFinishedReceiptPayload,
-    JobStartedReceiptPayload,
-    get_miner_receipts,
-)
+from compute_horde.executor_class import ExecutorClass
+from compute_horde.receipts import get_miner_receipts
 from compute_horde.utils import ValidatorListError, get_validators
 from constance import config
 from django.conf import settings
 from django.db import transaction
+from django.db.models import Count, Q
 from django.utils.timezone import now
 
 from compute_horde_validator.celery import app
 from compute_horde_validator.validator.cross_validation.prompt_answering import answer_prompts
 from compute_horde_validator.validator.cross_validation.prompt_generation import generate_prompts
-from compute_horde_validator.validator.locks import Locked, LockType, get_advisory_lock
-from compute_horde_validator.validator.metagraph_client import get_miner_axon_info
+from compute_horde_validator.validator.dynamic_config import get_weights_version
+from compute_horde_validator.validator.locks import (
+    Locked,
+    LockType,
+    advisory_lease,
+    get_advisory_lock,
+)
+from compute_horde_validator.validator.metagraph_client import (
+    get_metagraph_snapshot,
+    get_miner_axon_info,
+)
 from compute_horde_validator.validator.models import (
     Cycle,
-    JobFinishedReceipt,
-    JobStartedReceipt,
     OrganicJob,
+    PregeneratedHashcatJob,
     Prompt,
     PromptSample,
     PromptSeries,
     SolveWorkload,
+    SyntheticJob,
     SyntheticJobBatch,
     SystemEvent,
     Weights,
 )
 from compute_horde_validator.validator.organic_jobs.miner_client import MinerClient
 from compute_horde_validator.validator.organic_jobs.miner_driver import execute_organic_job
+from compute_horde_validator.validator.receipts import (
+    MinerAxon,
+    collect_receipts,
+    delete_old_receipts,
+    store_miner_receipts,
+)
 from compute_horde_validator.validator.s3 import (
     download_prompts_from_s3_url,
     generate_upload_url,
@@ -61,12 +74,22 @@ from compute_horde_validator.validator.synthetic_jobs.batch_run import (
     SYNTHETIC_JOBS_HARD_LIMIT,
     SYNTHETIC_JOBS_SOFT_LIMIT,
 )
+from compute_horde_validator.validator.synthetic_jobs.generator.gpu_hashcat import (
+    pregenerate_hash_jobs,
+)
+from compute_horde_validator.validator.synthetic_jobs.hashcat_jobs import (
+    MINER_BOUND_WEIGHTS_VERSIONS,
+)
 from compute_horde_validator.validator.synthetic_jobs.utils import (
     create_and_run_synthetic_job_batch,
 )
+from compute_horde_validator.validator.system_events import (
+    delete_old_system_events,
+    ship_system_events,
+)
 
 from .models import AdminJobRequest
-from .scoring import score_batches
+from .scoring import score_batches_cached
 
 logger = get_task_logger(__name__)
 
@@ -80,6 +103,9 @@ WEIGHT_SETTING_HARD_TTL = 65
 WEIGHT_SETTING_ATTEMPTS = 100
 WEIGHT_SETTING_FAILURE_BACKOFF = 5
 
+PREGENERATED_SYNTHETIC_JOB_MAX_AGE = timedelta(days=1)
+PREGENERATED_SYNTHETIC_JOBS_CHUNK_SIZE = 100
+
 
 class WeightsRevealError(Exception):
     pass
@@ -333,6 +359,56 @@ def _run_synthetic_jobs(synthetic_jobs_batch_id: int) -> None:
         logger.info("Running synthetic jobs timed out")
 
 
+def _get_scheduled_synthetic_job_batch(
+    current_block: int, wait_in_advance_blocks: int
+) -> SyntheticJobBatch | None:
+    """
+    Select (and lock) the batch that should run within `wait_in_advance_blocks` blocks. Batches
+    overslept by up to DYNAMIC_SYNTHETIC_JOBS_PLANNER_MAX_OVERSLEEP_BLOCKS are still run.
+    Must be called in a transaction.
+    """
+    ongoing_synthetic_job_batches = list(
+        SyntheticJobBatch.objects.select_for_update(skip_locked=True)
+        .filter(
+            block__gte=current_block - config.DYNAMIC_SYNTHETIC_JOBS_PLANNER_MAX_OVERSLEEP_BLOCKS,
+            block__lte=current_block + wait_in_advance_blocks,
+            started_at__isnull=True,
+        )
+        .order_by("block")
+    )
+    if not ongoing_synthetic_job_batches:
+        logger.debug("No ongoing scheduled synthetic jobs, current block is %s", current_block)
+        return None
+
+    if len(ongoing_synthetic_job_batches) > 1:
+        logger.warning(
+            "More than one scheduled synthetic jobs found (%s)",
+            ongoing_synthetic_job_batches,
+        )
+
+    return ongoing_synthetic_job_batches[0]
+
+
+def _report_overslept_synthetic_job_batch(batch: SyntheticJobBatch, current_block: int) -> None:
+    logger.info(
+        "Overslept a batch run, but still within acceptable margin, batch_id: %s, should_run_at_block: %s, current_block: %s",
+        batch.id,
+        batch.block,
+        current_block,
+    )
+    SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).create(
+        type=SystemEvent.EventType.VALIDATOR_OVERSLEPT_SCHEDULED_JOB_WARNING,
+        subtype=SystemEvent.EventSubType.WARNING,
+        long_description="Overslept a batch run, but still within acceptable margin",
+        data={
+            "batch_id": batch.id,
+            "batch_created_at": str(batch.created_at),
+            "should_run_at_block": batch.block,
+            "current_block": current_block,
+        },
+    )
+
+
 @app.task()
 def run_synthetic_jobs(
     wait_in_advance_blocks: int | None = None,
@@ -367,47 +443,14 @@ def run_synthetic_jobs(
     current_block = subtensor_.get_current_block()
 
     with transaction.atomic():
-        ongoing_synthetic_job_batches = list(
-            SyntheticJobBatch.objects.select_for_update(skip_locked=True)
-            .filter(
-                block__gte=current_block
-                - config.DYNAMIC_SYNTHETIC_JOBS_PLANNER_MAX_OVERSLEEP_BLOCKS,
-                block__lte=current_block + wait_in_advance_blocks,
-                started_at__isnull=True,
-            )
-            .order_by("block")
-        )
-        if not ongoing_synthetic_job_batches:
-            logger.debug("No ongoing scheduled synthetic jobs, current block is %s", current_block)
+        batch = _get_scheduled_synthetic_job_batch(current_block, wait_in_advance_blocks)
+        if batch is None:
             return
 
-        if len(ongoing_synthetic_job_batches) > 1:
-            logger.warning(
-                "More than one scheduled synthetic jobs found (%s)",
-                ongoing_synthetic_job_batches,
-            )
-
-        batch = ongoing_synthetic_job_batches[0]
         target_block = batch.block
         blocks_to_wait = target_block - current_block
         if blocks_to_wait < 0:
-            logger.info(
-                "Overslept a batch run, but still within acceptable margin, batch_id: %s, should_run_at_block: %s, current_block: %s",
-                batch.id,
-                batch.block,
-                current_block,
-            )
-            SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).create(
-                type=SystemEvent.EventType.VALIDATOR_OVERSLEPT_SCHEDULED_JOB_WARNING,
-                subtype=SystemEvent.EventSubType.WARNING,
-                long_description="Overslept a batch run, but still within acceptable margin",
-                data={
-                    "batch_id": batch.id,
-                    "batch_created_at": str(batch.created_at),
-                    "should_run_at_block": batch.block,
-                    "current_block": current_block,
-                },
-            )
+            _report_overslept_synthetic_job_batch(batch, current_block)
         elif blocks_to_wait == 0:
             logger.info(
                 "Woke up just in time to run batch, batch_id: %s, should_run_at_block: %s",
@@ -458,6 +501,29 @@ def run_synthetic_jobs(
     _run_synthetic_jobs.apply_async(kwargs={"synthetic_jobs_batch_id": batch.id})
 
 
+def start_synthetic_job_batch(current_block: int) -> None:
+    """
+    Start the batch scheduled at `current_block`, without waiting for the block to come - used by
+    the block watcher, which calls it on every new block.
+    """
+    if not config.SERVING:
+        logger.debug("Not running synthetic jobs, SERVING is disabled in constance config")
+        return
+
+    with transaction.atomic():
+        batch = _get_scheduled_synthetic_job_batch(current_block, wait_in_advance_blocks=0)
+        if batch is None:
+            return
+
+        if batch.block < current_block:
+            _report_overslept_synthetic_job_batch(batch, current_block)
+
+        batch.started_at = now()
+        batch.save()
+
+    _run_synthetic_jobs.apply_async(kwargs={"synthetic_jobs_batch_id": batch.id})
+
+
 @app.task()
 def check_missed_synthetic_jobs() -> None:
     """
@@ -488,6 +554,71 @@ def check_missed_synthetic_jobs() -> None:
         past_job_batches.update(is_missed=True)
 
 
+@app.task(
+    soft_time_limit=4 * 60 + 50,
+    time_limit=5 * 60,
+)
+def pregenerate_synthetic_jobs() -> None:
+    """
+    Keep a pool of hashcat jobs ready for the next batch, so it does not have to generate them
+    between getting manifests and sending jobs. The pool is sized after the previous batch,
+    with some headroom.
+    """
+    weights_version = get_weights_version()
+    PregeneratedHashcatJob.objects.filter(
+        ~Q(weights_version=weights_version)
+        | Q(created_at__lt=now() - PREGENERATED_SYNTHETIC_JOB_MAX_AGE)
+    ).delete()
+
+    last_job = SyntheticJob.objects.order_by("-id").first()
+    if last_job is None:
+        logger.info("No previous synthetic job batch - skipping synthetic jobs pregeneration")
+        return
+
+    miner_bound = weights_version in MINER_BOUND_WEIGHTS_VERSIONS
+    previous_counts = (
+        SyntheticJob.objects.filter(batch_id=last_job.batch_id)
+        .exclude(executor_class=ExecutorClass.always_on__llm__a6000)
+        .values("miner__hotkey")
+        .annotate(count=Count("id"))
+    )
+    target_counts: dict[str | None, int] = defaultdict(int)
+    for row in previous_counts:
+        hotkey = row["miner__hotkey"] if miner_bound else None
+        target_counts[hotkey] += row["count"]
+
+    pool_counts = dict(
+        PregeneratedHashcatJob.objects.filter(weights_version=weights_version)
+        .values("miner_hotkey")
+        .annotate(count=Count("id"))
+        .values_list("miner_hotkey", "count")
+    )
+
+    headroom = config.DYNAMIC_SYNTHETIC_JOBS_PREGENERATION_HEADROOM
+    miner_hotkeys: list[str | None] = []
+    for hotkey, previous_count in target_counts.items():
+        needed = ceil(previous_count * (1 + headroom)) - pool_counts.get(hotkey, 0)
+        miner_hotkeys.extend([hotkey] * max(needed, 0))
+
+    generated = 0
+    try:
+        pregenerated_jobs = []
+        for pregenerated_job in pregenerate_hash_jobs(weights_version, miner_hotkeys):
+            pregenerated_jobs.append(pregenerated_job)
+            if len(pregenerated_jobs) == PREGENERATED_SYNTHETIC_JOBS_CHUNK_SIZE:
+                PregeneratedHashcatJob.objects.bulk_create(pregenerated_jobs)
+                generated += len(pregenerated_jobs)
+                pregenerated_jobs = []
+        PregeneratedHashcatJob.objects.bulk_create(pregenerated_jobs)
+        generated += len(pregenerated_jobs)
+    except billiard.exceptions.SoftTimeLimitExceeded:
+        # the pool will be topped up by the next run
+        logger.info("Pregenerating synthetic jobs timed out after generating %d jobs", generated)
+        return
+
+    logger.info("Pregenerated %d synthetic jobs", generated)
+
+
 def _normalize_weights_for_committing(weights: list[numbers.Number], max_: int):
     factor = max_ / max(weights)
     return [round(w * factor) for w in weights]
@@ -730,115 +861,119 @@ def set_scores():
             return
 
     with save_event_on_error(SystemEvent.EventSubType.GENERIC_ERROR):
-        with transaction.atomic():
-            try:
-                get_advisory_lock(LockType.WEIGHT_SETTING)
-            except Locked:
-                logger.debug("Another thread already setting weights")
-                return
+        try:
+            # no transaction is kept open while talking to the chain, which can take minutes
+            with advisory_lease(LockType.WEIGHT_SETTING):
+                weights = _compute_weights(subtensor, current_block)
+                if weights is not None:
+                    _set_weights_on_chain(*weights)
+        except Locked:
+            logger.debug("Another thread already setting weights")
 
-            metagraph = get_metagraph(subtensor, netuid=settings.BITTENSOR_NETUID)
-            neurons = metagraph.neurons
-            hotkey_to_uid = {n.hotkey: n.uid for n in neurons}
-            score_per_uid = {}
-            batches = list(
-                SyntheticJobBatch.objects.select_related("cycle")
-                .filter(
-                    scored=False,
-                    started_at__gte=now() - timedelta(days=1),
-                    cycle__stop__lt=current_block,
-                )
-                .order_by("-started_at")
-            )
-            if not batches:
-                logger.info("No batches - nothing to score")
-                return
-            if len(batches) > 1:
-                logger.error("Unexpected number batches eligible for scoring: %s", len(batches))
-                for batch in batches[:-1]:
-                    batch.scored = True
-                    batch.save()
-                batches = [batches[-1]]
-
-            hotkey_scores = score_batches(batches)
-            for hotkey, score in hotkey_scores.items():
-                uid = hotkey_to_uid.get(hotkey)
-                if uid is None:
-                    continue
-                score_per_uid[uid] = score
 
-            if not score_per_uid:
-                logger.info("No miners on the subnet to score")
-                return
-            uids = np.zeros(len(neurons), dtype=np.int64)
-            weights = np.zeros(len(neurons), dtype=np.float32)
-            for ind, n in enumerate(neurons):
-                uids[ind] = n.uid
-                weights[ind] = score_per_uid.get(n.uid, 0)
-
-            uids, weights = process_weights_for_netuid(
-                uids,
-                weights,
-                settings.BITTENSOR_NETUID,
-                subtensor,
-                metagraph,
-            )
+def _compute_weights(
+    subtensor: bittensor.subtensor, current_block: int
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+    Score the batch eligible for scoring and mark it as scored. Returns the uids and weights to set,
+    or None if there is nothing to set.
+    """
+    metagraph = get_metagraph(subtensor, netuid=settings.BITTENSOR_NETUID)
+    neurons = metagraph.neurons
+    batches = list(
+        SyntheticJobBatch.objects.select_related("cycle")
+        .filter(
+            scored=False,
+            started_at__gte=now() - timedelta(days=1),
+            cycle__stop__lt=current_block,
+        )
+        .order_by("-started_at")
+    )
+    if not batches:
+        logger.info("No batches - nothing to score")
+        return None
+    if len(batches) > 1:
+        logger.error("Unexpected number batches eligible for scoring: %s", len(batches))
+        SyntheticJobBatch.objects.filter(id__in=[batch.id for batch in batches[:-1]]).update(
+            scored=True
+        )
+        batches = [batches[-1]]
+
+    hotkey_scores = score_batches_cached(batches)
+    hotkey_to_uid = {n.hotkey: n.uid for n in neurons}
+    score_per_uid = {
+        hotkey_to_uid[hotkey]: score
+        for hotkey, score in hotkey_scores.items()
+        if hotkey in hotkey_to_uid
+    }
+    if not score_per_uid:
+        logger.info("No miners on the subnet to score")
+        return None
+
+    uids = np.array([n.uid for n in neurons], dtype=np.int64)
+    weights = np.array([score_per_uid.get(n.uid, 0) for n in neurons], dtype=np.float32)
+    uids, weights = process_weights_for_netuid(
+        uids,
+        weights,
+        settings.BITTENSOR_NETUID,
+        subtensor,
+        metagraph,
+    )
 
-            for batch in batches:
-                batch.scored = True
-                batch.save()
+    SyntheticJobBatch.objects.filter(id__in=[batch.id for batch in batches]).update(scored=True)
+    return uids, weights
 
-            for try_number in range(WEIGHT_SETTING_ATTEMPTS):
-                logger.debug(
-                    f"Setting weights (attempt #{try_number}):\nuids={uids}\nscores={weights}"
-                )
-                success = False
 
-                try:
-                    result = do_set_weights.apply_async(
-                        kwargs=dict(
-                            netuid=settings.BITTENSOR_NETUID,
-                            uids=uids.tolist(),
-                            weights=weights.tolist(),
-                            wait_for_inclusion=True,
-                            wait_for_finalization=False,
-                            version_key=SCORING_ALGO_VERSION,
-                        ),
-                        soft_time_limit=WEIGHT_SETTING_TTL,
-                        time_limit=WEIGHT_SETTING_HARD_TTL,
-                    )
-                    logger.info(f"Setting weights task id: {result.id}")
-                    try:
-                        with allow_join_result():
-                            success, msg = result.get(timeout=WEIGHT_SETTING_TTL)
-                    except (celery.exceptions.TimeoutError, billiard.exceptions.TimeLimitExceeded):
-                        result.revoke(terminate=True)
-                        logger.info(f"Setting weights timed out (attempt #{try_number})")
-                        save_weight_setting_failure(
-                            subtype=SystemEvent.EventSubType.WRITING_TO_CHAIN_TIMEOUT,
-                            long_description=traceback.format_exc(),
-                            data={"try_number": try_number, "operation": "setting/committing"},
-                        )
-                        continue
-                except Exception:
-                    logger.warning("Encountered when setting weights: ", exc_info=True)
-                    save_weight_setting_failure(
-                        subtype=SystemEvent.EventSubType.WRITING_TO_CHAIN_GENERIC_ERROR,
-                        long_description=traceback.format_exc(),
-                        data={"try_number": try_number, "operation": "setting/committing"},
-                    )
-                    continue
-                if success:
-                    break
-                time.sleep(WEIGHT_SETTING_FAILURE_BACKOFF)
-            else:
-                msg = f"Failed to set weights after {WEIGHT_SETTING_ATTEMPTS} attempts"
-                logger.warning(msg)
+def _set_weights_on_chain(uids: np.ndarray, weights: np.ndarray) -> None:
+    for try_number in range(WEIGHT_SETTING_ATTEMPTS):
+        logger.debug(f"Setting weights (attempt #{try_number}):\nuids={uids}\nscores={weights}")
+        success = False
+
+        try:
+            result = do_set_weights.apply_async(
+                kwargs=dict(
+                    netuid=settings.BITTENSOR_NETUID,
+                    uids=uids.tolist(),
+                    weights=weights.tolist(),
+                    wait_for_inclusion=True,
+                    wait_for_finalization=False,
+                    version_key=SCORING_ALGO_VERSION,
+                ),
+                soft_time_limit=WEIGHT_SETTING_TTL,
+                time_limit=WEIGHT_SETTING_HARD_TTL,
+            )
+            logger.info(f"Setting weights task id: {result.id}")
+            try:
+                with allow_join_result():
+                    success, msg = result.get(timeout=WEIGHT_SETTING_TTL)
+            except (celery.exceptions.TimeoutError, billiard.exceptions.TimeLimitExceeded):
+                result.revoke(terminate=True)
+                logger.info(f"Setting weights timed out (attempt #{try_number})")
                 save_weight_setting_failure(
-                    subtype=SystemEvent.EventSubType.GIVING_UP,
-                    long_description=msg,
-                    data={"try_number": WEIGHT_SETTING_ATTEMPTS, "operation": "setting/committing"},
+                    subtype=SystemEvent.EventSubType.WRITING_TO_CHAIN_TIMEOUT,
+                    long_description=traceback.format_exc(),
+                    data={"try_number": try_number, "operation": "setting/committing"},
                 )
+                continue
+        except Exception:
+            logger.warning("Encountered when setting weights: ", exc_info=True)
+            save_weight_setting_failure(
+                subtype=SystemEvent.EventSubType.WRITING_TO_CHAIN_GENERIC_ERROR,
+                long_description=traceback.format_exc(),
+                data={"try_number": try_number, "operation": "setting/committing"},
+            )
+            continue
+        if success:
+            break
+        time.sleep(WEIGHT_SETTING_FAILURE_BACKOFF)
+    else:
+        msg = f"Failed to set weights after {WEIGHT_SETTING_ATTEMPTS} attempts"
+        logger.warning(msg)
+        save_weight_setting_failure(
+            subtype=SystemEvent.EventSubType.GIVING_UP,
+            long_description=msg,
+            data={"try_number": WEIGHT_SETTING_ATTEMPTS, "operation": "setting/committing"},
+        )
 
 
 @app.task()
@@ -1022,119 +1157,43 @@ def fetch_receipts_from_miner(hotkey: str, ip: str, port: int):
         )
         return
     logger.debug(f"Miner returned {len(receipts)} receipts. {hotkey=}")
-
-    tolerance = timedelta(hours=1)
-
-    latest_job_started_receipt = (
-        JobStartedReceipt.objects.filter(miner_hotkey=hotkey).order_by("-time_accepted").first()
-    )
-    job_started_receipt_cutoff_time = (
-        latest_job_started_receipt.time_accepted - tolerance if latest_job_started_receipt else None
-    )
-    job_started_receipt_to_create = [
-        JobStartedReceipt(
-            job_uuid=receipt.payload.job_uuid,
-            miner_hotkey=receipt.payload.miner_hotkey,
-            validator_hotkey=receipt.payload.validator_hotkey,
-            executor_class=receipt.payload.executor_class,
-            time_accepted=receipt.payload.time_accepted,
-            max_timeout=receipt.payload.max_timeout,
-        )
-        for receipt in receipts
-        if isinstance(receipt.payload, JobStartedReceiptPayload)
-        and (
-            job_started_receipt_cutoff_time is None
-            or receipt.payload.time_accepted > job_started_receipt_cutoff_time
-        )
-    ]
-    logger.debug(f"Creating {len(job_started_receipt_to_create)} JobStartedReceipt. {hotkey=}")
-    JobStartedReceipt.objects.bulk_create(job_started_receipt_to_create, ignore_conflicts=True)
-
-    latest_job_finished_receipt = (
-        JobFinishedReceipt.objects.filter(miner_hotkey=hotkey).order_by("-time_started").first()
-    )
-    job_finished_receipt_cutoff_time = (
-        latest_job_finished_receipt.time_started - tolerance
-        if latest_job_finished_receipt
-        else None
-    )
-    job_finished_receipt_to_create = [
-        JobFinishedReceipt(
-            job_uuid=receipt.payload.job_uuid,
-            miner_hotkey=receipt.payload.miner_hotkey,
-            validator_hotkey=receipt.payload.validator_hotkey,
-            time_started=receipt.payload.time_started,
-            time_took_us=receipt.payload.time_took_us,
-            score_str=receipt.payload.score_str,
-        )
-        for receipt in receipts
-        if isinstance(receipt.payload, JobFinishedReceiptPayload)
-        and (
-            job_finished_receipt_cutoff_time is None
-            or receipt.payload.time_started > job_finished_receipt_cutoff_time
-        )
-    ]
-    logger.debug(f"Creating {len(job_finished_receipt_to_create)} JobFinishedReceipt. {hotkey=}")
-    JobFinishedReceipt.objects.bulk_create(job_finished_receipt_to_create, ignore_conflicts=True)
+    store_miner_receipts(hotkey, receipts)
 
 
 @app.task
 def fetch_receipts():
     """Fetch job receipts from the miners."""
-    # Delete old receipts before fetching new ones
-    JobStartedReceipt.objects.filter(time_accepted__lt=now() - timedelta(days=7)).delete()
-    JobFinishedReceipt.objects.filter(time_started__lt=now() - timedelta(days=7)).delete()
+    metagraph = get_metagraph_snapshot()
+    miners = [
+        MinerAxon(neuron.hotkey, neuron.axon_info.ip, neuron.axon_info.port)
+        for neuron in metagraph.neurons
+        if neuron.axon_info.is_serving
+    ]
+    # not async_to_sync - with nest_asyncio (applied by bittensor) the loops it runs in new threads
+    # are never closed, and a later call in this thread would try to schedule onto a stale one
+    asyncio.run(collect_receipts(miners))
 
-    metagraph = bittensor.metagraph(
-        netuid=settings.BITTENSOR_NETUID, network=settings.BITTENSOR_NETWORK
-    )
-    miners = [neuron for neuron in metagraph.neurons if neuron.axon_info.is_serving]
-    for miner in miners:
-        fetch_receipts_from_miner.delay(miner.hotkey, miner.axon_info.ip, miner.axon_info.port)
+
+@app.task
+def clear_old_receipts():
+    deleted = delete_old_receipts()
+    logger.info(f"Deleted {deleted} old receipts")
 
 
 @shared_task
 def send_events_to_facilitator():
-    with transaction.atomic(using=settings.DEFAULT_DB_ALIAS):
-        events = (
-            SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS)
-            .filter(sent=False)
-            .select_for_update(skip_locked=True)
-        )[:10_000]
-        if events.count() == 0:
-            return
+    if settings.STATS_COLLECTOR_URL == "":
+        logger.warning("STATS_COLLECTOR_URL is not set, not sending system events")
+        return
 
-        if settings.STATS_COLLECTOR_URL == "":
-            logger.warning("STATS_COLLECTOR_URL is not set, not sending system events")
-            return
+    # not async_to_sync, see fetch_receipts
+    asyncio.run(ship_system_events(get_keypair()))
 
-        keypair = get_keypair()
-        hotkey = keypair.ss58_address
-        signing_timestamp = int(time.time())
-        to_sign = json.dumps(
-            {"signing_timestamp": signing_timestamp, "validator_ss58_address": hotkey},
-            sort_keys=True,
-        )
-        signature = f"0x{keypair.sign(to_sign).hex()}"
-        events = list(events)
-        data = [event.to_dict() for event in events]
-        url = settings.STATS_COLLECTOR_URL + f"validator/{hotkey}/system_events"
-        response = requests.post(
-            url,
-            json=data,
-            headers={
-                "Validator-Signature": signature,
-                "Validator-Signing-Timestamp": str(signing_timestamp),
-            },
-        )
 
-        if response.status_code == 201:
-            logger.info(f"Sent {len(data)} system events to facilitator")
-            SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).filter(
-                id__in=[event.id for event in events]
-            ).update(sent=True)
-        else:
-            logger.error(f"Failed to send system events to facilitator: {response}")
+@app.task
+def clear_old_system_events():
+    deleted = delete_old_system_events()
+    logger.info(f"Deleted {deleted} old system events")
 
 
 @app.task
@@ -59,6 +59,9 @@ class MockedAxonInfo(NamedTuple):
     ip: str
     ip_type: int
     port: int
+    version: int = 4
+    hotkey: str = ""
+    coldkey: str = ""
 
 
 async def mock_get_miner_axon_info(hotkey: str):
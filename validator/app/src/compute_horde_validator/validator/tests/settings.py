@@ -22,7 +22,7 @@ BITTENSOR_WALLET_DIRECTORY = pathlib.Path("~").expanduser() / ".bittensor" / "wa
 BITTENSOR_WALLET_NAME = "test_validator"
 BITTENSOR_WALLET_HOTKEY_NAME = "default"
 
-STATS_COLLECTOR_URL = "http://fakehost:8000"
+STATS_COLLECTOR_URL = "http://fakehost:8000/"
 
 
 def BITTENSOR_WALLET() -> bittensor.wallet:
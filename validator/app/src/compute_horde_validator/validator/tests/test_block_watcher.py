@@ -0,0 +1,129 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from compute_horde_validator.validator.block_watcher import BlockWatcher
+from compute_horde_validator.validator.models import Cycle, SyntheticJobBatch, SystemEvent
+from compute_horde_validator.validator.tasks import (
+    CommitRevealInterval,
+    get_cycle_containing_block,
+)
+
+
+class FakeBlockSource:
+    def __init__(self, blocks: list[int]):
+        self.blocks = blocks
+
+    def subscribe(self, on_block):
+        for block in self.blocks:
+            on_block(block)
+
+
+@pytest.fixture
+def mocked_tasks():
+    with (
+        patch("compute_horde_validator.validator.tasks._run_synthetic_jobs") as run_batch,
+        patch(
+            "compute_horde_validator.validator.block_watcher.schedule_synthetic_jobs"
+        ) as schedule,
+        patch("compute_horde_validator.validator.block_watcher.set_scores") as set_scores,
+        patch("compute_horde_validator.validator.block_watcher.reveal_scores") as reveal_scores,
+    ):
+        yield MagicMock(
+            run_batch=run_batch,
+            schedule=schedule,
+            set_scores=set_scores,
+            reveal_scores=reveal_scores,
+        )
+
+
+def watch(blocks: list[int]) -> BlockWatcher:
+    watcher = BlockWatcher(FakeBlockSource(blocks))
+    watcher.source.subscribe(watcher.on_block)
+    return watcher
+
+
+def create_batch(block: int) -> SyntheticJobBatch:
+    cycle_range = get_cycle_containing_block(block=block, netuid=12)
+    cycle = Cycle.objects.create(start=cycle_range.start, stop=cycle_range.stop)
+    return SyntheticJobBatch.objects.create(block=block, cycle=cycle)
+
+
+@pytest.mark.django_db(databases=["default", "default_alias"])
+def test_block_watcher__starts_batch_at_its_block(mocked_tasks):
+    batch = create_batch(1005)
+
+    watcher = watch([1003, 1004])
+    assert mocked_tasks.run_batch.apply_async.call_count == 0
+
+    watcher.source = FakeBlockSource([1005, 1006])
+    watcher.source.subscribe(watcher.on_block)
+    mocked_tasks.run_batch.apply_async.assert_called_once_with(
+        kwargs={"synthetic_jobs_batch_id": batch.id}
+    )
+    batch.refresh_from_db()
+    assert batch.started_at is not None
+    assert watcher.current_block == 1006
+
+
+@pytest.mark.django_db(databases=["default", "default_alias"])
+def test_block_watcher__starts_overslept_batch(mocked_tasks):
+    batch = create_batch(1005)
+
+    watch([1007])
+
+    mocked_tasks.run_batch.apply_async.assert_called_once_with(
+        kwargs={"synthetic_jobs_batch_id": batch.id}
+    )
+    assert (
+        SystemEvent.objects.using("default_alias")
+        .filter(type=SystemEvent.EventType.VALIDATOR_OVERSLEPT_SCHEDULED_JOB_WARNING)
+        .count()
+        == 1
+    )
+
+
+@pytest.mark.django_db(databases=["default", "default_alias"])
+def test_block_watcher__ignores_seen_blocks(mocked_tasks):
+    create_batch(1000)
+
+    watcher = watch([1006, 1000])
+
+    assert mocked_tasks.run_batch.apply_async.call_count == 0
+    assert watcher.current_block == 1006
+
+
+@pytest.mark.django_db(databases=["default", "default_alias"])
+def test_block_watcher__schedules_synthetic_jobs_until_scheduled(mocked_tasks):
+    cycle = get_cycle_containing_block(block=1000, netuid=12)
+    start = cycle.start + 1
+    # first block seen, and every 5 blocks
+    watch(list(range(start, start + 10)))
+    assert mocked_tasks.schedule.delay.call_count == 1 + len(
+        [block for block in range(start + 1, start + 10) if block % 5 == 0]
+    )
+
+    mocked_tasks.schedule.reset_mock()
+    create_batch(start + 100)
+    watch(list(range(start + 10, start + 20)))
+    assert mocked_tasks.schedule.delay.call_count == 0
+
+
+@pytest.mark.override_config(DYNAMIC_COMMIT_REVEAL_WEIGHTS_ENABLED=True)
+@pytest.mark.django_db(databases=["default", "default_alias"])
+def test_block_watcher__commit_reveal_windows(mocked_tasks):
+    interval = CommitRevealInterval(10_000)
+
+    watch(list(range(interval.start, interval.stop)))
+
+    assert mocked_tasks.set_scores.delay.call_count == len(interval.commit_window[::5])
+    assert mocked_tasks.reveal_scores.delay.call_count == len(interval.reveal_window[::5])
+
+
+@pytest.mark.override_config(DYNAMIC_COMMIT_REVEAL_WEIGHTS_ENABLED=False)
+@pytest.mark.django_db(databases=["default", "default_alias"])
+def test_block_watcher__set_scores_without_commit_reveal(mocked_tasks):
+    watch(list(range(1000, 1020)))
+
+    assert mocked_tasks.set_scores.delay.call_count == 4
+    assert mocked_tasks.reveal_scores.delay.call_count == 0
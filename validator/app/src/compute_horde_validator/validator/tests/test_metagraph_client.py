@@ -0,0 +1,67 @@
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from compute_horde_validator.validator import metagraph_client
+from compute_horde_validator.validator.metagraph_client import (
+    AsyncMetagraphClient,
+    get_metagraph_snapshot,
+    get_miner_axon_info,
+)
+from compute_horde_validator.validator.models import MetagraphSnapshot
+
+from .helpers import MockMetagraph, MockSubtensor
+
+
+@pytest.fixture
+def mocked_metagraph():
+    mocked_metagraph = MagicMock(side_effect=lambda: MockMetagraph())
+    with patch(
+        "bittensor.subtensor",
+        lambda *args, **kwargs: MockSubtensor(mocked_metagraph=mocked_metagraph),
+    ):
+        yield mocked_metagraph
+
+
+@pytest.mark.django_db(databases=["default", "default_alias"])
+def test_get_metagraph_snapshot__reuses_fresh_snapshot(mocked_metagraph):
+    metagraph = get_metagraph_snapshot()
+    assert get_metagraph_snapshot() is metagraph
+    assert mocked_metagraph.call_count == 1
+
+    assert MetagraphSnapshot.objects.count() == 1
+    assert metagraph.block == 1000
+    assert len(metagraph.neurons) == len(MockMetagraph().neurons)
+
+
+@pytest.mark.django_db(databases=["default", "default_alias"])
+def test_get_metagraph_snapshot__syncs_stale_snapshot(mocked_metagraph):
+    metagraph = get_metagraph_snapshot()
+    MetagraphSnapshot.objects.update(updated_at=metagraph.updated_at - timedelta(minutes=1))
+
+    assert get_metagraph_snapshot() is not metagraph
+    assert mocked_metagraph.call_count == 2
+    assert MetagraphSnapshot.objects.count() == 1
+
+
+@pytest.mark.django_db(databases=["default", "default_alias"])
+def test_get_metagraph_snapshot__hotkey_index(mocked_metagraph):
+    metagraph = get_metagraph_snapshot()
+
+    neuron = metagraph.get_neuron("hotkey_3")
+    assert neuron.uid == 3
+    assert neuron.axon_info.ip == "127.0.0.3"
+    assert neuron.axon_info.port == 8003
+    assert neuron.axon_info.is_serving
+    assert metagraph.get_neuron("unknown_hotkey") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+async def test_get_miner_axon_info(mocked_metagraph, monkeypatch):
+    monkeypatch.setattr(metagraph_client, "async_metagraph_client", AsyncMetagraphClient())
+    assert (await get_miner_axon_info("hotkey_4")).port == 8004
+    with pytest.raises(ValueError):
+        await get_miner_axon_info("unknown_hotkey")
+    assert mocked_metagraph.call_count == 1
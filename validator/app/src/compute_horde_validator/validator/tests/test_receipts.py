@@ -1,26 +1,62 @@
+import asyncio
+import csv
+import io
+import re
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import NamedTuple
+from unittest.mock import MagicMock
 
+import bittensor
+import httpx
 import pytest
 from compute_horde.executor_class import DEFAULT_EXECUTOR_CLASS
 from compute_horde.mv_protocol.validator_requests import (
     JobFinishedReceiptPayload,
     JobStartedReceiptPayload,
 )
-from compute_horde.receipts import Receipt
+from compute_horde.receipts import (
+    Receipt,
+    ReceiptType,
+    get_receipts_partition_name,
+    get_receipts_partition_start,
+    verify_receipts,
+)
 from django.utils.timezone import now
 
+from compute_horde_validator.validator import receipts as validator_receipts
 from compute_horde_validator.validator.models import (
     JobFinishedReceipt,
     JobStartedReceipt,
+    MinerReceiptsCursor,
     SystemEvent,
 )
-from compute_horde_validator.validator.tasks import fetch_receipts
+from compute_horde_validator.validator.receipts import MinerAxon, collect_receipts
+from compute_horde_validator.validator.tasks import clear_old_receipts, fetch_receipts
+
+from .helpers import (
+    MockBlock,
+    MockedAxonInfo,
+    MockSubtensor,
+    check_system_events,
+)
 
-from .helpers import MockedAxonInfo, check_system_events, throw_error
+validator_keypair = bittensor.Keypair.create_from_mnemonic(
+    "slot excuse valid grief praise rifle spoil auction weasel glove pen share"
+)
+miner_keypairs = [
+    bittensor.Keypair.create_from_mnemonic(
+        "almost fatigue race slim picnic mass better clog deal solve already champion"
+    ),
+    bittensor.Keypair.create_from_mnemonic(
+        "edit evoke caught tunnel harsh plug august group enact cable govern immense"
+    ),
+]
 
 
 class MockedNeuron(NamedTuple):
+    uid: int
     hotkey: str
     axon_info: MockedAxonInfo
 
@@ -29,69 +65,295 @@ class MockedMetagraph:
     def __init__(self, *args, **kwargs):
         self.neurons = [
             MockedNeuron(
-                hotkey="5G9qWBzLPVVu2fCPPvg3QgPPK5JaJmJKaJha95TPHH9NZWuL",
-                axon_info=MockedAxonInfo(is_serving=True, ip="127.0.0.1", ip_type=4, port=8000),
-            ),
-            MockedNeuron(
-                hotkey="5CPhGRp4cdEG4KSui7VQixHhvN5eBUSnMYeUF5thdxm4sKtz",
-                axon_info=MockedAxonInfo(is_serving=True, ip="127.0.0.2", ip_type=4, port=8000),
-            ),
-        ]
-
-
-def mocked_get_miner_receipts(hotkey: str, ip: str, port: int) -> list[Receipt]:
-    if hotkey == "5G9qWBzLPVVu2fCPPvg3QgPPK5JaJmJKaJha95TPHH9NZWuL":
-        return [
-            Receipt(
-                payload=JobStartedReceiptPayload(
-                    job_uuid=str(uuid.uuid4()),
-                    miner_hotkey="5G9qWBzLPVVu2fCPPvg3QgPPK5JaJmJKaJha95TPHH9NZWuL",
-                    validator_hotkey="v1",
-                    executor_class=DEFAULT_EXECUTOR_CLASS,
-                    time_accepted=now(),
-                    max_timeout=30,
+                uid=uid,
+                hotkey=keypair.ss58_address,
+                axon_info=MockedAxonInfo(
+                    is_serving=True, ip=f"127.0.0.{uid + 1}", ip_type=4, port=8000
                 ),
-                validator_signature="0xv1",
-                miner_signature="0xm1",
             )
+            for uid, keypair in enumerate(miner_keypairs)
         ]
-    elif hotkey == "5CPhGRp4cdEG4KSui7VQixHhvN5eBUSnMYeUF5thdxm4sKtz":
-        return [
-            Receipt(
-                payload=JobFinishedReceiptPayload(
-                    job_uuid=str(uuid.uuid4()),
-                    miner_hotkey="5CPhGRp4cdEG4KSui7VQixHhvN5eBUSnMYeUF5thdxm4sKtz",
-                    validator_hotkey="v1",
-                    time_started=now(),
-                    time_took_us=30_000_000,
-                    score_str="123.45",
-                ),
-                validator_signature="0xv1",
-                miner_signature="0xm1",
+        self.block = MockBlock()
+
+
+def sign(payload, keypair: bittensor.Keypair) -> str:
+    return f"0x{keypair.sign(payload.blob_for_signing()).hex()}"
+
+
+def job_started_receipt(miner_keypair: bittensor.Keypair) -> Receipt:
+    payload = JobStartedReceiptPayload(
+        job_uuid=str(uuid.uuid4()),
+        miner_hotkey=miner_keypair.ss58_address,
+        validator_hotkey=validator_keypair.ss58_address,
+        executor_class=DEFAULT_EXECUTOR_CLASS,
+        time_accepted=now(),
+        max_timeout=30,
+    )
+    return Receipt(
+        payload=payload,
+        validator_signature=sign(payload, validator_keypair),
+        miner_signature=sign(payload, miner_keypair),
+    )
+
+
+def job_finished_receipt(miner_keypair: bittensor.Keypair) -> Receipt:
+    payload = JobFinishedReceiptPayload(
+        job_uuid=str(uuid.uuid4()),
+        miner_hotkey=miner_keypair.ss58_address,
+        validator_hotkey=validator_keypair.ss58_address,
+        time_started=now(),
+        time_took_us=30_000_000,
+        score_str="123.45",
+    )
+    return Receipt(
+        payload=payload,
+        validator_signature=sign(payload, validator_keypair),
+        miner_signature=sign(payload, miner_keypair),
+    )
+
+
+def receipts_csv(receipts: list[Receipt]) -> str:
+    payload_fields = set()
+    for payload_cls in [JobStartedReceiptPayload, JobFinishedReceiptPayload]:
+        payload_fields |= set(payload_cls.model_fields.keys())
+
+    buf = io.StringIO()
+    csv_writer = csv.DictWriter(
+        buf, ["type", "validator_signature", "miner_signature", *sorted(payload_fields)]
+    )
+    csv_writer.writeheader()
+    for receipt in receipts:
+        match receipt.payload:
+            case JobStartedReceiptPayload():
+                receipt_type = ReceiptType.JobStartedReceipt
+            case JobFinishedReceiptPayload():
+                receipt_type = ReceiptType.JobFinishedReceipt
+        csv_writer.writerow(
+            dict(
+                type=receipt_type.value,
+                validator_signature=receipt.validator_signature,
+                miner_signature=receipt.miner_signature,
             )
-        ]
-    else:
-        return []
+            | receipt.payload.model_dump(mode="json")
+        )
+    return buf.getvalue()
 
 
-@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
-def test_fetch_receipts__success(monkeypatch):
-    monkeypatch.setattr("bittensor.metagraph", MockedMetagraph)
+@pytest.fixture
+def mocked_metagraph(monkeypatch):
     monkeypatch.setattr(
-        "compute_horde_validator.validator.tasks.get_miner_receipts", mocked_get_miner_receipts
+        "bittensor.subtensor",
+        lambda *args, **kwargs: MockSubtensor(mocked_metagraph=MockedMetagraph),
     )
+
+
+@pytest.fixture
+def no_partitions(httpx_mock):
+    """Miners which don't publish receipts partitions, only the full receipts CSV."""
+    httpx_mock.add_response(url=re.compile(r".*/receipts/receipts-.*\.csv"), status_code=404)
+
+
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+def test_fetch_receipts__success(mocked_metagraph, no_partitions, httpx_mock):
+    forged_receipt = job_finished_receipt(miner_keypairs[0])
+    forged_receipt.miner_signature = sign(forged_receipt.payload, miner_keypairs[1])
+    httpx_mock.add_response(
+        url="http://127.0.0.1:8000/receipts/receipts.csv",
+        text=receipts_csv([job_started_receipt(miner_keypairs[0]), forged_receipt]),
+    )
+    httpx_mock.add_response(
+        url="http://127.0.0.2:8000/receipts/receipts.csv",
+        text=receipts_csv(
+            [
+                job_finished_receipt(miner_keypairs[1]),
+                # receipts of other miners are ignored
+                job_started_receipt(miner_keypairs[0]),
+            ]
+        ),
+    )
+
     fetch_receipts()
+
     assert JobStartedReceipt.objects.count() == 1
+    assert JobStartedReceipt.objects.get().miner_hotkey == miner_keypairs[0].ss58_address
     assert JobFinishedReceipt.objects.count() == 1
+    assert JobFinishedReceipt.objects.get().miner_hotkey == miner_keypairs[1].ss58_address
+
+    check_system_events(
+        SystemEvent.EventType.VALIDATOR_TELEMETRY, SystemEvent.EventSubType.RECEIPT_FETCH
+    )
+    telemetry = SystemEvent.objects.using("default_alias").get(
+        type=SystemEvent.EventType.VALIDATOR_TELEMETRY
+    )
+    assert telemetry.data["miners_succeeded"] == 2
+    assert telemetry.data["receipts"] == 2
+    assert telemetry.data["per_miner"][miner_keypairs[0].ss58_address]["receipts"] == 1
 
 
 @pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
-def test_fetch_receipts__fail(monkeypatch):
-    monkeypatch.setattr("bittensor.metagraph", MockedMetagraph)
-    monkeypatch.setattr("compute_horde_validator.validator.tasks.get_miner_receipts", throw_error)
+def test_fetch_receipts__fail(mocked_metagraph, no_partitions, httpx_mock):
+    httpx_mock.add_response(url="http://127.0.0.1:8000/receipts/receipts.csv", status_code=500)
+    httpx_mock.add_exception(
+        httpx.ConnectTimeout("timed out"), url="http://127.0.0.2:8000/receipts/receipts.csv"
+    )
+
     fetch_receipts()
+
     assert JobStartedReceipt.objects.count() == 0
     assert JobFinishedReceipt.objects.count() == 0
     check_system_events(
         SystemEvent.EventType.RECEIPT_FAILURE, SystemEvent.EventSubType.RECEIPT_FETCH_ERROR, 2
     )
+
+
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+def test_fetch_receipts__not_modified(mocked_metagraph, no_partitions, httpx_mock):
+    last_modified = "Wed, 21 Oct 2026 07:28:00 GMT"
+
+    def serve_receipts(miner_keypair, etag):
+        csv_text = receipts_csv([job_started_receipt(miner_keypair)])
+
+        def callback(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("If-None-Match") == etag:
+                assert request.headers["If-Modified-Since"] == last_modified
+                return httpx.Response(status_code=304)
+            return httpx.Response(
+                status_code=200,
+                text=csv_text,
+                headers={"ETag": etag, "Last-Modified": last_modified},
+            )
+
+        return callback
+
+    for miner_keypair, ip in zip(miner_keypairs, ["127.0.0.1", "127.0.0.2"]):
+        httpx_mock.add_callback(
+            serve_receipts(miner_keypair, f'"{ip}"'), url=f"http://{ip}:8000/receipts/receipts.csv"
+        )
+
+    fetch_receipts()
+    assert JobStartedReceipt.objects.count() == 2
+    cursor = MinerReceiptsCursor.objects.get(miner_hotkey=miner_keypairs[0].ss58_address)
+    assert cursor.etag == '"127.0.0.1"'
+    assert (
+        cursor.last_receipt_at
+        == JobStartedReceipt.objects.get(miner_hotkey=miner_keypairs[0].ss58_address).time_accepted
+    )
+
+    fetch_receipts()
+    assert JobStartedReceipt.objects.count() == 2
+    telemetry = (
+        SystemEvent.objects.using("default_alias")
+        .filter(type=SystemEvent.EventType.VALIDATOR_TELEMETRY)
+        .latest("timestamp")
+    )
+    assert telemetry.data["per_miner"][miner_keypairs[0].ss58_address]["not_modified"]
+
+
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+def test_collect_receipts__skips_known_receipts(no_partitions, httpx_mock, monkeypatch):
+    known_receipt = job_started_receipt(miner_keypairs[0])
+    new_receipt = job_finished_receipt(miner_keypairs[0])
+    JobStartedReceipt.objects.create(
+        job_uuid=known_receipt.payload.job_uuid,
+        miner_hotkey=known_receipt.payload.miner_hotkey,
+        validator_hotkey=known_receipt.payload.validator_hotkey,
+        time_accepted=known_receipt.payload.time_accepted,
+        max_timeout=known_receipt.payload.max_timeout,
+    )
+    httpx_mock.add_response(
+        url="http://127.0.0.1:8000/receipts/receipts.csv",
+        text=receipts_csv([known_receipt, new_receipt]),
+    )
+    verify = MagicMock(wraps=verify_receipts)
+    monkeypatch.setattr(validator_receipts, "verify_receipts", verify)
+
+    with ThreadPoolExecutor() as executor:
+        asyncio.run(
+            collect_receipts(
+                [MinerAxon(miner_keypairs[0].ss58_address, "127.0.0.1", 8000)], executor=executor
+            )
+        )
+
+    verify.assert_called_once_with([new_receipt])
+    assert JobStartedReceipt.objects.count() == 1
+    assert JobFinishedReceipt.objects.get().job_uuid == uuid.UUID(new_receipt.payload.job_uuid)
+
+
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+def test_fetch_receipts__partitions(mocked_metagraph, httpx_mock):
+    current_partition = get_receipts_partition_start(now())
+    partitions = {
+        get_receipts_partition_name(current_partition - timedelta(hours=2)): (
+            '"2"',
+            receipts_csv([job_started_receipt(miner_keypairs[0])]),
+        ),
+        get_receipts_partition_name(current_partition): (
+            '"1"',
+            receipts_csv([job_finished_receipt(miner_keypairs[0])]),
+        ),
+    }
+
+    def callback(request: httpx.Request) -> httpx.Response:
+        if request.url.host != "127.0.0.1":
+            return httpx.Response(status_code=404)
+        partition = partitions.get(request.url.path.removeprefix("/receipts/"))
+        if partition is None:
+            return httpx.Response(status_code=404)
+        etag, csv_text = partition
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(status_code=304)
+        return httpx.Response(status_code=200, text=csv_text, headers={"ETag": etag})
+
+    httpx_mock.add_callback(callback, url=re.compile(r".*/receipts/receipts-.*\.csv"))
+    httpx_mock.add_response(url="http://127.0.0.2:8000/receipts/receipts.csv", text="")
+
+    fetch_receipts()
+
+    assert JobStartedReceipt.objects.count() == 1
+    assert JobFinishedReceipt.objects.count() == 1
+    cursor = MinerReceiptsCursor.objects.get(miner_hotkey=miner_keypairs[0].ss58_address)
+    assert cursor.last_partition_at == current_partition
+    assert cursor.etag == '"1"'
+
+    # only the last synced partition is requested again, and it didn't change
+    httpx_mock.reset(assert_all_responses_were_requested=False)
+    httpx_mock.add_callback(callback, url=re.compile(r".*/receipts/receipts-.*\.csv"))
+    httpx_mock.add_response(url="http://127.0.0.2:8000/receipts/receipts.csv", status_code=304)
+    fetch_receipts()
+
+    requests = [request for request in httpx_mock.get_requests() if request.url.host == "127.0.0.1"]
+    assert [request.url.path for request in requests] == [
+        f"/receipts/{get_receipts_partition_name(current_partition)}"
+    ]
+    assert requests[0].headers["If-None-Match"] == '"1"'
+    assert JobStartedReceipt.objects.count() == 1
+    assert JobFinishedReceipt.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_clear_old_receipts(monkeypatch):
+    monkeypatch.setattr(validator_receipts, "RECEIPTS_DELETE_CHUNK_SIZE", 2)
+    for age in [timedelta(days=8)] * 5 + [timedelta(days=6)]:
+        started = job_started_receipt(miner_keypairs[0]).payload
+        JobStartedReceipt.objects.create(
+            job_uuid=started.job_uuid,
+            miner_hotkey=started.miner_hotkey,
+            validator_hotkey=started.validator_hotkey,
+            time_accepted=now() - age,
+            max_timeout=started.max_timeout,
+        )
+        finished = job_finished_receipt(miner_keypairs[0]).payload
+        JobFinishedReceipt.objects.create(
+            job_uuid=finished.job_uuid,
+            miner_hotkey=finished.miner_hotkey,
+            validator_hotkey=finished.validator_hotkey,
+            time_started=now() - age,
+            time_took_us=finished.time_took_us,
+            score_str=finished.score_str,
+        )
+
+    clear_old_receipts()
+
+    assert JobStartedReceipt.objects.count() == 1
+    assert JobFinishedReceipt.objects.count() == 1
+    assert JobStartedReceipt.objects.get().time_accepted > now() - timedelta(days=7)
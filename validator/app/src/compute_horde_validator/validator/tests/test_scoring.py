@@ -1,10 +1,16 @@
+import random
 from datetime import timedelta
 
 import pytest
 from django.utils import timezone
 
 from compute_horde_validator.validator.models import Miner, SyntheticJob, SyntheticJobBatch
-from compute_horde_validator.validator.scoring import ExecutorClass, score_batches
+from compute_horde_validator.validator.scoring import (
+    ExecutorClass,
+    score_batches,
+    score_batches_aggregated,
+    score_batches_cached,
+)
 
 EXECUTOR_CLASS_WEIGHTS_OVERRIDE = "spin_up-4min.gpu-24gb=8,always_on.gpu-24gb=2"
 
@@ -160,3 +166,104 @@ def test_score_batches_executor_classes_weights():
     total = scores["hotkey1"] + scores["hotkey2"]
     assert 0.8 - 0.01 < scores["hotkey1"] / total < 0.8 + 0.01
     assert 0.2 - 0.01 < scores["hotkey2"] / total < 0.2 + 0.01
+
+
+def create_random_batches(seed: int, batch_count: int, miner_count: int) -> list[SyntheticJobBatch]:
+    rng = random.Random(seed)
+    miners = [Miner.objects.create(hotkey=f"hotkey{i}") for i in range(miner_count)]
+    executor_classes = list(ExecutorClass)
+    batches = []
+    for _ in range(batch_count):
+        batch = SyntheticJobBatch.objects.create(
+            accepting_results_until=timezone.now() + timedelta(hours=1)
+        )
+        jobs = []
+        for miner in rng.sample(miners, rng.randint(1, miner_count)):
+            for executor_class in rng.sample(executor_classes, rng.randint(1, 3)):
+                for _ in range(rng.randint(1, 20)):
+                    jobs.append(
+                        SyntheticJob(
+                            batch=batch,
+                            miner=miner,
+                            miner_address="127.0.0.1",
+                            miner_address_ip_version=4,
+                            miner_port=8080,
+                            status=SyntheticJob.Status.COMPLETED,
+                            executor_class=executor_class,
+                            # some failed jobs, some whole hordes without a score
+                            score=rng.choice([0, 0, rng.random() * 100, rng.uniform(0.5, 2)]),
+                        )
+                    )
+        SyntheticJob.objects.bulk_create(jobs)
+        batches.append(batch)
+    return batches
+
+
+def assert_same_scores(expected: dict[str, float], actual: dict[str, float]):
+    assert set(actual) == set(expected)
+    for hotkey, score in expected.items():
+        assert actual[hotkey] == pytest.approx(score, rel=1e-12, abs=1e-15), hotkey
+
+
+@pytest.mark.override_config(DYNAMIC_EXECUTOR_CLASS_WEIGHTS=EXECUTOR_CLASS_WEIGHTS_OVERRIDE)
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+def test_score_batches_aggregated__same_as_score_batches(setup_data):
+    batch = setup_data
+
+    scores = score_batches_aggregated([batch])
+    assert_same_scores(score_batches([batch]), scores)
+    assert all(type(score) is float for score in scores.values())
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize(
+    "executor_class_weights",
+    [
+        EXECUTOR_CLASS_WEIGHTS_OVERRIDE,
+        "spin_up-4min.gpu-24gb=50,always_on.gpu-24gb=30,always_on.llm.a6000=20",
+    ],
+)
+@pytest.mark.parametrize(
+    "horde_params",
+    [
+        {},
+        {"HORDE_SCORE_AVG_PARAM": 2},
+        {"HORDE_SCORE_SIZE_PARAM": 1.75, "HORDE_SCORE_CENTRAL_SIZE_PARAM": 20},
+        {"HORDE_SCORE_AVG_PARAM": 0.5, "HORDE_SCORE_SIZE_PARAM": 3},
+    ],
+)
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+def test_score_batches_aggregated__random_batches(
+    seed, executor_class_weights, horde_params, settings, override_config
+):
+    for name, value in horde_params.items():
+        setattr(settings, name, value)
+    batches = create_random_batches(seed, batch_count=3, miner_count=8)
+
+    with override_config(DYNAMIC_EXECUTOR_CLASS_WEIGHTS=executor_class_weights):
+        assert_same_scores(score_batches(batches), score_batches_aggregated(batches))
+        assert_same_scores(score_batches(batches[:1]), score_batches_aggregated(batches[:1]))
+        assert score_batches_aggregated([]) == {}
+
+
+@pytest.mark.override_config(DYNAMIC_EXECUTOR_CLASS_WEIGHTS=EXECUTOR_CLASS_WEIGHTS_OVERRIDE)
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+def test_score_batches_cached(setup_data, override_config):
+    batch = setup_data
+    expected = score_batches([batch])
+
+    assert_same_scores(expected, score_batches_cached([batch]))
+    batch.refresh_from_db()
+    assert_same_scores(expected, batch.scores)
+
+    # the cached scores are used, even though the jobs changed
+    SyntheticJob.objects.filter(miner__hotkey="hotkey4").update(score=100)
+    batch.refresh_from_db()
+    assert_same_scores(expected, score_batches_cached([batch]))
+
+    # until the scoring parameters change
+    with override_config(DYNAMIC_EXECUTOR_CLASS_WEIGHTS="spin_up-4min.gpu-24gb=8"):
+        changed_scores = score_batches_cached([batch])
+        assert_same_scores(score_batches([batch]), changed_scores)
+        assert "hotkey3" in changed_scores
+        assert changed_scores["hotkey4"] > expected["hotkey4"]
@@ -7,10 +7,12 @@ from asgiref.sync import sync_to_async
 from compute_horde.executor_class import DEFAULT_EXECUTOR_CLASS
 from constance import config
 from constance.test.pytest import override_config
+from django.db import connections, transaction
 from django.db.models import Max
 from django.test import override_settings
 from django.utils.timezone import now
 
+from compute_horde_validator.validator.locks import LockType
 from compute_horde_validator.validator.models import (
     Cycle,
     Miner,
@@ -205,6 +207,46 @@ def test_set_scores__set_weight__exception(settings):
     )
 
 
+def set_weights_outside_transaction():
+    assert not transaction.get_connection().in_atomic_block
+    return True, ""
+
+
+@patch(
+    "bittensor.subtensor",
+    lambda *args, **kwargs: MockSubtensor(
+        mocked_set_weights=set_weights_outside_transaction, override_block_number=723
+    ),
+)
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+@patch_constance({"DYNAMIC_COMMIT_REVEAL_WEIGHTS_ENABLED": False})
+def test_set_scores__sets_weights_outside_transaction(settings):
+    setup_db()
+    set_scores()
+    check_system_events(
+        SystemEvent.EventType.WEIGHT_SETTING_SUCCESS,
+        SystemEvent.EventSubType.SET_WEIGHTS_SUCCESS,
+        1,
+    )
+    assert SyntheticJobBatch.objects.get().scored
+
+
+@patch("bittensor.subtensor", lambda *args, **kwargs: MockSubtensor(override_block_number=723))
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+@patch_constance({"DYNAMIC_COMMIT_REVEAL_WEIGHTS_ENABLED": False})
+def test_set_scores__lease_held_elsewhere(settings):
+    setup_db()
+    with connections["default_alias"].cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_lock(%s)", [LockType.WEIGHT_SETTING])
+        try:
+            set_scores()
+        finally:
+            cursor.execute("SELECT pg_advisory_unlock(%s)", [LockType.WEIGHT_SETTING])
+
+    assert SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).count() == 0
+    assert not SyntheticJobBatch.objects.get().scored
+
+
 @patch("compute_horde_validator.validator.tasks.WEIGHT_SETTING_ATTEMPTS", 1)
 @patch("compute_horde_validator.validator.tasks.WEIGHT_SETTING_FAILURE_BACKOFF", 0)
 @patch(
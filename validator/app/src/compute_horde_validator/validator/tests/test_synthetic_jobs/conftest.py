@@ -1,4 +1,5 @@
 import uuid
+from unittest.mock import patch
 
 import bittensor
 import pytest
@@ -22,7 +23,7 @@ from compute_horde_validator.validator.synthetic_jobs.generator.llm_prompts impo
 )
 from compute_horde_validator.validator.tests.transport import MinerSimulationTransport
 
-from .mock_generator import MockSyntheticJobGeneratorFactory
+from .mock_generator import JobGeneratorFactory, MockSyntheticJobGeneratorFactory
 
 
 @pytest.fixture
@@ -92,6 +93,16 @@ def _patch_generator_factory(
     )
 
 
+@pytest.fixture
+def mocked_job_generator_factory():
+    factory = JobGeneratorFactory()
+    with patch(
+        "compute_horde_validator.validator.synthetic_jobs.generator.current.synthetic_job_generator_factory",
+        factory,
+    ):
+        yield factory
+
+
 @pytest.fixture
 def manifest_message():
     return miner_requests.V0ExecutorManifestRequest(
@@ -10,6 +10,9 @@ from compute_horde_validator.validator.synthetic_jobs.generator.base import (
     BaseSyntheticJobGenerator,
     BaseSyntheticJobGeneratorFactory,
 )
+from compute_horde_validator.validator.synthetic_jobs.generator.factory import (
+    DefaultSyntheticJobGeneratorFactory,
+)
 
 MOCK_SCORE = 0.8
 NOT_SCORED = 0.0
@@ -67,3 +70,12 @@ class TimeTookScoreMockSyntheticJobGeneratorFactory(MockSyntheticJobGeneratorFac
     async def create(self, executor_class: ExecutorClass, *args) -> BaseSyntheticJobGenerator:
         _uuid = self._uuids.pop(0)
         return TimeTookScoreMockSyntheticJobGenerator(_uuid)
+
+
+class JobGeneratorFactory(DefaultSyntheticJobGeneratorFactory):
+    """Default factory, but with a fixed job uuid set by the test"""
+
+    async def create(self, executor_class: ExecutorClass, **kwargs) -> BaseSyntheticJobGenerator:
+        generator = await super().create(executor_class, **kwargs)
+        generator._uuid = self._uuid
+        return generator
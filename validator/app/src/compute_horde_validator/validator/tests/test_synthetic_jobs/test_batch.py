@@ -2,6 +2,7 @@ import asyncio
 import json
 import uuid
 from collections.abc import Callable
+from unittest.mock import patch
 
 import bittensor
 import pytest
@@ -15,7 +16,12 @@ from compute_horde_validator.validator.models import (
     SyntheticJob,
     SyntheticJobBatch,
 )
-from compute_horde_validator.validator.synthetic_jobs.batch_run import execute_synthetic_batch_run
+from compute_horde_validator.validator.synthetic_jobs import batch_run
+from compute_horde_validator.validator.synthetic_jobs.batch_run import (
+    BatchContext,
+    Job,
+    execute_synthetic_batch_run,
+)
 from compute_horde_validator.validator.tests.transport import MinerSimulationTransport
 
 from .mock_generator import (
@@ -231,3 +237,74 @@ async def check_scores(
         job = await SyntheticJob.objects.aget(job_uuid=job_uuid)
 
         assert abs(job.score * time_took - expected_multiplier) < 0.0001
+
+
+@patch(
+    "compute_horde_validator.validator.synthetic_jobs.batch_run._JOB_RESPONSE_EXTRA_TIMEOUT", 0.3
+)
+async def test_jobs_scored_as_responses_arrive(
+    job_generator_factory: TimeTookScoreMockSyntheticJobGeneratorFactory,
+    miner: Miner,
+    axon_dict: dict[str, bittensor.AxonInfo],
+    create_simulation_miner_client: Callable,
+    transport: MinerSimulationTransport,
+    override_weights_version_v2,
+    small_spin_up_times,
+):
+    job_uuids = [uuid.uuid4() for _ in range(2)]
+    fast_job_uuid, slow_job_uuid = job_uuids
+    job_generator_factory._uuids = job_uuids.copy()
+
+    manifest_message = miner_requests.V0ExecutorManifestRequest(
+        manifest=miner_requests.ExecutorManifest(
+            executor_classes=[
+                miner_requests.ExecutorClassManifest(executor_class=DEFAULT_EXECUTOR_CLASS, count=2)
+            ]
+        )
+    ).model_dump_json()
+    await transport.add_message(manifest_message, send_before=1)
+    for job_uuid in job_uuids:
+        await transport.add_message(
+            miner_requests.V0AcceptJobRequest(job_uuid=str(job_uuid)).model_dump_json(),
+            send_before=1,
+        )
+    for job_uuid in job_uuids:
+        await transport.add_message(
+            miner_requests.V0ExecutorReadyRequest(job_uuid=str(job_uuid)).model_dump_json(),
+            send_before=0,
+        )
+    # 2 job started receipts + the first job request, the slow job never finishes
+    await transport.add_message(
+        miner_requests.V0JobFinishedRequest(
+            job_uuid=str(fast_job_uuid), docker_process_stdout="", docker_process_stderr=""
+        ).model_dump_json(),
+        send_before=3,
+        sleep_before=0.05,
+    )
+
+    scored_in_score_jobs_stage: dict[str, bool] = {}
+    score_job = batch_run._score_job
+
+    async def _score_job(ctx: BatchContext, job: Job) -> None:
+        scored_in_score_jobs_stage[job.uuid] = "_score_jobs" in ctx.stage_start_time
+        await score_job(ctx, job)
+
+    with patch.object(batch_run, "_score_job", _score_job):
+        await asyncio.wait_for(
+            execute_synthetic_batch_run(
+                axon_dict,
+                [miner],
+                create_miner_client=create_simulation_miner_client,
+            ),
+            timeout=3,
+        )
+
+    assert scored_in_score_jobs_stage == {
+        str(fast_job_uuid): False,
+        str(slow_job_uuid): True,
+    }
+    fast_job = await SyntheticJob.objects.aget(job_uuid=fast_job_uuid)
+    assert fast_job.status == SyntheticJob.Status.COMPLETED
+    assert fast_job.score > 0
+    slow_job = await SyntheticJob.objects.aget(job_uuid=slow_job_uuid)
+    assert slow_job.status == SyntheticJob.Status.FAILED
@@ -0,0 +1,70 @@
+import pickle
+import string
+
+import pytest
+
+from compute_horde_validator.validator.synthetic_jobs.hashcat_jobs import (
+    generate_encoded_hash_jobs,
+)
+from compute_horde_validator.validator.synthetic_jobs.synthetic_job import (
+    HASHJOB_PARAMS,
+    Algorithm,
+    JobParams,
+    random_passwords,
+)
+from compute_horde_validator.validator.synthetic_jobs.v2_synthetic_job import V2SyntheticJob
+from compute_horde_validator.validator.utils import single_file_zip
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        JobParams(timeout=1, num_letters=6, num_digits=0, num_hashes=100),
+        JobParams(timeout=1, num_letters=5, num_digits=1, num_hashes=100),
+        # small space - forces redrawing duplicates
+        JobParams(timeout=1, num_letters=0, num_digits=2, num_hashes=90),
+    ],
+)
+def test_random_passwords(params: JobParams):
+    passwords = random_passwords(params)
+
+    assert len(passwords) == params.num_hashes
+    assert len(set(passwords)) == params.num_hashes
+    assert passwords == sorted(passwords)
+    for password in passwords:
+        assert len(password) == params.password_length
+        assert all(
+            c in string.ascii_letters + string.digits for c in password[: params.num_letters]
+        )
+        assert all(c in string.digits for c in password[params.num_letters :])
+
+
+def test_hash_job_payload_format():
+    algorithms = Algorithm.get_all_algorithms()
+    params = [HASHJOB_PARAMS[4][algorithm] for algorithm in algorithms]
+    job = V2SyntheticJob.generate(algorithms, params, "miner_hotkey")
+
+    for i, algorithm in enumerate(algorithms):
+        assert job.hash_hexes(i) == [
+            algorithm.hash(password.encode("ascii") + job.salts[i]).hexdigest()
+            for password in job.passwords[i]
+        ]
+    data = pickle.loads(job.payload)
+    assert data["n"] == len(algorithms)
+    assert data["masks"] == ["?1" * 6, "?1" * 5 + "?d", "?1" * 5 + "?d"]
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_generate_encoded_hash_jobs(processes: int):
+    miner_hotkeys = ["miner_1", "miner_2", "miner_1"]
+    encoded_jobs = list(generate_encoded_hash_jobs(4, miner_hotkeys, processes=processes))
+
+    assert len(encoded_jobs) == len(miner_hotkeys)
+    for miner_hotkey, encoded_job in zip(miner_hotkeys, encoded_jobs):
+        hash_job = pickle.loads(encoded_job.hash_job)
+        assert hash_job.first_password.startswith(f"{miner_hotkey}-")
+        assert encoded_job.answer == hash_job.answer
+        # payload is encrypted with random salts, so compare the decoded volume size only
+        assert len(encoded_job.volume_contents) == len(
+            single_file_zip("payload.txt", hash_job.payload)
+        )
@@ -0,0 +1,62 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from compute_horde_validator.validator.synthetic_jobs.batch_run import _dispatch_job_requests
+
+pytestmark = pytest.mark.asyncio
+
+
+def make_job(name: str) -> SimpleNamespace:
+    return SimpleNamespace(uuid=name, exception=None, exception_time=None, exception_stage=None)
+
+
+async def test_dispatch_job_requests__sends_at_planned_time():
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    jobs = [make_job(f"job_{i}") for i in range(4)]
+    schedule = {
+        start + 0.1: jobs[2:],
+        start: jobs[:2],
+    }
+    planned = {job.uuid: when for when, _jobs in schedule.items() for job in _jobs}
+    sent: list[tuple[str, float]] = []
+
+    async def send(job):
+        sent.append((job.uuid, loop.time()))
+
+    await _dispatch_job_requests(
+        schedule, deadline=lambda job: start + 1, send=send, stage="test_stage"
+    )
+
+    assert [job_uuid for job_uuid, _ in sent] == [job.uuid for job in jobs]
+    for job_uuid, sent_time in sent:
+        assert 0 <= sent_time - planned[job_uuid] < 0.05
+    assert all(job.exception is None for job in jobs)
+
+
+async def test_dispatch_job_requests__send_past_deadline():
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    stuck_job, next_job = make_job("stuck"), make_job("next")
+    sent: list[str] = []
+
+    async def send(job):
+        if job is stuck_job:
+            await asyncio.Future()
+        sent.append(job.uuid)
+
+    await _dispatch_job_requests(
+        {start: [stuck_job, next_job]},
+        deadline=lambda job: start + 0.05,
+        send=send,
+        stage="test_stage",
+    )
+
+    assert isinstance(stuck_job.exception, TimeoutError)
+    assert stuck_job.exception_stage == "test_stage"
+    # the next job is sent right away, its deadline already passed
+    # but sending it didn't need to wait
+    assert sent == ["next"]
+    assert next_job.exception is None
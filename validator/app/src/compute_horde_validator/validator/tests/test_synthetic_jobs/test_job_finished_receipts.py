@@ -0,0 +1,105 @@
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import bittensor
+import pytest
+from compute_horde.mv_protocol.validator_requests import JobFinishedReceiptPayload
+from compute_horde.receipts import verify_validator_signature
+
+from compute_horde_validator.validator.synthetic_jobs import batch_run
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.django_db]
+
+
+class FakeClient:
+    def __init__(self, stuck: bool = False):
+        self.stuck = stuck
+        self.sent: list[str] = []
+
+    async def send_check(self, data: str) -> None:
+        if self.stuck:
+            await asyncio.Future()
+        self.sent.append(data)
+
+
+def make_job(job_uuid: str, miner_hotkey: str, failures: list[str]) -> SimpleNamespace:
+    return SimpleNamespace(
+        uuid=job_uuid,
+        name=job_uuid,
+        miner_hotkey=miner_hotkey,
+        job_response=object(),
+        system_event=lambda **kwargs: failures.append(job_uuid),
+    )
+
+
+def generate_receipt(ctx, job) -> None:
+    job.job_finished_receipt = SimpleNamespace(model_dump_json=lambda: job.uuid)
+
+
+async def test_send_job_finished_receipts__slow_miner_does_not_block_others(monkeypatch):
+    monkeypatch.setattr(batch_run, "_generate_job_finished_receipt", generate_receipt)
+    monkeypatch.setattr(batch_run, "_SEND_JOB_FINISHED_RECEIPTS_TIMEOUT", 0.1)
+
+    failures: list[str] = []
+    jobs = [
+        make_job("stuck_1", "stuck_miner", failures),
+        make_job("fast_1", "fast_miner", failures),
+        make_job("stuck_2", "stuck_miner", failures),
+        make_job("fast_2", "fast_miner", failures),
+    ]
+    no_response_job = make_job("no_response", "fast_miner", failures)
+    no_response_job.job_response = None
+    clients = {"stuck_miner": FakeClient(stuck=True), "fast_miner": FakeClient()}
+    ctx = SimpleNamespace(
+        jobs={job.uuid: job for job in [*jobs, no_response_job]},
+        clients=clients,
+    )
+
+    await asyncio.wait_for(batch_run._send_job_finished_receipts(ctx), timeout=1)
+
+    assert clients["fast_miner"].sent == ["fast_1", "fast_2"]
+    assert clients["stuck_miner"].sent == []
+    assert sorted(failures) == ["stuck_1", "stuck_2"]
+
+
+async def test_send_job_finished_receipts__batch_signing(monkeypatch):
+    async def aget_config(key):
+        return {"DYNAMIC_RECEIPTS_BATCH_SIGNING": True}[key]
+
+    monkeypatch.setattr(batch_run, "aget_config", aget_config)
+
+    failures: list[str] = []
+    jobs = []
+    for i in range(5):
+        job = make_job(f"job_{i}", f"miner_{i % 2}", failures)
+        job.job_finished_receipt = None
+        job.job_before_sent_time = datetime(2024, 1, 2, tzinfo=UTC)
+        job.time_took = timedelta(seconds=i)
+        job.success = True
+        job.score = float(i)
+        jobs.append(job)
+    keypair = bittensor.Keypair.create_from_mnemonic(
+        "slot excuse valid grief praise rifle spoil auction weasel glove pen share"
+    )
+    clients = {"miner_0": FakeClient(), "miner_1": FakeClient()}
+    ctx = SimpleNamespace(
+        jobs={job.uuid: job for job in jobs},
+        clients=clients,
+        own_keypair=MagicMock(wraps=keypair, ss58_address=keypair.ss58_address),
+    )
+
+    await batch_run._send_job_finished_receipts(ctx)
+
+    assert failures == []
+    # a single signature for all receipts
+    assert ctx.own_keypair.sign.call_count == 1
+    receipts = [json.loads(data) for client in clients.values() for data in client.sent]
+    assert sorted(receipt["payload"]["job_uuid"] for receipt in receipts) == [
+        job.uuid for job in jobs
+    ]
+    for receipt in receipts:
+        payload = JobFinishedReceiptPayload(**receipt["payload"])
+        assert verify_validator_signature(payload, receipt["signature"])
@@ -1,9 +1,11 @@
+import httpx
 import pytest
 from compute_horde.base.output_upload import MultiUpload, SingleFilePutUpload
 from compute_horde.base.volume import MultiVolume, SingleFileVolume
 from compute_horde.mv_protocol.miner_requests import V0JobFinishedRequest
 from pytest_httpx import HTTPXMock
 
+from compute_horde_validator.validator import s3
 from compute_horde_validator.validator.synthetic_jobs.generator.llm_prompts import (
     LlmPromptsSyntheticJobGenerator,
 )
@@ -70,3 +72,36 @@ async def test_llm_prompts_generator_wrong_answers(
     correct, _, score = llm_prompts_job_generator.verify(_JOB_FINISHED_REQUEST, 0)
     assert not correct
     assert score == 0.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+async def test_llm_prompts_generator_download_retried(
+    httpx_mock: HTTPXMock,
+    llm_prompts_job_generator: LlmPromptsSyntheticJobGenerator,
+    monkeypatch,
+):
+    monkeypatch.setattr(s3, "_DOWNLOAD_RETRY_DELAY", 0)
+    httpx_mock.add_response(status_code=503)
+    httpx_mock.add_exception(httpx.ReadTimeout("timed out"))
+    httpx_mock.add_response(json={str(i): str(i) for i in range(240)})
+
+    async with s3.create_download_client() as client:
+        await llm_prompts_job_generator._download_answers(client)
+    correct, _, score = llm_prompts_job_generator.verify(_JOB_FINISHED_REQUEST, 0)
+    assert correct
+    assert score == 1.0
+    assert len(httpx_mock.get_requests()) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+async def test_llm_prompts_generator_download_not_retried_on_client_error(
+    httpx_mock: HTTPXMock,
+    llm_prompts_job_generator: LlmPromptsSyntheticJobGenerator,
+):
+    httpx_mock.add_response(status_code=404)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await llm_prompts_job_generator._download_answers()
+    assert len(httpx_mock.get_requests()) == 1
@@ -2,11 +2,9 @@ import asyncio
 import re
 import uuid
 from collections.abc import Callable
-from unittest.mock import patch
 
 import bittensor
 import pytest
-import pytest_asyncio
 from compute_horde.executor_class import ExecutorClass
 from compute_horde.mv_protocol import miner_requests
 from pytest_httpx import HTTPXMock
@@ -21,30 +19,9 @@ from compute_horde_validator.validator.models import (
 )
 from compute_horde_validator.validator.s3 import get_public_url
 from compute_horde_validator.validator.synthetic_jobs.batch_run import execute_synthetic_batch_run
-from compute_horde_validator.validator.synthetic_jobs.generator.base import (
-    BaseSyntheticJobGenerator,
-)
-from compute_horde_validator.validator.synthetic_jobs.generator.factory import (
-    DefaultSyntheticJobGeneratorFactory,
-)
 from compute_horde_validator.validator.tests.transport import MinerSimulationTransport
 
-
-class JobGeneratorFactory(DefaultSyntheticJobGeneratorFactory):
-    async def create(self, executor_class: ExecutorClass, **kwargs) -> BaseSyntheticJobGenerator:
-        generator = await super().create(executor_class, **kwargs)
-        generator._uuid = self._uuid
-        return generator
-
-
-@pytest_asyncio.fixture
-def mocked_job_generator_factory(prompts):
-    factory = JobGeneratorFactory()
-    with patch(
-        "compute_horde_validator.validator.synthetic_jobs.generator.current.synthetic_job_generator_factory",
-        factory,
-    ):
-        yield factory
+from .mock_generator import JobGeneratorFactory
 
 
 @pytest.mark.asyncio
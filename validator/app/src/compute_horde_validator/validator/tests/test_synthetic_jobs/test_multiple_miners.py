@@ -1,4 +1,5 @@
 import asyncio
+import time
 import uuid
 from collections.abc import Callable
 from unittest.mock import patch
@@ -6,14 +7,27 @@ from unittest.mock import patch
 import bittensor
 import pytest
 import pytest_asyncio
+from asgiref.sync import sync_to_async
 from compute_horde.miner_client.base import AbstractTransport
 from compute_horde.mv_protocol import miner_requests
 
-from compute_horde_validator.validator.models import Miner, SyntheticJob, SystemEvent
+from compute_horde_validator.validator.models import (
+    Miner,
+    SyntheticJob,
+    SyntheticJobBatch,
+    SystemEvent,
+)
+from compute_horde_validator.validator.synthetic_jobs import batch_run
 from compute_horde_validator.validator.synthetic_jobs.batch_run import (
     BatchContext,
     MinerClient,
     execute_synthetic_batch_run,
+    merge_batch_results,
+    persist_batch_result,
+)
+from compute_horde_validator.validator.synthetic_jobs.sharding import (
+    BatchShard,
+    split_into_shards,
 )
 from compute_horde_validator.validator.tests.transport import MinerSimulationTransport
 
@@ -119,8 +133,71 @@ async def test_all_succeed(
         timeout=1,
     )
 
-    for job_uuid, miner in zip(job_uuids, miners):
+    # jobs are generated as soon as each miner's manifest arrives, so
+    # which miner gets which of the mocked job uuids is not deterministic
+    miner_ids = set()
+    for job_uuid in job_uuids:
+        job = await SyntheticJob.objects.aget(job_uuid=job_uuid)
+        await check_synthetic_job(job_uuid, job.miner_id, SyntheticJob.Status.COMPLETED, MOCK_SCORE)
+        miner_ids.add(job.miner_id)
+    assert miner_ids == {miner.pk for miner in miners}
+
+
+@pytest.mark.parametrize("num_miners", [2])
+async def test_sharded_batch(
+    axon_dict: dict[str, bittensor.AxonInfo],
+    transports: list[MinerSimulationTransport],
+    miners: list[Miner],
+    create_simulation_miner_client: Callable,
+    job_uuids: list[uuid.UUID],
+    manifest_message: str,
+):
+    shards = split_into_shards(miners, 2)
+    assert sorted(len(shard_miners) for shard_miners in shards) == [1, 1]
+    start_at = time.monotonic() + 0.05
+
+    results = []
+    # one shard after another, so that the mocked job uuids are handed out in order
+    for index, (shard_miners, job_uuid) in enumerate(zip(shards, job_uuids)):
+        (miner,) = shard_miners
+        transport = transports[miners.index(miner)]
+        await transport.add_message(manifest_message, send_before=1)
+        await transport.add_message(
+            miner_requests.V0AcceptJobRequest(job_uuid=str(job_uuid)).model_dump_json(),
+            send_before=1,
+        )
+        await transport.add_message(
+            miner_requests.V0ExecutorReadyRequest(job_uuid=str(job_uuid)).model_dump_json(),
+            send_before=0,
+        )
+        await transport.add_message(
+            miner_requests.V0JobFinishedRequest(
+                job_uuid=str(job_uuid), docker_process_stdout="", docker_process_stderr=""
+            ).model_dump_json(),
+            send_before=2,
+        )
+
+        result = await asyncio.wait_for(
+            execute_synthetic_batch_run(
+                {miner.hotkey: axon_dict[miner.hotkey]},
+                shard_miners,
+                create_miner_client=create_simulation_miner_client,
+                shard=BatchShard(index=index, count=len(shards), start_at=start_at),
+            ),
+            timeout=1,
+        )
+        assert result is not None
+        results.append(result)
+
+    # shards leave the persistence to the coordinator
+    assert not await SyntheticJob.objects.aexists()
+
+    await sync_to_async(persist_batch_result)(
+        None, axon_dict, {miner.hotkey: miner for miner in miners}, merge_batch_results(results)
+    )
+    for (miner,), job_uuid in zip(shards, job_uuids):
         await check_synthetic_job(job_uuid, miner.pk, SyntheticJob.Status.COMPLETED, MOCK_SCORE)
+    assert await SyntheticJobBatch.objects.acount() == 1
 
 
 @pytest_asyncio.fixture
@@ -342,3 +419,49 @@ async def test_complex(
         ).acount()
         == 1
     )
+
+
+@pytest.mark.parametrize("num_miners", [2])
+async def test_jobs_generated_before_slowest_manifest(
+    axon_dict: dict[str, bittensor.AxonInfo],
+    transports: list[MinerSimulationTransport],
+    miners: list[Miner],
+    create_simulation_miner_client: Callable,
+    job_uuids: list[uuid.UUID],
+    manifest_message: str,
+):
+    fast_transport, slow_transport = transports
+    await fast_transport.add_message(manifest_message, send_before=1)
+    await slow_transport.add_message(manifest_message, send_before=1, sleep_before=0.3)
+    # the mocked job uuids are used in the order in which the jobs are generated
+    for transport, job_uuid in zip(transports, job_uuids):
+        decline_message = miner_requests.V0DeclineJobRequest(
+            job_uuid=str(job_uuid)
+        ).model_dump_json()
+        await transport.add_message(decline_message, send_before=1)
+
+    manifests_at_generation: dict[str, set[str]] = {}
+    generate_miner_jobs = batch_run._generate_miner_jobs
+
+    async def _generate_miner_jobs(ctx: BatchContext, hotkey: str) -> None:
+        manifests_at_generation[hotkey] = {
+            miner_hotkey for miner_hotkey, manifest in ctx.manifests.items() if manifest is not None
+        }
+        await generate_miner_jobs(ctx, hotkey)
+
+    with patch.object(batch_run, "_generate_miner_jobs", _generate_miner_jobs):
+        await asyncio.wait_for(
+            execute_synthetic_batch_run(
+                axon_dict,
+                miners,
+                create_miner_client=create_simulation_miner_client,
+            ),
+            timeout=2,
+        )
+
+    # the fast miner's jobs did not wait for the slow miner's manifest
+    assert manifests_at_generation[fast_transport.name] == {fast_transport.name}
+    assert manifests_at_generation[slow_transport.name] == {
+        fast_transport.name,
+        slow_transport.name,
+    }
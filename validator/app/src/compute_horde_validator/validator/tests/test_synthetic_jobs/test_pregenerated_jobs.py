@@ -0,0 +1,184 @@
+import asyncio
+import uuid
+from collections.abc import Callable
+from types import SimpleNamespace
+
+import bittensor
+import pytest
+from compute_horde.executor_class import DEFAULT_EXECUTOR_CLASS, ExecutorClass
+from compute_horde.mv_protocol import miner_requests
+
+from compute_horde_validator.validator.models import (
+    Miner,
+    PregeneratedHashcatJob,
+    SyntheticJob,
+    SyntheticJobBatch,
+)
+from compute_horde_validator.validator.synthetic_jobs.batch_run import (
+    execute_synthetic_batch_run,
+    get_pregenerated_hashcat_jobs,
+)
+from compute_horde_validator.validator.synthetic_jobs.generator.gpu_hashcat import (
+    pregenerate_hash_job,
+)
+from compute_horde_validator.validator.tasks import pregenerate_synthetic_jobs
+from compute_horde_validator.validator.tests.transport import MinerSimulationTransport
+
+from .mock_generator import JobGeneratorFactory
+
+
+def create_synthetic_jobs(batch: SyntheticJobBatch, miner: Miner, executor_class: str, count: int):
+    SyntheticJob.objects.bulk_create(
+        [
+            SyntheticJob(
+                batch=batch,
+                miner=miner,
+                miner_address="127.0.0.1",
+                miner_address_ip_version=4,
+                miner_port=8000,
+                executor_class=executor_class,
+                status=SyntheticJob.Status.COMPLETED,
+            )
+            for _ in range(count)
+        ]
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_pregenerate_synthetic_jobs__sized_after_previous_batch(settings):
+    settings.DEBUG_OVERRIDE_WEIGHTS_VERSION = 1
+
+    miner_1 = Miner.objects.create(hotkey="miner_1")
+    miner_2 = Miner.objects.create(hotkey="miner_2")
+    batch = SyntheticJobBatch.objects.create()
+    create_synthetic_jobs(batch, miner_1, DEFAULT_EXECUTOR_CLASS, 2)
+    create_synthetic_jobs(batch, miner_1, ExecutorClass.always_on__llm__a6000, 1)
+    create_synthetic_jobs(batch, miner_2, DEFAULT_EXECUTOR_CLASS, 1)
+
+    pregenerate_synthetic_jobs()
+    # 3 hashcat jobs in previous batch + 20% headroom
+    assert PregeneratedHashcatJob.objects.filter(weights_version=1).count() == 4
+    assert not PregeneratedHashcatJob.objects.filter(miner_hotkey__isnull=False).exists()
+
+    # pool is already full
+    pregenerate_synthetic_jobs()
+    assert PregeneratedHashcatJob.objects.count() == 4
+
+    # jobs for the new weights version are bound to miners, old ones are dropped
+    settings.DEBUG_OVERRIDE_WEIGHTS_VERSION = 4
+    pregenerate_synthetic_jobs()
+    assert not PregeneratedHashcatJob.objects.filter(weights_version=1).exists()
+    assert PregeneratedHashcatJob.objects.filter(miner_hotkey="miner_1").count() == 3
+    assert PregeneratedHashcatJob.objects.filter(miner_hotkey="miner_2").count() == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_pregenerate_synthetic_jobs__no_previous_batch(settings):
+    settings.DEBUG_OVERRIDE_WEIGHTS_VERSION = 1
+
+    pregenerate_synthetic_jobs()
+    assert not PregeneratedHashcatJob.objects.exists()
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_get_pregenerated_hashcat_jobs__claims_oldest_first(
+    settings, mocked_job_generator_factory: JobGeneratorFactory
+):
+    settings.DEBUG_OVERRIDE_WEIGHTS_VERSION = 4
+    for hotkey in ["miner_1", "miner_1", "miner_1", "miner_2"]:
+        await pregenerate_hash_job(weights_version=4, miner_hotkey=hotkey).asave()
+    oldest_ids = [
+        pk
+        async for pk in PregeneratedHashcatJob.objects.filter(miner_hotkey="miner_1")
+        .order_by("created_at")
+        .values_list("id", flat=True)[:2]
+    ]
+
+    ctx = SimpleNamespace(
+        executors={
+            "miner_1": {DEFAULT_EXECUTOR_CLASS: 2, ExecutorClass.always_on__llm__a6000: 1},
+            "miner_3": {DEFAULT_EXECUTOR_CLASS: 1},
+        }
+    )
+    pregenerated_jobs = await get_pregenerated_hashcat_jobs(ctx)
+
+    assert sorted(job.id for job in pregenerated_jobs["miner_1"]) == sorted(oldest_ids)
+    assert pregenerated_jobs["miner_3"] == []
+    # unclaimed jobs stay in the pool
+    assert await PregeneratedHashcatJob.objects.filter(miner_hotkey="miner_1").acount() == 1
+    assert await PregeneratedHashcatJob.objects.filter(miner_hotkey="miner_2").acount() == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_get_pregenerated_hashcat_jobs__factory_without_pregenerated_jobs(
+    override_weights_version_v1,
+):
+    # the autouse mock factory does not build hashcat generators
+    await pregenerate_hash_job(weights_version=1, miner_hotkey=None).asave()
+
+    ctx = SimpleNamespace(executors={"miner_1": {DEFAULT_EXECUTOR_CLASS: 1}})
+    assert await get_pregenerated_hashcat_jobs(ctx) == {}
+    assert await PregeneratedHashcatJob.objects.acount() == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+async def test_batch_uses_pregenerated_job(
+    miner: Miner,
+    axon_dict: dict[str, bittensor.AxonInfo],
+    create_simulation_miner_client: Callable,
+    transport: MinerSimulationTransport,
+    override_weights_version_v1,
+    small_spin_up_times,
+    mocked_job_generator_factory: JobGeneratorFactory,
+):
+    pregenerated_job = pregenerate_hash_job(weights_version=1, miner_hotkey=None)
+    await pregenerated_job.asave()
+
+    job_uuid = str(uuid.uuid4())
+    mocked_job_generator_factory._uuid = job_uuid
+
+    manifest_message = miner_requests.V0ExecutorManifestRequest(
+        manifest=miner_requests.ExecutorManifest(
+            executor_classes=[
+                miner_requests.ExecutorClassManifest(executor_class=DEFAULT_EXECUTOR_CLASS, count=1)
+            ]
+        )
+    ).model_dump_json()
+    await transport.add_message(manifest_message, send_before=1)
+
+    await transport.add_message(
+        miner_requests.V0AcceptJobRequest(job_uuid=job_uuid).model_dump_json(),
+        send_before=1,
+        sleep_before=0.05,
+    )
+    await transport.add_message(
+        miner_requests.V0ExecutorReadyRequest(job_uuid=job_uuid).model_dump_json(),
+        send_before=0,
+    )
+    await transport.add_message(
+        miner_requests.V0JobFinishedRequest(
+            job_uuid=job_uuid,
+            docker_process_stdout=pregenerated_job.answer,
+            docker_process_stderr="",
+        ).model_dump_json(),
+        send_before=2,
+        sleep_before=0.05,
+    )
+
+    await asyncio.wait_for(
+        execute_synthetic_batch_run(
+            axon_dict,
+            [miner],
+            create_miner_client=create_simulation_miner_client,
+        ),
+        timeout=2,
+    )
+
+    job = await SyntheticJob.objects.aget(job_uuid=job_uuid)
+    assert job.status == SyntheticJob.Status.COMPLETED
+    assert job.score > 0
+
+    assert not await PregeneratedHashcatJob.objects.aexists()
@@ -6,12 +6,19 @@ from unittest.mock import patch
 import bittensor
 import pytest
 from asgiref.sync import sync_to_async
+from compute_horde.mv_protocol.validator_requests import (
+    BaseValidatorRequest,
+    V0AuthenticateRequest,
+    V0InitialJobRequest,
+    V0JobRequest,
+)
 
 from compute_horde_validator.validator.models import (
     Miner,
     SyntheticJob,
     SystemEvent,
 )
+from compute_horde_validator.validator.synthetic_jobs import batch_run
 from compute_horde_validator.validator.synthetic_jobs.batch_run import execute_synthetic_batch_run
 from compute_horde_validator.validator.tests.transport import MinerSimulationTransport
 
@@ -171,3 +178,90 @@ async def test_execute_miner_synthetic_jobs_no_manifest(
     await sync_to_async(check_system_events)(
         SystemEvent.EventType.MINER_SYNTHETIC_JOB_FAILURE, SystemEvent.EventSubType.MANIFEST_TIMEOUT
     )
+
+
+async def test_execute_miner_synthetic_jobs_sends_pre_encoded_requests(
+    miner: Miner,
+    axon_dict: dict[str, bittensor.AxonInfo],
+    manifest_message: str,
+    executor_ready_message: str,
+    accept_job_message: str,
+    job_finish_message: str,
+    create_simulation_miner_client: Callable,
+    transport: MinerSimulationTransport,
+    job_uuid: uuid.UUID,
+):
+    await transport.add_message(manifest_message, send_before=1)
+    await transport.add_message(accept_job_message, send_before=1)
+    await transport.add_message(executor_ready_message, send_before=0)
+    await transport.add_message(job_finish_message, send_before=2)
+
+    await asyncio.wait_for(
+        execute_synthetic_batch_run(
+            axon_dict,
+            [miner],
+            create_miner_client=create_simulation_miner_client,
+        ),
+        timeout=1,
+    )
+
+    sent_requests = [
+        BaseValidatorRequest.parse(message)
+        for message in transport.sent
+        if str(job_uuid) in message
+    ]
+    assert isinstance(sent_requests[0], V0InitialJobRequest)
+    assert isinstance(sent_requests[2], V0JobRequest)
+    assert sent_requests[0].job_uuid == sent_requests[2].job_uuid == str(job_uuid)
+
+    batch_event = await SystemEvent.objects.aget(
+        type=SystemEvent.EventType.VALIDATOR_TELEMETRY,
+        subtype=SystemEvent.EventSubType.SYNTHETIC_BATCH,
+    )
+    send_skew = batch_event.data["send_skew"]
+    assert send_skew["initial_job_request"]["count"] == 1
+    assert send_skew["job_request"]["count"] == 1
+    assert 0 <= send_skew["job_request"]["max"] < 1
+
+
+async def test_execute_miner_synthetic_jobs_connects_while_preparing(
+    miner: Miner,
+    axon_dict: dict[str, bittensor.AxonInfo],
+    manifest_message: str,
+    executor_ready_message: str,
+    accept_job_message: str,
+    job_finish_message: str,
+    create_simulation_miner_client: Callable,
+    transport: MinerSimulationTransport,
+    job_uuid: uuid.UUID,
+):
+    await transport.add_message(manifest_message, send_before=1)
+    await transport.add_message(accept_job_message, send_before=1)
+    await transport.add_message(executor_ready_message, send_before=0)
+    await transport.add_message(job_finish_message, send_before=2)
+
+    sent_while_preparing: list[str] = []
+
+    async def _db_get_previous_online_executor_count(ctx):
+        # give the background connect a chance to run
+        await asyncio.sleep(0.05)
+        sent_while_preparing.extend(transport.sent)
+
+    with patch.object(
+        batch_run,
+        "_db_get_previous_online_executor_count",
+        _db_get_previous_online_executor_count,
+    ):
+        await asyncio.wait_for(
+            execute_synthetic_batch_run(
+                axon_dict,
+                [miner],
+                create_miner_client=create_simulation_miner_client,
+            ),
+            timeout=1,
+        )
+
+    # authenticated before the manifest stage began
+    assert len(sent_while_preparing) == 1
+    assert isinstance(BaseValidatorRequest.parse(sent_while_preparing[0]), V0AuthenticateRequest)
+    await check_synthetic_job(job_uuid, miner.pk, SyntheticJob.Status.COMPLETED, MOCK_SCORE)
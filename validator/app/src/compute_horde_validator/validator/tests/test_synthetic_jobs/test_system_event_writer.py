@@ -0,0 +1,79 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from compute_horde_validator.validator.models import SystemEvent
+from compute_horde_validator.validator.synthetic_jobs.batch_run import (
+    SystemEventRecord,
+    SystemEventWriter,
+)
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+def make_event(i: int) -> SystemEventRecord:
+    return SystemEventRecord(
+        type=SystemEvent.EventType.VALIDATOR_TELEMETRY,
+        subtype=SystemEvent.EventSubType.CHECKPOINT,
+        long_description=f"event {i}",
+        data={"i": i},
+    )
+
+
+@patch(
+    "compute_horde_validator.validator.synthetic_jobs.batch_run._SYSTEM_EVENTS_WRITE_BATCH_SIZE", 2
+)
+async def test_system_event_writer__writes_in_background():
+    writer = SystemEventWriter()
+    writer.start()
+
+    for i in range(3):
+        writer.append(make_event(i))
+    # a full batch wakes up the writer
+    for _ in range(100):
+        if await SystemEvent.objects.acount() >= 2:
+            break
+        await asyncio.sleep(0.01)
+    assert await SystemEvent.objects.acount() >= 2
+
+    await writer.close()
+    assert sorted([e.data["i"] async for e in SystemEvent.objects.all()]) == [0, 1, 2]
+    assert writer.pending == []
+
+
+@patch("compute_horde_validator.validator.synthetic_jobs.batch_run._SYSTEM_EVENTS_MAX_PENDING", 2)
+async def test_system_event_writer__paused_backpressure():
+    writer = SystemEventWriter()
+    writer.paused = True
+    writer.start()
+
+    writer.append(make_event(0))
+    writer.append(make_event(1))
+    assert await SystemEvent.objects.acount() == 0
+
+    # too many pending events, put() waits for the writer even when paused
+    await asyncio.wait_for(writer.put(make_event(2)), timeout=2)
+    assert await SystemEvent.objects.acount() == 2
+
+    await writer.close()
+    assert await SystemEvent.objects.acount() == 3
+
+
+async def test_system_event_writer__retries_failed_write():
+    writer = SystemEventWriter()
+    writer.append(make_event(0))
+
+    with patch(
+        "compute_horde_validator.validator.synthetic_jobs.batch_run.SystemEvent.objects.bulk_create",
+        side_effect=Exception("db down"),
+    ):
+        await writer.close()
+    assert len(writer.pending) == 1
+
+    await writer.close()
+    assert writer.pending == []
+    assert await SystemEvent.objects.acount() == 1
@@ -0,0 +1,118 @@
+import gzip
+import json
+from datetime import timedelta
+
+import pytest
+from django.conf import settings
+from django.utils.timezone import now
+
+from compute_horde_validator.validator import system_events
+from compute_horde_validator.validator.models import SystemEvent
+from compute_horde_validator.validator.tasks import (
+    clear_old_system_events,
+    send_events_to_facilitator,
+)
+
+pytestmark = pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+
+
+def create_events(count: int, **kwargs) -> list[SystemEvent]:
+    return [
+        SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).create(
+            type=SystemEvent.EventType.VALIDATOR_TELEMETRY,
+            subtype=SystemEvent.EventSubType.SUCCESS,
+            data={"index": i},
+            **kwargs,
+        )
+        for i in range(count)
+    ]
+
+
+def sent_batches(httpx_mock, compressed: bool = False) -> list[list[int]]:
+    batches = []
+    for request in httpx_mock.get_requests():
+        body = gzip.decompress(request.content) if compressed else request.content
+        batches.append([event["data"]["index"] for event in json.loads(body)])
+    return batches
+
+
+def test_send_events_to_facilitator__claims(httpx_mock):
+    unclaimed = create_events(1)
+    claimed = create_events(1, claimed_at=now())
+    stale_claim = create_events(1, claimed_at=now() - timedelta(minutes=10))
+    httpx_mock.add_response(status_code=201)
+
+    send_events_to_facilitator()
+
+    events = SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS)
+    assert set(events.filter(sent=True)) == {*unclaimed, *stale_claim}
+    # claimed by another shipper which is still sending it
+    assert list(events.filter(sent=False)) == claimed
+
+
+def test_send_events_to_facilitator__failure_releases_claims(httpx_mock):
+    create_events(3)
+    httpx_mock.add_response(status_code=503)
+
+    send_events_to_facilitator()
+
+    assert (
+        not SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS)
+        .filter(claimed_at__isnull=False)
+        .exists()
+    )
+    assert not SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).filter(sent=True).exists()
+
+
+def test_send_events_to_facilitator__gzip(settings, httpx_mock):
+    settings.STATS_COLLECTOR_GZIP = True
+    create_events(3)
+    httpx_mock.add_response(status_code=201)
+
+    send_events_to_facilitator()
+
+    request = httpx_mock.get_request()
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert sent_batches(httpx_mock, compressed=True) == [[0, 1, 2]]
+
+
+@pytest.mark.parametrize(
+    "target_upload_time,expected_batches",
+    [
+        # fast uploads, batches grow up to the maximum size
+        (60, [[0, 1], [2, 3, 4, 5], [6, 7, 8, 9], [10]]),
+        # slow uploads, batches shrink down to the minimum size
+        (0, [[0, 1], [2], [3], [4], [5], [6], [7], [8], [9], [10]]),
+    ],
+)
+def test_send_events_to_facilitator__adaptive_batch_size(
+    monkeypatch, httpx_mock, target_upload_time, expected_batches
+):
+    monkeypatch.setattr(system_events, "SYSTEM_EVENTS_INITIAL_BATCH_SIZE", 2)
+    monkeypatch.setattr(system_events, "SYSTEM_EVENTS_MIN_BATCH_SIZE", 1)
+    monkeypatch.setattr(system_events, "SYSTEM_EVENTS_MAX_BATCH_SIZE", 4)
+    monkeypatch.setattr(system_events, "SYSTEM_EVENTS_TARGET_UPLOAD_TIME", target_upload_time)
+    create_events(11)
+    httpx_mock.add_response(status_code=201)
+
+    send_events_to_facilitator()
+
+    assert sent_batches(httpx_mock) == expected_batches
+    assert not SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).filter(sent=False).exists()
+
+
+def test_clear_old_system_events(settings, monkeypatch):
+    settings.SYSTEM_EVENTS_RETENTION_DAYS = 3
+    monkeypatch.setattr(system_events, "SYSTEM_EVENTS_DELETE_CHUNK_SIZE", 2)
+    old_sent = create_events(5, sent=True)
+    old_unsent = create_events(1)
+    recent_sent = create_events(1, sent=True)
+    events = SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS)
+    # timestamp is set on creation
+    events.filter(id__in=[event.id for event in old_sent + old_unsent]).update(
+        timestamp=now() - timedelta(days=4)
+    )
+
+    clear_old_system_events()
+
+    assert set(events.all()) == {*old_unsent, *recent_sent}
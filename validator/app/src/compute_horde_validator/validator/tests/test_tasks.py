@@ -6,7 +6,6 @@ import pytest
 from compute_horde.executor_class import DEFAULT_EXECUTOR_CLASS
 from django.conf import settings
 from django.utils.timezone import now
-from requests import Response
 
 from compute_horde_validator.validator.models import (
     AdminJobRequest,
@@ -110,29 +109,17 @@ def add_system_events():
     )
 
 
-def get_response(status):
-    response = Response()
-    response.status_code = status
-    return response
-
-
-@patch(
-    "compute_horde_validator.validator.tasks.requests.post",
-    lambda url, json, headers: get_response(201),
-)
-@pytest.mark.django_db(databases=["default", "default_alias"])
-def test_send_events_to_facilitator__success():
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+def test_send_events_to_facilitator__success(httpx_mock):
+    httpx_mock.add_response(status_code=201)
     add_system_events()
     send_events_to_facilitator()
     assert SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).filter(sent=True).count() == 3
 
 
-@patch(
-    "compute_horde_validator.validator.tasks.requests.post",
-    lambda url, json, headers: get_response(400),
-)
-@pytest.mark.django_db(databases=["default", "default_alias"])
-def test_send_events_to_facilitator__failure():
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+def test_send_events_to_facilitator__failure(httpx_mock):
+    httpx_mock.add_response(status_code=400)
     add_system_events()
     send_events_to_facilitator()
     assert SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).filter(sent=False).count() == 2
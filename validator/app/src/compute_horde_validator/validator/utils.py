@@ -3,6 +3,8 @@ import io
 import zipfile
 from functools import cache
 
+from django.db.models import QuerySet
+
 MACHINE_SPEC_CHANNEL = "machine_spec_sending"
 
 
@@ -25,3 +27,17 @@ def get_dummy_inline_zip_volume() -> str:
     zip_contents = in_memory_output.read()
     base64_zip_contents = base64.b64encode(zip_contents)
     return base64_zip_contents.decode()
+
+
+def delete_in_chunks(queryset: QuerySet, chunk_size: int) -> int:
+    """
+    Delete the rows of `queryset`, `chunk_size` at a time, each chunk in a statement of its own.
+    Returns the number of deleted rows.
+    """
+    deleted = 0
+    while True:
+        pks = list(queryset.values_list("pk", flat=True)[:chunk_size])
+        if not pks:
+            return deleted
+        count, _ = queryset.model._default_manager.using(queryset.db).filter(pk__in=pks).delete()
+        deleted += count